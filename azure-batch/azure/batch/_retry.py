@@ -0,0 +1,48 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import time
+
+from .models import BatchErrorException
+
+# Error codes returned by the Batch service when a request may succeed if it
+# is simply sent again later.
+RETRYABLE_ERROR_CODES = frozenset([
+    'ServerBusy',
+    'OperationTimedOut',
+    'InternalError',
+])
+
+RETRYABLE_STATUS_CODES = frozenset([500, 503])
+
+
+def get_error_code(error):
+    """Return the Batch error code carried by a BatchError, a TaskAddResult
+    error or a BatchErrorException, or None.
+    """
+    if isinstance(error, BatchErrorException):
+        error = error.error
+    return getattr(error, 'code', None)
+
+
+def is_retryable(error):
+    """Whether a failed Batch request is worth sending again.
+
+    :param error: A BatchError or BatchErrorException.
+    :rtype: bool
+    """
+    if get_error_code(error) in RETRYABLE_ERROR_CODES:
+        return True
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in RETRYABLE_STATUS_CODES
+
+
+def backoff(attempt, interval, max_interval):
+    """Sleep before retry number `attempt` (starting at 0), doubling the
+    interval each time up to `max_interval` seconds.
+    """
+    time.sleep(min(interval * (2 ** attempt), max_interval))
@@ -9,6 +9,7 @@ import time
 import keyring
 import ast
 import base64
+import binascii
 import hmac
 import hashlib
 import datetime
@@ -20,10 +21,10 @@ from msrest import Serializer
 from msrest.serialization import TZ_UTC
 
 try:
-    from urlparse import urlparse, parse_qs
+    from urlparse import urlsplit, parse_qs
 
 except ImportError:
-    from urllib.parse import urlparse, parse_qs
+    from urllib.parse import urlsplit, parse_qs
 
 class SharedKeyAuth(AuthBase):
 
@@ -45,69 +46,64 @@ class SharedKeyAuth(AuthBase):
         self._account_name = account_name
         self._key = key
 
+        # The key never changes, so decode it and set up the HMAC once;
+        # each request only signs a copy of it.
+        try:
+            decoded_key = base64.b64decode(key.encode('utf-8'))
+        except (TypeError, binascii.Error):
+            raise ValueError("Invalid key value: {}".format(key))
+        self._hmac = hmac.HMAC(decoded_key, digestmod=hashlib.sha256)
+        self._resource = "/{}".format(account_name)
+        self._auth_prefix = "SharedKey {}:".format(account_name)
+
     def __call__(self, request):
 
-        if not request.headers.get('ocp-date'):
+        headers = request.headers
+        if not headers.get('ocp-date'):
             now = datetime.datetime.utcnow()
             now = now.replace(tzinfo=TZ_UTC)
-            request.headers['ocp-date'] = Serializer.serialize_rfc(now)
+            headers['ocp-date'] = Serializer.serialize_rfc(now)
 
-        url = urlparse(request.url)
+        url = urlsplit(request.url)
         uri_path = url.path
-        uri_path = uri_path.replace('%5C', '/')
-        uri_path = uri_path.replace('%2F', '/')
-
-        # method to sign
-        string_to_sign = request.method + '\n'
-
-        # get headers to sign
-        request_header_dict = {
-            key.lower(): val for key, val in request.headers.items() if val}
+        if '%' in uri_path:
+            uri_path = uri_path.replace('%5C', '/').replace('%2F', '/')
 
-        request_headers = [
-            str(request_header_dict.get(x, '')) for x in self.headers_to_sign]
-
-        string_to_sign += '\n'.join(request_headers) + '\n'
-
-        # get ocp- header to sign
+        # collect the headers to sign in a single pass over the request
+        # headers, keyed by lowercase name; as before, only the headers
+        # whose name contains a lowercase 'ocp-' are canonicalized
+        header_values = {}
         ocp_headers = []
-        for name, value in request.headers.items():
-            if 'ocp-' in name and value:
-                ocp_headers.append((name.lower(), value))
-
-        for name, value in sorted(ocp_headers):
-            string_to_sign += "{}:{}\n".format(name, value)
-
-        # get account_name and uri path to sign
-        string_to_sign += "/{}{}".format(self._account_name, uri_path)
+        for name, value in headers.items():
+            if value:
+                lower_name = name.lower()
+                header_values[lower_name] = value
+                if 'ocp-' in name:
+                    ocp_headers.append((lower_name, value))
+        ocp_headers.sort()
 
-        # get query string to sign if it is not table service
-        query_to_sign = parse_qs(url.query)
+        parts = [request.method]
+        parts.extend(str(header_values.get(x, '')) for x in self.headers_to_sign)
+        parts.extend("{}:{}".format(name, value) for name, value in ocp_headers)
 
-        for name in sorted(query_to_sign.keys()):
-            value = query_to_sign[name][0]
-            if value:
-                string_to_sign += "\n{}:{}".format(name, value)
+        # account_name and uri path to sign
+        parts.append(self._resource + uri_path)
 
-        # sign the request
-        auth_string = "SharedKey {}:{}".format(
-            self._account_name, self._sign_string(string_to_sign))
+        # query string to sign
+        if url.query:
+            for name, values in sorted(parse_qs(url.query).items()):
+                if values[0]:
+                    parts.append("{}:{}".format(name, values[0]))
 
-        request.headers[self._header] = auth_string
+        headers[self._header] = self._auth_prefix + self._sign_string(
+            '\n'.join(parts))
 
         return request
 
     def _sign_string(self, string_to_sign):
 
-        _key = self._key.encode('utf-8')
-        string_to_sign = string_to_sign.encode('utf-8')
-
-        try:
-            key = base64.b64decode(_key)
-        except TypeError:
-            raise ValueError("Invalid key value: {}".format(self._key))
-
-        signed_hmac_sha256 = hmac.HMAC(key, string_to_sign, hashlib.sha256)
+        signed_hmac_sha256 = self._hmac.copy()
+        signed_hmac_sha256.update(string_to_sign.encode('utf-8'))
         digest = signed_hmac_sha256.digest()
 
         return base64.b64encode(digest).decode('utf-8')
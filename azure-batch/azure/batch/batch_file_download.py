@@ -0,0 +1,248 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from msrest.exceptions import ClientRequestError
+
+from . import models
+from ._retry import backoff, is_retryable
+
+DEFAULT_RANGE_SIZE = 4 * 1024 * 1024
+
+
+def _is_transient(error):
+    if isinstance(error, models.BatchErrorException):
+        return is_retryable(error)
+    # Connection failures, including a connection dropped while the range
+    # is being streamed.
+    return isinstance(error, (ClientRequestError, requests.RequestException, IOError))
+
+
+class FileDownloader(object):
+    """Downloads task and compute node files straight to disk, fetching
+    several byte ranges of the file in parallel.
+
+    The file size and last modified time are read first with a HEAD
+    request. The destination file is preallocated to that size and each
+    range is written at its offset as it streams in. Every range request is
+    made with If-Unmodified-Since, so a file that changes during the
+    download fails the download rather than producing a mixed file. A
+    range that fails with a transient error is retried on its own,
+    resuming from the last byte written.
+
+    :param client: The Batch service client.
+    :type client: :class:`BatchServiceClient
+     <azure.batch.BatchServiceClient>`
+    :param int max_workers: Maximum number of ranges fetched concurrently.
+    :param int range_size: Size in bytes of each range.
+    :param int max_retries: Maximum number of retries per range.
+    :param float retry_interval: Initial delay in seconds between retries,
+     doubled on each attempt.
+    :param float max_retry_interval: Upper bound in seconds of the delay
+     between retries.
+    """
+
+    def __init__(self, client, max_workers=8, range_size=DEFAULT_RANGE_SIZE,
+                 max_retries=5, retry_interval=1, max_retry_interval=30):
+        if range_size < 1:
+            raise ValueError("range_size must be positive")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._client = client
+        self.max_workers = max_workers
+        self.range_size = range_size
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+
+    def download_from_task(self, job_id, task_id, file_path, destination,
+                           progress_callback=None, **operation_config):
+        """Downloads the specified task file to a local path.
+
+        :param job_id: The ID of the job that contains the task.
+        :type job_id: str
+        :param task_id: The ID of the task whose file you want to retrieve.
+        :type task_id: str
+        :param file_path: The path to the task file that you want to get the
+         content of.
+        :type file_path: str
+        :param destination: The local path to write the file to. An
+         existing file is overwritten.
+        :type destination: str
+        :param progress_callback: When specified, will be called with the
+         number of bytes downloaded so far and the total size of the file.
+        :type progress_callback: Callable[int, int]
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :return: The size of the file in bytes.
+        :rtype: int
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+        """
+        properties = self._client.file.get_properties_from_task(
+            job_id, task_id, file_path, raw=True, **operation_config)
+
+        def get_range(ocp_range, last_modified):
+            options = models.FileGetFromTaskOptions(
+                ocp_range=ocp_range, if_unmodified_since=last_modified)
+            return self._client.file.get_from_task(
+                job_id, task_id, file_path, options, **operation_config)
+
+        return self._download(properties, get_range, destination, progress_callback)
+
+    def download_from_compute_node(self, pool_id, node_id, file_path, destination,
+                                   progress_callback=None, **operation_config):
+        """Downloads the specified compute node file to a local path.
+
+        :param pool_id: The ID of the pool that contains the compute node.
+        :type pool_id: str
+        :param node_id: The ID of the compute node that contains the file.
+        :type node_id: str
+        :param file_path: The path to the compute node file that you want
+         to get the content of.
+        :type file_path: str
+        :param destination: The local path to write the file to. An
+         existing file is overwritten.
+        :type destination: str
+        :param progress_callback: When specified, will be called with the
+         number of bytes downloaded so far and the total size of the file.
+        :type progress_callback: Callable[int, int]
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :return: The size of the file in bytes.
+        :rtype: int
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+        """
+        properties = self._client.file.get_properties_from_compute_node(
+            pool_id, node_id, file_path, raw=True, **operation_config)
+
+        def get_range(ocp_range, last_modified):
+            options = models.FileGetFromComputeNodeOptions(
+                ocp_range=ocp_range, if_unmodified_since=last_modified)
+            return self._client.file.get_from_compute_node(
+                pool_id, node_id, file_path, options, **operation_config)
+
+        return self._download(properties, get_range, destination, progress_callback)
+
+    def _download(self, properties, get_range, destination, progress_callback):
+        size = properties.headers['Content-Length'] or 0
+        last_modified = properties.headers['Last-Modified']
+
+        with open(destination, 'wb') as stream:
+            stream.truncate(size)
+        if not size:
+            if progress_callback:
+                progress_callback(0, 0)
+            return 0
+
+        progress = _Progress(size, progress_callback)
+        ranges = [(start, min(start + self.range_size, size) - 1)
+                  for start in range(0, size, self.range_size)]
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ranges))) as executor:
+                futures = [
+                    executor.submit(self.download_range, get_range, last_modified,
+                                    destination, start, end, progress.add)
+                    for start, end in ranges]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        except BaseException:
+            os.remove(destination)
+            raise
+        return size
+
+    def download_range(self, get_range, last_modified, destination, start, end,
+                       progress=None, throttle=None):
+        """Downloads a byte range of a file into an existing local file,
+        with the retries of the downloader.
+
+        :param get_range: Called with the Ocp-Range header value and the
+         last modified time to fetch, returns an iterator of the bytes.
+        :type get_range: Callable[str, datetime]
+        :param datetime last_modified: The last modified time of the file,
+         sent with If-Unmodified-Since.
+        :param str destination: The local file written at the offsets of
+         the range.
+        :param int start: The first byte of the range.
+        :param int end: The last byte of the range, inclusive.
+        :param progress: When specified, will be called with the number of
+         bytes of each chunk written.
+        :type progress: Callable[int]
+        :param throttle: When specified, the throttle whose `consume` is
+         called with the size of each chunk before it is written.
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+        """
+        attempt = 0
+        offset = start
+        with open(destination, 'r+b') as stream:
+            while offset <= end:
+                stream.seek(offset)
+                try:
+                    for chunk in get_range('bytes={}-{}'.format(offset, end), last_modified):
+                        if throttle:
+                            throttle.consume(len(chunk))
+                        stream.write(chunk)
+                        offset += len(chunk)
+                        if progress:
+                            progress(len(chunk))
+                    if offset <= end:
+                        raise IOError("Range ended early at byte {} of {}".format(offset, end))
+                except Exception as error:
+                    if attempt >= self.max_retries or not _is_transient(error):
+                        raise
+                    backoff(attempt, self.retry_interval, self.max_retry_interval)
+                    attempt += 1
+
+
+class _Progress(object):
+    """Thread safe byte counter reporting to an optional callback."""
+
+    def __init__(self, total, callback):
+        self._lock = threading.Lock()
+        self._total = total
+        self._callback = callback
+        self.current = 0
+
+    def add(self, count):
+        with self._lock:
+            self.current += count
+            if self._callback:
+                self._callback(self.current, self._total)
+
+
+class _Throttle(object):
+    """Thread safe token bucket limiting the rate of bytes consumed, shared
+    by all the downloads that count against the same limit."""
+
+    def __init__(self, bytes_per_second):
+        self._lock = threading.Lock()
+        self._rate = float(bytes_per_second)
+        self._allowance = self._rate
+        self._last = time.time()
+
+    def consume(self, count):
+        with self._lock:
+            now = time.time()
+            self._allowance = min(
+                self._rate, self._allowance + (now - self._last) * self._rate)
+            self._last = now
+            self._allowance -= count
+            delay = -self._allowance / self._rate if self._allowance < 0 else 0
+        if delay:
+            time.sleep(delay)
@@ -0,0 +1,277 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import calendar
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import models
+from .batch_file_download import FileDownloader, _Throttle
+
+
+class MirrorResult(object):
+    """The outcome of mirroring a directory tree.
+
+    :ivar downloaded: Names of the files which were downloaded.
+    :vartype downloaded: list of str
+    :ivar skipped: Names of the files whose local copy was up to date.
+    :vartype skipped: list of str
+    :ivar failed: Exceptions raised while downloading, keyed by file name.
+    :vartype failed: dict
+    """
+
+    def __init__(self):
+        self.downloaded = []
+        self.skipped = []
+        self.failed = {}
+
+
+def _to_timestamp(value):
+    return calendar.timegm(value.utctimetuple())
+
+
+def _local_path(destination, name):
+    # File names use '/' on Linux nodes and '\' on Windows nodes. Refuse
+    # anything that would resolve outside of the destination.
+    parts = [part for part in name.replace('\\', '/').split('/') if part and part != '.']
+    if not parts or '..' in parts:
+        raise ValueError("Invalid node file name: {!r}".format(name))
+    return os.path.join(destination, *parts)
+
+
+class FileMirror(object):
+    """Mirrors the files of a compute node or of a task to a local directory.
+
+    The recursive file listing is streamed page by page and each file is
+    handed to a worker pool as soon as it is listed. A file whose local
+    copy has the same size and last modified time as reported by the Batch
+    service is skipped, so running the mirror again only fetches new and
+    changed files. Downloaded files get the last modified time of the node
+    file.
+
+    :param client: The Batch service client.
+    :type client: :class:`BatchServiceClient
+     <azure.batch.BatchServiceClient>`
+    :param int max_workers: Maximum number of files downloaded concurrently.
+    :param int max_bandwidth: When specified, the maximum number of bytes
+     per second downloaded from a single compute node, shared by all the
+     workers and by the mirrors of the node running at once with this
+     FileMirror.
+    :param int max_retries: Maximum number of retries per file.
+    :param float retry_interval: Initial delay in seconds between retries,
+     doubled on each attempt.
+    :param float max_retry_interval: Upper bound in seconds of the delay
+     between retries.
+    """
+
+    def __init__(self, client, max_workers=8, max_bandwidth=None,
+                 max_retries=5, retry_interval=1, max_retry_interval=30):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._client = client
+        self._downloader = FileDownloader(
+            client, max_retries=max_retries, retry_interval=retry_interval,
+            max_retry_interval=max_retry_interval)
+        self.max_workers = max_workers
+        self.max_bandwidth = max_bandwidth
+        self._throttles = {}
+        self._throttles_lock = threading.Lock()
+
+    def mirror_compute_node(self, pool_id, node_id, destination,
+                            file_list_from_compute_node_options=None,
+                            progress_callback=None, **operation_config):
+        """Mirrors the files on the specified compute node.
+
+        :param pool_id: The ID of the pool that contains the compute node.
+        :type pool_id: str
+        :param node_id: The ID of the compute node.
+        :type node_id: str
+        :param destination: The local directory to mirror the files to.
+        :type destination: str
+        :param file_list_from_compute_node_options: Additional parameters
+         for the list operation, for example a filter on the file names.
+        :type file_list_from_compute_node_options:
+         :class:`FileListFromComputeNodeOptions
+         <azure.batch.models.FileListFromComputeNodeOptions>`
+        :param progress_callback: When specified, will be called with the
+         name of each file once it has been downloaded or skipped.
+        :type progress_callback: Callable[str]
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :rtype: :class:`MirrorResult<azure.batch.batch_file_mirror.MirrorResult>`
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+         if the files cannot be listed. Failures to download individual
+         files are reported in the result.
+        """
+        files = self._client.file.list_from_compute_node(
+            pool_id, node_id, recursive=True,
+            file_list_from_compute_node_options=file_list_from_compute_node_options,
+            **operation_config)
+
+        def get_range(name, ocp_range, last_modified):
+            options = models.FileGetFromComputeNodeOptions(
+                ocp_range=ocp_range, if_unmodified_since=last_modified)
+            return self._client.file.get_from_compute_node(
+                pool_id, node_id, name, options, **operation_config)
+
+        return self._mirror(files, get_range, destination, progress_callback,
+                            (pool_id, node_id))
+
+    def mirror_task(self, job_id, task_id, destination, file_list_from_task_options=None,
+                    progress_callback=None, **operation_config):
+        """Mirrors the files in the directory of the specified task.
+
+        :param job_id: The ID of the job that contains the task.
+        :type job_id: str
+        :param task_id: The ID of the task.
+        :type task_id: str
+        :param destination: The local directory to mirror the files to.
+        :type destination: str
+        :param file_list_from_task_options: Additional parameters for the
+         list operation, for example a filter on the file names.
+        :type file_list_from_task_options: :class:`FileListFromTaskOptions
+         <azure.batch.models.FileListFromTaskOptions>`
+        :param progress_callback: When specified, will be called with the
+         name of each file once it has been downloaded or skipped.
+        :type progress_callback: Callable[str]
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :rtype: :class:`MirrorResult<azure.batch.batch_file_mirror.MirrorResult>`
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+         if the files cannot be listed. Failures to download individual
+         files are reported in the result.
+        """
+        files = self._client.file.list_from_task(
+            job_id, task_id, recursive=True,
+            file_list_from_task_options=file_list_from_task_options,
+            **operation_config)
+
+        def get_range(name, ocp_range, last_modified):
+            options = models.FileGetFromTaskOptions(
+                ocp_range=ocp_range, if_unmodified_since=last_modified)
+            return self._client.file.get_from_task(
+                job_id, task_id, name, options, **operation_config)
+
+        node = None
+        if self.max_bandwidth:
+            task = self._client.task.get(
+                job_id, task_id, models.TaskGetOptions(select='nodeInfo'), **operation_config)
+            if task.node_info is not None:
+                node = (task.node_info.pool_id, task.node_info.node_id)
+        return self._mirror(files, get_range, destination, progress_callback,
+                            node or (job_id, task_id))
+
+    def _acquire_throttle(self, key):
+        # One throttle per node and rate, kept while mirrors of the node
+        # are running.
+        with self._throttles_lock:
+            entry = self._throttles.get(key)
+            if entry is None:
+                entry = self._throttles[key] = [_Throttle(key[1]), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def _release_throttle(self, key):
+        with self._throttles_lock:
+            entry = self._throttles[key]
+            entry[1] -= 1
+            if not entry[1]:
+                del self._throttles[key]
+
+    def _mirror(self, files, get_range, destination, progress_callback, node):
+        if not self.max_bandwidth:
+            return self._mirror_files(files, get_range, destination, progress_callback, None)
+        key = (node, self.max_bandwidth)
+        throttle = self._acquire_throttle(key)
+        try:
+            return self._mirror_files(files, get_range, destination, progress_callback, throttle)
+        finally:
+            self._release_throttle(key)
+
+    def _mirror_files(self, files, get_range, destination, progress_callback, throttle):
+        result = MirrorResult()
+        max_pending = self.max_workers * 4
+        pending = {}
+
+        def collect(done):
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    future.result()
+                except Exception as error:
+                    result.failed[name] = error
+                else:
+                    result.downloaded.append(name)
+                    if progress_callback:
+                        progress_callback(name)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for node_file in files:
+                    try:
+                        local_path = _local_path(destination, node_file.name)
+                    except ValueError as error:
+                        result.failed[node_file.name] = error
+                        continue
+                    if node_file.is_directory:
+                        if not os.path.isdir(local_path):
+                            os.makedirs(local_path)
+                        continue
+                    if self._is_up_to_date(node_file, local_path):
+                        result.skipped.append(node_file.name)
+                        if progress_callback:
+                            progress_callback(node_file.name)
+                        continue
+                    if len(pending) >= max_pending:
+                        collect(wait(pending, return_when=FIRST_COMPLETED)[0])
+                    future = executor.submit(
+                        self._download_file, get_range, node_file, local_path, throttle)
+                    pending[future] = node_file.name
+                collect(wait(pending)[0])
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return result
+
+    @staticmethod
+    def _is_up_to_date(node_file, local_path):
+        properties = node_file.properties
+        try:
+            stat = os.stat(local_path)
+        except OSError:
+            return False
+        return stat.st_size == properties.content_length and \
+            int(stat.st_mtime) == _to_timestamp(properties.last_modified)
+
+    def _download_file(self, get_range, node_file, local_path, throttle):
+        size = node_file.properties.content_length or 0
+        last_modified = node_file.properties.last_modified
+        folder = os.path.dirname(local_path)
+        if not os.path.isdir(folder):
+            try:
+                os.makedirs(folder)
+            except OSError:
+                # created meanwhile by another worker
+                if not os.path.isdir(folder):
+                    raise
+
+        with open(local_path, 'wb') as stream:
+            stream.truncate(size)
+        if size:
+            try:
+                self._downloader.download_range(
+                    lambda ocp_range, modified: get_range(node_file.name, ocp_range, modified),
+                    last_modified, local_path, 0, size - 1, throttle=throttle)
+            except BaseException:
+                os.remove(local_path)
+                raise
+        timestamp = _to_timestamp(last_modified)
+        os.utime(local_path, (timestamp, timestamp))
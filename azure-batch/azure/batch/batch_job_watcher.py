@@ -0,0 +1,247 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import datetime
+import threading
+import time
+
+from msrest import Serializer
+from msrest.serialization import TZ_UTC
+
+from . import models
+
+TASK_WATCH_SELECT = 'id,state,stateTransitionTime,executionInfo'
+
+
+def _enum_value(value):
+    return getattr(value, 'value', value)
+
+
+class TaskStateRecord(object):
+    """The part of a task's state tracked by a JobWatcher.
+
+    :ivar str id: The ID of the task.
+    :ivar str state: The state of the task, a :class:`TaskState
+     <azure.batch.models.TaskState>` value.
+    :ivar datetime state_transition_time: The time at which the task entered
+     its current state.
+    :ivar int exit_code: The exit code of the task, once completed.
+    :ivar bool failed: Whether the task completed with a failure.
+    """
+
+    __slots__ = ('id', 'state', 'state_transition_time', 'exit_code', 'failed')
+
+    def __init__(self, id, state, state_transition_time, exit_code=None, failed=False):
+        self.id = id
+        self.state = state
+        self.state_transition_time = state_transition_time
+        self.exit_code = exit_code
+        self.failed = failed
+
+    @property
+    def completed(self):
+        return self.state == models.TaskState.completed.value
+
+    @classmethod
+    def from_task(cls, task):
+        info = task.execution_info
+        exit_code = info.exit_code if info else None
+        failed = False
+        if info is not None:
+            result = _enum_value(info.result)
+            if result is not None:
+                failed = result == models.TaskExecutionResult.failure.value
+            else:
+                failed = info.failure_info is not None or exit_code not in (None, 0)
+        return cls(task.id, _enum_value(task.state), task.state_transition_time,
+                   exit_code, failed)
+
+    def __repr__(self):
+        return '<TaskStateRecord {} {}>'.format(self.id, self.state)
+
+
+class JobWatcher(object):
+    """Watches the tasks of a job until they complete.
+
+    Each poll lists the tasks of the job selecting only their ID, state and
+    execution information. After the first poll only the tasks whose state
+    changed since the start of the previous poll are listed, so a poll of a
+    large job that is making little progress is cheap. Deleted tasks do not
+    show in those listings: every `full_poll_every` polls all the tasks are
+    listed again and the records of the tasks no longer listed are dropped.
+    The watcher keeps one small record per task and calls the
+    `on_completed` and `on_failed` callbacks when a task reaches the
+    completed state.
+
+    :param client: The Batch service client.
+    :type client: :class:`BatchServiceClient
+     <azure.batch.BatchServiceClient>`
+    :param str job_id: The ID of the job to watch.
+    :param float poll_interval: Delay in seconds between two polls made by
+     wait_all and wait_any.
+    :param on_completed: When specified, called with the
+     :class:`TaskStateRecord` of each task which completes successfully.
+    :type on_completed: Callable[TaskStateRecord]
+    :param on_failed: When specified, called with the
+     :class:`TaskStateRecord` of each task which completes with a failure.
+    :type on_failed: Callable[TaskStateRecord]
+    :param float clock_skew: Seconds subtracted from the start time of a
+     poll to filter the next one, covering the difference between the local
+     clock and the clock of the Batch service.
+    :param int full_poll_every: The number of polls between two listings
+     of all the tasks, or None to never list them again after the first
+     poll.
+    """
+
+    def __init__(self, client, job_id, poll_interval=5, on_completed=None,
+                 on_failed=None, clock_skew=60, full_poll_every=12, **operation_config):
+        self._client = client
+        self.job_id = job_id
+        self.poll_interval = poll_interval
+        self.clock_skew = clock_skew
+        self.full_poll_every = full_poll_every
+        self.on_completed = on_completed
+        self.on_failed = on_failed
+        self._operation_config = operation_config
+        self._lock = threading.Lock()
+        self._tasks = {}
+        self._watermark = None
+        self._incremental_polls = 0
+        self._completed = 0
+
+    @property
+    def tasks(self):
+        """The records of all the tasks seen so far, keyed by task ID.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._tasks)
+
+    def counts(self):
+        """The number of tasks seen so far in each state.
+
+        :rtype: dict
+        """
+        counts = {}
+        with self._lock:
+            for record in self._tasks.values():
+                counts[record.state] = counts.get(record.state, 0) + 1
+        return counts
+
+    def poll(self):
+        """Lists the tasks which changed since the previous poll, or all the
+        tasks every `full_poll_every` polls, and updates the state table.
+
+        :return: The records of the tasks which completed during this poll.
+        :rtype: list of :class:`TaskStateRecord`
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+        """
+        options = models.TaskListOptions(select=TASK_WATCH_SELECT)
+        with self._lock:
+            watermark = self._watermark
+            full = watermark is None or (self.full_poll_every is not None and
+                                         self._incremental_polls + 1 >= self.full_poll_every)
+            self._incremental_polls = 0 if full else self._incremental_polls + 1
+        if not full:
+            # Tasks changed since the watermark may already have been listed;
+            # their unchanged records are ignored.
+            options.filter = "stateTransitionTime ge datetime'{}'".format(
+                Serializer.serialize_iso(watermark))
+        # Not the latest transition listed: a task listed early may change
+        # state while the listing runs, earlier than a task listed later.
+        since = self._now() - datetime.timedelta(seconds=self.clock_skew)
+
+        completed = []
+        listed = set()
+        for task in self._client.task.list(self.job_id, options, **self._operation_config):
+            record = TaskStateRecord.from_task(task)
+            listed.add(record.id)
+            with self._lock:
+                previous = self._tasks.get(record.id)
+                self._tasks[record.id] = record
+                if record.completed and not (previous and previous.completed):
+                    self._completed += 1
+                    completed.append(record)
+                elif previous and previous.completed and not record.completed:
+                    # task reactivated
+                    self._completed -= 1
+        with self._lock:
+            if self._watermark is None or since > self._watermark:
+                self._watermark = since
+            if full:
+                for task_id in [i for i in self._tasks if i not in listed]:
+                    # task deleted
+                    if self._tasks.pop(task_id).completed:
+                        self._completed -= 1
+
+        for record in completed:
+            callback = self.on_failed if record.failed else self.on_completed
+            if callback:
+                callback(record)
+        return completed
+
+    @staticmethod
+    def _now():
+        return datetime.datetime.now(TZ_UTC)
+
+    def is_complete(self):
+        """Whether every task seen so far has completed."""
+        return self._is_complete(True)
+
+    def _is_complete(self, empty):
+        with self._lock:
+            if not self._tasks:
+                return empty
+            return self._completed == len(self._tasks)
+
+    def wait_all(self, timeout=None):
+        """Polls until every task of the job has completed.
+
+        Tasks added to the job while waiting are picked up by the next poll,
+        but the wait may end before tasks that have not been added yet.
+
+        :param float timeout: Maximum time to wait in seconds, or None to
+         wait forever.
+        :return: True if all the tasks completed, False on timeout.
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            self.poll()
+            if self.is_complete():
+                return True
+            if not self._sleep(deadline):
+                return False
+
+    def wait_any(self, timeout=None):
+        """Polls until at least one more task has completed.
+
+        :param float timeout: Maximum time to wait in seconds, or None to
+         wait forever.
+        :return: The records of the tasks which completed, empty on timeout
+         or if every task of the job had already completed.
+        :rtype: list of :class:`TaskStateRecord`
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            completed = self.poll()
+            if completed or self._is_complete(False):
+                return completed
+            if not self._sleep(deadline):
+                return []
+
+    def _sleep(self, deadline):
+        if deadline is None:
+            time.sleep(self.poll_interval)
+            return True
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False
+        time.sleep(min(self.poll_interval, remaining))
+        return True
@@ -0,0 +1,287 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from . import models
+from ._retry import backoff, is_retryable
+
+# Node states in which a node is back in service after a reboot or reimage,
+# or will not come back without intervention.
+_SETTLED_STATES = frozenset([
+    models.ComputeNodeState.idle.value,
+    models.ComputeNodeState.running.value,
+    models.ComputeNodeState.offline.value,
+    models.ComputeNodeState.start_task_failed.value,
+    models.ComputeNodeState.unusable.value,
+    models.ComputeNodeState.unknown.value,
+])
+
+_IN_SERVICE_STATES = frozenset([
+    models.ComputeNodeState.idle.value,
+    models.ComputeNodeState.running.value,
+])
+
+
+def _enum_value(value):
+    return getattr(value, 'value', value)
+
+
+def _is_expected(state, before):
+    """Whether a node settling in `state` after a reboot or reimage is
+    back as it was: a node offline or with task scheduling disabled before
+    comes back offline."""
+    if state in _IN_SERVICE_STATES:
+        return True
+    return state == models.ComputeNodeState.offline.value and (
+        _enum_value(before.state) == models.ComputeNodeState.offline.value or
+        _enum_value(before.scheduling_state) == models.SchedulingState.disabled.value)
+
+
+class ComputeNodeOperationResult(object):
+    """The outcome of a bulk operation on one compute node.
+
+    :ivar str node_id: The ID of the compute node.
+    :ivar error: The error which made the operation fail, or None if it
+     succeeded.
+    :vartype error: Exception
+    :ivar str state: For rolling operations, the state the node settled in.
+    """
+
+    def __init__(self, node_id, error=None, state=None):
+        self.node_id = node_id
+        self.error = error
+        self.state = state
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+    def __repr__(self):
+        return '<ComputeNodeOperationResult {} {}>'.format(
+            self.node_id, 'succeeded' if self.succeeded else 'failed')
+
+
+class BulkComputeNodeOperations(object):
+    """Runs compute node operations across many nodes of a pool.
+
+    Nodes are given either as a list of node IDs or as a
+    :class:`ComputeNodeListOptions<azure.batch.models.ComputeNodeListOptions>`
+    whose filter selects them. Requests are sent on a bounded thread pool
+    and retried with an exponential backoff when the server is busy.
+
+    When `max_unavailable` is set, reboot and reimage roll through the
+    pool: a node counts as unavailable from the request until it settles
+    back in the idle or running state (or in a state it will not leave on
+    its own, such as unusable), and no more than `max_unavailable` nodes
+    are unavailable at once. A node settling offline succeeds if it was
+    offline or had task scheduling disabled before the request, as after
+    `disable_scheduling`; unusable, start task failed, unknown and
+    unexpected offline states are reported as failures.
+
+    :param client: The Batch service client.
+    :type client: :class:`BatchServiceClient
+     <azure.batch.BatchServiceClient>`
+    :param int max_workers: Maximum number of concurrent requests.
+    :param int max_unavailable: Maximum number of nodes rebooting or
+     reimaging at once, or None to not wait for nodes to come back.
+    :param float poll_interval: Delay in seconds between two checks of the
+     state of a rebooting or reimaging node.
+    :param float node_timeout: Maximum time in seconds to wait for a node
+     to settle, after which it is reported as failed.
+    :param int max_retries: Maximum number of retries of a request.
+    :param float retry_interval: Initial delay in seconds between retries,
+     doubled on each attempt.
+    :param float max_retry_interval: Upper bound in seconds of the delay
+     between retries.
+    """
+
+    def __init__(self, client, max_workers=8, max_unavailable=None, poll_interval=10,
+                 node_timeout=1800, max_retries=5, retry_interval=1, max_retry_interval=30):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_unavailable is not None and max_unavailable < 1:
+            raise ValueError("max_unavailable must be at least 1")
+        self._client = client
+        self.max_workers = max_workers
+        self.max_unavailable = max_unavailable
+        self.poll_interval = poll_interval
+        self.node_timeout = node_timeout
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+
+    def reboot(self, pool_id, nodes, node_reboot_option=None, **operation_config):
+        """Restarts the specified compute nodes.
+
+        :param str pool_id: The ID of the pool that contains the nodes.
+        :param nodes: The IDs of the nodes, or list options selecting them.
+        :type nodes: list of str or :class:`ComputeNodeListOptions
+         <azure.batch.models.ComputeNodeListOptions>`
+        :param node_reboot_option: When to reboot the nodes and what to do
+         with currently running tasks.
+        :type node_reboot_option: str or :class:`ComputeNodeRebootOption
+         <azure.batch.models.ComputeNodeRebootOption>`
+        :rtype: list of :class:`ComputeNodeOperationResult`
+        """
+        def operation(node_id):
+            self._client.compute_node.reboot(
+                pool_id, node_id, node_reboot_option=node_reboot_option, **operation_config)
+        return self._run(pool_id, nodes, operation, True, operation_config)
+
+    def reimage(self, pool_id, nodes, node_reimage_option=None, **operation_config):
+        """Reinstalls the operating system on the specified compute nodes.
+
+        :param str pool_id: The ID of the pool that contains the nodes.
+        :param nodes: The IDs of the nodes, or list options selecting them.
+        :type nodes: list of str or :class:`ComputeNodeListOptions
+         <azure.batch.models.ComputeNodeListOptions>`
+        :param node_reimage_option: When to reimage the nodes and what to do
+         with currently running tasks.
+        :type node_reimage_option: str or :class:`ComputeNodeReimageOption
+         <azure.batch.models.ComputeNodeReimageOption>`
+        :rtype: list of :class:`ComputeNodeOperationResult`
+        """
+        def operation(node_id):
+            self._client.compute_node.reimage(
+                pool_id, node_id, node_reimage_option=node_reimage_option, **operation_config)
+        return self._run(pool_id, nodes, operation, True, operation_config)
+
+    def disable_scheduling(self, pool_id, nodes, node_disable_scheduling_option=None,
+                           **operation_config):
+        """Disables task scheduling on the specified compute nodes.
+
+        :param str pool_id: The ID of the pool that contains the nodes.
+        :param nodes: The IDs of the nodes, or list options selecting them.
+        :type nodes: list of str or :class:`ComputeNodeListOptions
+         <azure.batch.models.ComputeNodeListOptions>`
+        :param node_disable_scheduling_option: What to do with currently
+         running tasks when disabling task scheduling.
+        :type node_disable_scheduling_option: str or
+         :class:`DisableComputeNodeSchedulingOption
+         <azure.batch.models.DisableComputeNodeSchedulingOption>`
+        :rtype: list of :class:`ComputeNodeOperationResult`
+        """
+        def operation(node_id):
+            self._client.compute_node.disable_scheduling(
+                pool_id, node_id,
+                node_disable_scheduling_option=node_disable_scheduling_option,
+                **operation_config)
+        return self._run(pool_id, nodes, operation, False, operation_config)
+
+    def enable_scheduling(self, pool_id, nodes, **operation_config):
+        """Enables task scheduling on the specified compute nodes.
+
+        :param str pool_id: The ID of the pool that contains the nodes.
+        :param nodes: The IDs of the nodes, or list options selecting them.
+        :type nodes: list of str or :class:`ComputeNodeListOptions
+         <azure.batch.models.ComputeNodeListOptions>`
+        :rtype: list of :class:`ComputeNodeOperationResult`
+        """
+        def operation(node_id):
+            self._client.compute_node.enable_scheduling(pool_id, node_id, **operation_config)
+        return self._run(pool_id, nodes, operation, False, operation_config)
+
+    def add_user(self, pool_id, nodes, user, **operation_config):
+        """Adds a user account to the specified compute nodes.
+
+        :param str pool_id: The ID of the pool that contains the nodes.
+        :param nodes: The IDs of the nodes, or list options selecting them.
+        :type nodes: list of str or :class:`ComputeNodeListOptions
+         <azure.batch.models.ComputeNodeListOptions>`
+        :param user: The user account to be created.
+        :type user: :class:`ComputeNodeUser
+         <azure.batch.models.ComputeNodeUser>`
+        :rtype: list of :class:`ComputeNodeOperationResult`
+        """
+        def operation(node_id):
+            self._client.compute_node.add_user(pool_id, node_id, user, **operation_config)
+        return self._run(pool_id, nodes, operation, False, operation_config)
+
+    def delete_user(self, pool_id, nodes, user_name, **operation_config):
+        """Deletes a user account from the specified compute nodes.
+
+        :param str pool_id: The ID of the pool that contains the nodes.
+        :param nodes: The IDs of the nodes, or list options selecting them.
+        :type nodes: list of str or :class:`ComputeNodeListOptions
+         <azure.batch.models.ComputeNodeListOptions>`
+        :param str user_name: The name of the user account to delete.
+        :rtype: list of :class:`ComputeNodeOperationResult`
+        """
+        def operation(node_id):
+            self._client.compute_node.delete_user(pool_id, node_id, user_name, **operation_config)
+        return self._run(pool_id, nodes, operation, False, operation_config)
+
+    def _node_ids(self, pool_id, nodes, operation_config):
+        if not isinstance(nodes, models.ComputeNodeListOptions):
+            return list(nodes)
+        options = models.ComputeNodeListOptions(
+            filter=nodes.filter, select='id', max_results=nodes.max_results,
+            timeout=nodes.timeout)
+        return [node.id for node in self._client.compute_node.list(
+            pool_id, options, **operation_config)]
+
+    def _run(self, pool_id, nodes, operation, disruptive, operation_config):
+        node_ids = self._node_ids(pool_id, nodes, operation_config)
+        if not node_ids:
+            return []
+        rolling = disruptive and self.max_unavailable is not None
+        workers = min(self.max_unavailable, self.max_workers) if rolling else self.max_workers
+
+        def run_one(node_id):
+            try:
+                before = self._get_node(pool_id, node_id, operation_config) if rolling else None
+                self._call(operation, node_id)
+                state = self._wait_settled(
+                    pool_id, node_id, before.state_transition_time, operation_config) \
+                    if rolling else None
+            except Exception as error:
+                return ComputeNodeOperationResult(node_id, error)
+            if state is not None and not _is_expected(state, before):
+                return ComputeNodeOperationResult(
+                    node_id, RuntimeError("Node settled in state {}".format(state)), state)
+            return ComputeNodeOperationResult(node_id, state=state)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(node_ids))) as executor:
+            futures = [executor.submit(run_one, node_id) for node_id in node_ids]
+            return [future.result() for future in as_completed(futures)]
+
+    def _call(self, operation, node_id):
+        attempt = 0
+        while True:
+            try:
+                return operation(node_id)
+            except models.BatchErrorException as error:
+                if attempt >= self.max_retries or not is_retryable(error):
+                    raise
+                backoff(attempt, self.retry_interval, self.max_retry_interval)
+                attempt += 1
+
+    def _get_node(self, pool_id, node_id, operation_config):
+        options = models.ComputeNodeGetOptions(
+            select='id,state,schedulingState,stateTransitionTime')
+        return self._call(
+            lambda node_id: self._client.compute_node.get(
+                pool_id, node_id, options, **operation_config),
+            node_id)
+
+    def _wait_settled(self, pool_id, node_id, since, operation_config):
+        # Until the node has made a state transition after `since`, its
+        # state is the one it had before the request.
+        deadline = time.time() + self.node_timeout
+        while True:
+            time.sleep(self.poll_interval)
+            node = self._get_node(pool_id, node_id, operation_config)
+            state = _enum_value(node.state)
+            transitioned = since is None or node.state_transition_time is None or \
+                node.state_transition_time > since
+            if transitioned and state in _SETTLED_STATES:
+                return state
+            if time.time() > deadline:
+                raise RuntimeError("Timed out waiting for node {} in state {}".format(
+                    node_id, state))
@@ -0,0 +1,281 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import copy
+import datetime
+import re
+import threading
+from enum import Enum
+
+import isodate
+from msrest import Deserializer
+
+from . import models
+
+_BASIC_TYPES = frozenset(['str', 'int', 'bool', 'float', 'object'])
+
+# The form in which the Batch service returns date-times.
+_UTC_DATETIME = re.compile(r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6})\d*)?Z$')
+
+_record_classes = {}
+_record_classes_lock = threading.Lock()
+
+
+class ProjectedRecord(object):
+    """Base class of the compact records returned by
+    :class:`ProjectedListOperations`.
+
+    Each record class holds only the properties which were selected, as
+    slots named after the attributes of the corresponding model. The
+    selected attribute names, in order, are available as `_fields`.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self._fields, values):
+            setattr(self, name, value)
+
+    def as_dict(self):
+        """Return the selected properties as a dict keyed by attribute name.
+
+        :rtype: dict
+        """
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(
+            '{}={!r}'.format(name, getattr(self, name)) for name in self._fields))
+
+
+def _deserialize_iso(data):
+    match = _UTC_DATETIME.match(data)
+    if match is None:
+        return Deserializer.deserialize_iso(data)
+    year, month, day, hour, minute, second, fraction = match.groups()
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second),
+        int(fraction.ljust(6, '0')) if fraction else 0, isodate.UTC)
+
+
+def _record_class(model, fields):
+    key = (model.__name__, fields)
+    try:
+        return _record_classes[key]
+    except KeyError:
+        pass
+    with _record_classes_lock:
+        if key not in _record_classes:
+            _record_classes[key] = type(
+                model.__name__ + 'Record', (ProjectedRecord,),
+                {'__slots__': fields, '_fields': fields})
+        return _record_classes[key]
+
+
+class _Projection(object):
+    """The selected properties of a model, with one converter per property
+    from its JSON value."""
+
+    def __init__(self, model, select, deserializer):
+        if not isinstance(select, (list, tuple)):
+            select = select.split(',')
+        select = [key.strip() for key in select if key.strip()]
+        if not select:
+            raise ValueError("At least one property must be selected")
+        by_key = {desc['key']: (attr, desc['type']) for attr, desc in model._attribute_map.items()}
+        unknown = [key for key in select if key not in by_key]
+        if unknown:
+            raise ValueError("Unknown {} properties: {}".format(
+                model.__name__, ', '.join(unknown)))
+
+        self.select = ','.join(select)
+        self.keys = tuple(select)
+        self.fields = tuple(by_key[key][0] for key in select)
+        self.converters = tuple(
+            self._converter(by_key[key][1], deserializer) for key in select)
+
+    @staticmethod
+    def _converter(data_type, deserializer):
+        if data_type in _BASIC_TYPES:
+            return None
+        if data_type == 'iso-8601':
+            return _deserialize_iso
+        enum_type = deserializer.dependencies.get(data_type)
+        if isinstance(enum_type, type) and issubclass(enum_type, Enum):
+            values = {member.value: member for member in enum_type}
+
+            def convert_enum(data):
+                try:
+                    return values[data]
+                except (KeyError, TypeError):
+                    return deserializer.deserialize_enum(data, enum_type)
+            return convert_enum
+        # Complex properties and collections go through the Deserializer,
+        # which only walks the selected property.
+        return lambda data: deserializer.deserialize_data(data, data_type)
+
+    def rows(self, items):
+        keys = self.keys
+        converters = self.converters
+        for item in items:
+            row = [item.get(key) for key in keys]
+            for index, convert in enumerate(converters):
+                if convert is not None and row[index] is not None:
+                    row[index] = convert(row[index])
+            yield row
+
+
+class ProjectedListOperations(object):
+    """Lists pools, jobs, tasks and compute nodes as compact records holding
+    only the selected properties.
+
+    The list request is the one made by the corresponding list operation of
+    the client, with `$select` set to the requested properties. Each page of
+    the response is read as JSON and the selected properties are copied into
+    a `__slots__` record, or a plain tuple, without building the full model
+    objects. Simple and date-time properties are converted directly; complex
+    properties go through the msrest Deserializer. Records are yielded page
+    by page, so the memory used does not grow with the size of the list.
+
+    Properties are selected by their REST names, such as `stateTransitionTime`;
+    the record attributes are named like the model attributes, such as
+    `state_transition_time`. Properties the service did not return are None.
+
+    :param client: The Batch service client.
+    :type client: :class:`BatchServiceClient
+     <azure.batch.BatchServiceClient>`
+    :param bool as_tuples: Return plain tuples in the order of the selected
+     properties instead of records.
+    """
+
+    def __init__(self, client, as_tuples=False):
+        self._client = client
+        self.as_tuples = as_tuples
+
+    def list_pools(self, select, pool_list_options=None, **operation_config):
+        """Lists the selected properties of the pools in the account.
+
+        :param select: The properties to return, as a list or an OData
+         $select clause.
+        :type select: str or list of str
+        :param pool_list_options: Additional parameters for the operation.
+         Its select clause is ignored.
+        :type pool_list_options: :class:`PoolListOptions
+         <azure.batch.models.PoolListOptions>`
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :return: An iterator of records or tuples.
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+        """
+        projection, options = self._prepare(
+            models.CloudPool, select, pool_list_options, models.PoolListOptions)
+        return self._list(
+            self._client.pool.list(options, **operation_config), models.CloudPool, projection)
+
+    def list_jobs(self, select, job_list_options=None, **operation_config):
+        """Lists the selected properties of the jobs in the account.
+
+        :param select: The properties to return, as a list or an OData
+         $select clause.
+        :type select: str or list of str
+        :param job_list_options: Additional parameters for the operation.
+         Its select clause is ignored.
+        :type job_list_options: :class:`JobListOptions
+         <azure.batch.models.JobListOptions>`
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :return: An iterator of records or tuples.
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+        """
+        projection, options = self._prepare(
+            models.CloudJob, select, job_list_options, models.JobListOptions)
+        return self._list(
+            self._client.job.list(options, **operation_config), models.CloudJob, projection)
+
+    def list_tasks(self, job_id, select, task_list_options=None, **operation_config):
+        """Lists the selected properties of the tasks of a job.
+
+        :param job_id: The ID of the job.
+        :type job_id: str
+        :param select: The properties to return, as a list or an OData
+         $select clause.
+        :type select: str or list of str
+        :param task_list_options: Additional parameters for the operation.
+         Its select clause is ignored.
+        :type task_list_options: :class:`TaskListOptions
+         <azure.batch.models.TaskListOptions>`
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :return: An iterator of records or tuples.
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+        """
+        projection, options = self._prepare(
+            models.CloudTask, select, task_list_options, models.TaskListOptions)
+        return self._list(
+            self._client.task.list(job_id, options, **operation_config),
+            models.CloudTask, projection)
+
+    def list_compute_nodes(self, pool_id, select, compute_node_list_options=None,
+                           **operation_config):
+        """Lists the selected properties of the compute nodes of a pool.
+
+        :param pool_id: The ID of the pool.
+        :type pool_id: str
+        :param select: The properties to return, as a list or an OData
+         $select clause.
+        :type select: str or list of str
+        :param compute_node_list_options: Additional parameters for the
+         operation. Its select clause is ignored.
+        :type compute_node_list_options: :class:`ComputeNodeListOptions
+         <azure.batch.models.ComputeNodeListOptions>`
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :return: An iterator of records or tuples.
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+        """
+        projection, options = self._prepare(
+            models.ComputeNode, select, compute_node_list_options, models.ComputeNodeListOptions)
+        return self._list(
+            self._client.compute_node.list(pool_id, options, **operation_config),
+            models.ComputeNode, projection)
+
+    def _prepare(self, model, select, options, options_type):
+        projection = _Projection(model, select, self._client._deserialize)
+        options = copy.copy(options) if options is not None else options_type()
+        options.select = projection.select
+        return projection, options
+
+    def _list(self, paged, model, projection):
+        # The paged object is only used for its request function: pages are
+        # read here instead of being deserialized into models.
+        get_next = paged._get_next
+        if self.as_tuples:
+            make = tuple
+        else:
+            record_class = _record_class(model, projection.fields)
+            make = lambda row: record_class(*row)
+
+        next_link = ''
+        while next_link is not None:
+            body = get_next(next_link).json()
+            next_link = body.get('odata.nextLink')
+            for row in projection.rows(body.get('value') or ()):
+                yield make(row)
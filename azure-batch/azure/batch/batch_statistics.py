@@ -0,0 +1,286 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import isodate
+
+from . import models
+from .batch_job_watcher import JobWatcher
+from .batch_projection import ProjectedListOperations
+
+# The service rejects usage metrics requests starting later than this
+# before the current time.
+_USAGE_METRICS_DELAY = datetime.timedelta(hours=2, minutes=30)
+
+_PREPARATION_AND_RELEASE_SELECT = 'nodeId,jobPreparationTaskExecutionInfo,jobReleaseTaskExecutionInfo'
+
+
+def _enum_value(value):
+    return getattr(value, 'value', value)
+
+
+def _count(counts, key):
+    counts[key] = counts.get(key, 0) + 1
+
+
+class PoolSummary(object):
+    """Counters of a pool.
+
+    :ivar str pool_id: The ID of the pool.
+    :ivar dict node_states: The number of compute nodes in each
+     :class:`ComputeNodeState<azure.batch.models.ComputeNodeState>` value.
+    :ivar float core_hours: The core hours used by the pool over the usage
+     intervals seen so far.
+    :ivar float data_ingress_gib: The data ingress in GiB over the same
+     intervals.
+    :ivar float data_egress_gib: The data egress in GiB over the same
+     intervals.
+    """
+
+    __slots__ = ('pool_id', 'node_states', 'core_hours', 'data_ingress_gib', 'data_egress_gib')
+
+    def __init__(self, pool_id, node_states=None, core_hours=0.0, data_ingress_gib=0.0,
+                 data_egress_gib=0.0):
+        self.pool_id = pool_id
+        self.node_states = node_states or {}
+        self.core_hours = core_hours
+        self.data_ingress_gib = data_ingress_gib
+        self.data_egress_gib = data_egress_gib
+
+    def __repr__(self):
+        return '<PoolSummary {} {} nodes>'.format(self.pool_id, sum(self.node_states.values()))
+
+
+class JobSummary(object):
+    """Counters of a job.
+
+    :ivar str job_id: The ID of the job.
+    :ivar dict task_states: The number of tasks in each
+     :class:`TaskState<azure.batch.models.TaskState>` value.
+    :ivar dict preparation_task_states: The number of compute nodes in each
+     :class:`JobPreparationTaskState
+     <azure.batch.models.JobPreparationTaskState>` value.
+    :ivar dict release_task_states: The number of compute nodes in each
+     :class:`JobReleaseTaskState<azure.batch.models.JobReleaseTaskState>`
+     value.
+    """
+
+    __slots__ = ('job_id', 'task_states', 'preparation_task_states', 'release_task_states')
+
+    def __init__(self, job_id, task_states=None, preparation_task_states=None,
+                 release_task_states=None):
+        self.job_id = job_id
+        self.task_states = task_states or {}
+        self.preparation_task_states = preparation_task_states or {}
+        self.release_task_states = release_task_states or {}
+
+    def __repr__(self):
+        return '<JobSummary {} {} tasks>'.format(self.job_id, sum(self.task_states.values()))
+
+
+class StatisticsSnapshot(object):
+    """The counters produced by a refresh of a :class:`StatisticsAggregator`.
+
+    :ivar pools: The summary of each pool, keyed by pool ID.
+    :vartype pools: dict
+    :ivar jobs: The summary of each job, keyed by job ID.
+    :vartype jobs: dict
+    :ivar float lifetime_core_hours: The dedicated core hours used by all
+     the pools of the account since its creation, or None if they could not
+     be retrieved.
+    :ivar errors: The exceptions raised by the requests which failed during
+     the refresh, keyed by a description of the request. The counters
+     depending on them keep their previous values.
+    :vartype errors: dict
+    :ivar datetime time: The time of the refresh.
+    """
+
+    def __init__(self, pools, jobs, lifetime_core_hours, errors, time):
+        self.pools = pools
+        self.jobs = jobs
+        self.lifetime_core_hours = lifetime_core_hours
+        self.errors = errors
+        self.time = time
+
+
+class _PoolUsage(object):
+    """Usage totals of a pool, keeping the latest aggregation interval apart
+    since the service may still update it."""
+
+    __slots__ = ('settled', 'latest_start', 'latest')
+
+    def __init__(self):
+        self.settled = (0.0, 0.0, 0.0)
+        self.latest_start = None
+        self.latest = (0.0, 0.0, 0.0)
+
+    def add(self, metrics):
+        values = (metrics.total_core_hours or 0.0, metrics.data_ingress_gi_b or 0.0,
+                  metrics.data_egress_gi_b or 0.0)
+        if self.latest_start is None or metrics.start_time > self.latest_start:
+            self.settled = tuple(a + b for a, b in zip(self.settled, self.latest))
+            self.latest_start = metrics.start_time
+            self.latest = values
+        elif metrics.start_time == self.latest_start:
+            self.latest = values
+        # Earlier intervals have already been counted.
+
+    @property
+    def totals(self):
+        return tuple(a + b for a, b in zip(self.settled, self.latest))
+
+
+class StatisticsAggregator(object):
+    """Aggregates the state of a set of pools and jobs into compact counters.
+
+    Each refresh runs the following requests concurrently on a thread pool:
+
+    - the compute nodes of each pool, listed with only their ID and state;
+    - the usage metrics of the pools, from the start of the latest usage
+      interval already seen;
+    - the lifetime statistics of the pools of the account;
+    - for each job, the tasks whose state changed since the previous
+      refresh, through a :class:`JobWatcher
+      <azure.batch.batch_job_watcher.JobWatcher>`;
+    - for each job, the state of its preparation and release tasks.
+
+    Only the tasks and the usage metrics are fetched incrementally. The
+    service cannot filter compute nodes nor preparation and release task
+    statuses on their transition time, so each refresh lists all of them
+    again, selecting only the fields counted. Their cost grows with the
+    size of the pools rather than with the changes.
+
+    Only the counters are kept between refreshes, along with one small
+    record per task of each job.
+
+    :param client: The Batch service client.
+    :type client: :class:`BatchServiceClient
+     <azure.batch.BatchServiceClient>`
+    :param pool_ids: The IDs of the pools to aggregate.
+    :type pool_ids: list of str
+    :param job_ids: The IDs of the jobs to aggregate.
+    :type job_ids: list of str
+    :param datetime usage_start_time: The earliest time from which to
+     include usage metrics on the first refresh. By default only the latest
+     usage interval available is included.
+    :param int max_workers: Maximum number of concurrent requests.
+    :param operation_config: :ref:`Operation configuration
+     overrides<msrest:optionsforoperations>`.
+    """
+
+    def __init__(self, client, pool_ids=(), job_ids=(), usage_start_time=None,
+                 max_workers=8, **operation_config):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._client = client
+        self._projected = ProjectedListOperations(client, as_tuples=True)
+        self.pool_ids = list(pool_ids)
+        self.job_ids = list(job_ids)
+        self.max_workers = max_workers
+        self._operation_config = operation_config
+        self._lock = threading.Lock()
+        self._usage_start_time = usage_start_time
+        self._usage = {pool_id: _PoolUsage() for pool_id in self.pool_ids}
+        self._node_states = {pool_id: {} for pool_id in self.pool_ids}
+        self._watchers = {
+            job_id: JobWatcher(client, job_id, **operation_config) for job_id in self.job_ids}
+        self._preparation_states = {job_id: ({}, {}) for job_id in self.job_ids}
+        self._lifetime_core_hours = None
+
+    def refresh(self):
+        """Fetches what changed since the previous refresh and updates the
+        counters.
+
+        :rtype: :class:`StatisticsSnapshot
+         <azure.batch.batch_statistics.StatisticsSnapshot>`
+        """
+        with self._lock:
+            requests = [('lifetime statistics', self._refresh_lifetime)]
+            if self.pool_ids:
+                requests.append(('usage metrics', self._refresh_usage))
+            requests.extend(
+                ('nodes of pool ' + pool_id, lambda pool_id=pool_id: self._refresh_nodes(pool_id))
+                for pool_id in self.pool_ids)
+            requests.extend(
+                ('tasks of job ' + job_id, self._watchers[job_id].poll)
+                for job_id in self.job_ids)
+            requests.extend(
+                ('preparation and release tasks of job ' + job_id,
+                 lambda job_id=job_id: self._refresh_preparation(job_id))
+                for job_id in self.job_ids)
+
+            errors = {}
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(requests))) as executor:
+                futures = [(name, executor.submit(request)) for name, request in requests]
+                for name, future in futures:
+                    error = future.exception()
+                    if error is not None:
+                        errors[name] = error
+            return self._snapshot(errors)
+
+    def _refresh_lifetime(self):
+        statistics = self._client.pool.get_all_lifetime_statistics(**self._operation_config)
+        usage = statistics.usage_stats
+        if usage is not None and usage.dedicated_core_time is not None:
+            self._lifetime_core_hours = usage.dedicated_core_time.total_seconds() / 3600.0
+
+    def _refresh_nodes(self, pool_id):
+        counts = {}
+        for _, state in self._projected.list_compute_nodes(
+                pool_id, 'id,state', **self._operation_config):
+            _count(counts, _enum_value(state))
+        self._node_states[pool_id] = counts
+
+    def _refresh_usage(self):
+        starts = [usage.latest_start for usage in self._usage.values()
+                  if usage.latest_start is not None]
+        if starts:
+            # Metrics already counted are ignored by _PoolUsage.add. The
+            # intervals of all the pools are published together, so a pool
+            # without metrics yet only gets intervals after those seen.
+            latest_allowed = datetime.datetime.now(isodate.UTC) - _USAGE_METRICS_DELAY
+            start_time = min(min(starts), latest_allowed)
+        else:
+            start_time = self._usage_start_time
+        options = models.PoolListUsageMetricsOptions(
+            start_time=start_time,
+            filter=' or '.join("poolId eq '{}'".format(pool_id) for pool_id in self.pool_ids))
+        metrics = list(self._client.pool.list_usage_metrics(options, **self._operation_config))
+        for item in sorted(metrics, key=lambda item: item.start_time):
+            usage = self._usage.get(item.pool_id)
+            if usage is not None:
+                usage.add(item)
+
+    def _refresh_preparation(self, job_id):
+        preparation, release = {}, {}
+        options = models.JobListPreparationAndReleaseTaskStatusOptions(
+            select=_PREPARATION_AND_RELEASE_SELECT)
+        for status in self._client.job.list_preparation_and_release_task_status(
+                job_id, options, **self._operation_config):
+            if status.job_preparation_task_execution_info is not None:
+                _count(preparation, _enum_value(status.job_preparation_task_execution_info.state))
+            if status.job_release_task_execution_info is not None:
+                _count(release, _enum_value(status.job_release_task_execution_info.state))
+        self._preparation_states[job_id] = (preparation, release)
+
+    def _snapshot(self, errors):
+        pools = {}
+        for pool_id in self.pool_ids:
+            core_hours, ingress, egress = self._usage[pool_id].totals
+            pools[pool_id] = PoolSummary(
+                pool_id, dict(self._node_states[pool_id]), core_hours, ingress, egress)
+        jobs = {}
+        for job_id in self.job_ids:
+            preparation, release = self._preparation_states[job_id]
+            jobs[job_id] = JobSummary(
+                job_id, self._watchers[job_id].counts(), dict(preparation), dict(release))
+        return StatisticsSnapshot(
+            pools, jobs, self._lifetime_core_hours, errors,
+            datetime.datetime.now(isodate.UTC))
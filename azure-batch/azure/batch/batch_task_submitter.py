@@ -0,0 +1,159 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import models
+from ._retry import backoff, get_error_code, is_retryable
+
+# Maximum number of tasks the add task collection operation accepts.
+MAX_TASKS_PER_REQUEST = 100
+
+
+def _is_server_error(result):
+    status = result.status
+    return status == models.TaskAddStatus.server_error or \
+        status == models.TaskAddStatus.server_error.value
+
+
+class BulkTaskSubmitter(object):
+    """Adds any number of tasks to a job using the add task collection
+    operation.
+
+    Tasks are read lazily from the given iterable in chunks of at most
+    `chunk_size` and the chunks are sent concurrently. Tasks which fail
+    with a server error, and chunks rejected because the server is busy,
+    are resubmitted with an exponential backoff. A chunk rejected with
+    RequestBodyTooLarge is split in half and each half sent separately.
+
+    Note that when a request is retried after a server error, the Batch
+    service may already have added some of its tasks; those then come back
+    with a 'TaskExists' client error.
+
+    :param client: The Batch service client.
+    :type client: :class:`BatchServiceClient
+     <azure.batch.BatchServiceClient>`
+    :param int max_workers: Maximum number of concurrent requests.
+    :param int chunk_size: Number of tasks per request, at most 100.
+    :param int max_retries: Maximum number of times a task or chunk is
+     resubmitted after a retryable failure.
+    :param float retry_interval: Initial delay in seconds between retries,
+     doubled on each attempt.
+    :param float max_retry_interval: Upper bound in seconds of the delay
+     between retries.
+    """
+
+    def __init__(self, client, max_workers=4, chunk_size=MAX_TASKS_PER_REQUEST,
+                 max_retries=5, retry_interval=1, max_retry_interval=30):
+        if not 0 < chunk_size <= MAX_TASKS_PER_REQUEST:
+            raise ValueError("chunk_size must be between 1 and {}".format(
+                MAX_TASKS_PER_REQUEST))
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._client = client
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+
+    def add_tasks(self, job_id, tasks, task_add_collection_options=None, **operation_config):
+        """Adds the tasks to the specified job.
+
+        :param job_id: The ID of the job to which the tasks are to be added.
+        :type job_id: str
+        :param tasks: The tasks to add. This can be a generator, at most a
+         few chunks of it are held in memory at any time.
+        :type tasks: iterable of :class:`TaskAddParameter
+         <azure.batch.models.TaskAddParameter>`
+        :param task_add_collection_options: Additional parameters for each
+         add task collection request
+        :type task_add_collection_options: :class:`TaskAddCollectionOptions
+         <azure.batch.models.TaskAddCollectionOptions>`
+        :param operation_config: :ref:`Operation configuration
+         overrides<msrest:optionsforoperations>`.
+        :return: The final result for every task, in completion order.
+        :rtype: :class:`TaskAddCollectionResult
+         <azure.batch.models.TaskAddCollectionResult>`
+        :raises:
+         :class:`BatchErrorException<azure.batch.models.BatchErrorException>`
+         if a request fails with a non retryable error, for example if the
+         job does not exist.
+        """
+        results = []
+        # Bound the number of chunks read ahead of the workers so a task
+        # generator is never drained into memory.
+        max_pending = self.max_workers * 2
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for chunk in self._chunks(tasks):
+                    if len(pending) >= max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            results.extend(future.result())
+                    pending.add(executor.submit(
+                        self._add_chunk, job_id, chunk,
+                        task_add_collection_options, operation_config))
+                for future in wait(pending)[0]:
+                    results.extend(future.result())
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return models.TaskAddCollectionResult(value=results)
+
+    def _chunks(self, tasks):
+        tasks = iter(tasks)
+        while True:
+            chunk = list(itertools.islice(tasks, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _add_chunk(self, job_id, chunk, options, operation_config):
+        results = []
+        remaining = chunk
+        attempt = 0
+        while remaining:
+            try:
+                response = self._client.task.add_collection(
+                    job_id, remaining, options, **operation_config)
+            except models.BatchErrorException as error:
+                if get_error_code(error) == 'RequestBodyTooLarge':
+                    if len(remaining) == 1:
+                        results.append(models.TaskAddResult(
+                            status=models.TaskAddStatus.client_error,
+                            task_id=remaining[0].id,
+                            error=error.error))
+                        return results
+                    middle = len(remaining) // 2
+                    results.extend(self._add_chunk(
+                        job_id, remaining[:middle], options, operation_config))
+                    results.extend(self._add_chunk(
+                        job_id, remaining[middle:], options, operation_config))
+                    return results
+                if attempt < self.max_retries and is_retryable(error):
+                    backoff(attempt, self.retry_interval, self.max_retry_interval)
+                    attempt += 1
+                    continue
+                raise
+
+            failed_ids = set()
+            for result in response.value:
+                if attempt < self.max_retries and _is_server_error(result):
+                    failed_ids.add(result.task_id)
+                else:
+                    results.append(result)
+            if not failed_ids:
+                break
+            remaining = [task for task in remaining if task.id in failed_ids]
+            backoff(attempt, self.retry_interval, self.max_retry_interval)
+            attempt += 1
+        return results
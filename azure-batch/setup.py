@@ -81,5 +81,8 @@ setup(
         'azure-common~=1.1.5',
         'msrestazure~=0.4.7',
     ],
+    extras_require={
+        ":python_version<'3.0'": ['futures'],
+    },
     cmdclass=cmdclass
 )
@@ -0,0 +1,418 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""asyncio counterparts of the generated management operation groups.
+
+The generated operations are not duplicated: each call runs the generated
+method, which builds its request with the usual URL construction, headers
+and `Serializer`, up to `ServiceClient.send`. There the request is captured
+and sent asynchronously by a transport, then the method runs again with the
+response, which it checks and deserializes as usual. Generated methods make
+no other side effect, so the second run builds the same request.
+
+Requires Python 3.5 or later: the module uses the async syntax, so it
+cannot be imported on earlier versions, and installing azure-common there
+reports a harmless SyntaxError when the module is byte-compiled. The
+default transport requires aiohttp, installed by the `aio` extra.
+
+.. versionadded:: 1.1.6
+"""
+import asyncio
+import copy
+import ssl
+import sys
+import threading
+
+import requests
+from msrest.paging import Paged
+
+from .lro import _PendingOperation
+
+
+class _RequestCaptured(Exception):
+    """Raised by the capturing client instead of sending a request."""
+
+    def __init__(self, request, headers, content, config):
+        super(_RequestCaptured, self).__init__(request.method, request.url)
+        self.request = request
+        self.headers = headers
+        self.content = content
+        self.config = config
+
+
+class _CapturingClient(object):
+    """ServiceClient whose `send` returns the responses given to the current
+    run of a generated method, and captures the request after them."""
+
+    def __init__(self, client):
+        self._wrapped = client
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
+
+    def send(self, request, headers=None, content=None, **config):
+        responses = getattr(self._local, 'responses', None)
+        if not responses:
+            config.pop('long_running_operation_engine', None)
+            raise _RequestCaptured(request, headers, content, config)
+        return responses.pop(0)
+
+    def run(self, function, args, kwargs, responses):
+        self._local.responses = list(responses)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self._local.responses = None
+
+
+class _LongRunningCommands(object):
+    """The closures of a long running operation."""
+
+    def __init__(self, send_cmd, output_cmd, update_cmd, timeout):
+        self.commands = (send_cmd, output_cmd, update_cmd, timeout)
+
+
+class _CommandsEngine(object):
+    """Engine returning the closures of the operation instead of running it."""
+
+    @staticmethod
+    def submit(send_cmd, output_cmd, update_cmd, timeout=30):
+        return _LongRunningCommands(send_cmd, output_cmd, update_cmd, timeout)
+
+
+_COMMANDS_ENGINE = _CommandsEngine()
+
+
+def prepare_request(client, request, headers=None, content=None):
+    """Prepare a request like `ServiceClient.send` does, with the headers
+    and the authentication of the client.
+
+    Proxies, redirects and retries of the client configuration are left to
+    the transport.
+
+    :param client: The client making the request.
+    :type client: msrest.service_client.ServiceClient
+    :param msrest.pipeline.ClientRequest request: The request.
+    :param dict headers: The headers of the operation.
+    :param content: The body of the operation.
+    :rtype: requests.PreparedRequest
+    """
+    session = client.creds.signed_session()
+    try:
+        session.headers.update(client._headers)  # pylint: disable=protected-access
+        session.headers['User-Agent'] = client.config.user_agent
+        session.headers['Accept'] = 'application/json'
+        request.add_headers(headers if headers else {})
+        request.add_content(content)
+        prepared = session.prepare_request(request)
+        # OAuth sessions add their token when sending, not when preparing.
+        token = getattr(session, 'token', None)
+        if token and 'Authorization' not in prepared.headers:
+            prepared.headers['Authorization'] = '{} {}'.format(
+                token.get('token_type', 'Bearer'), token['access_token'])
+        return prepared
+    finally:
+        session.close()
+
+
+def make_response(request, status_code, reason, headers, content):
+    """Build the `requests.Response` the generated code expects.
+
+    :param requests.PreparedRequest request: The request sent.
+    :param int status_code: The status of the response.
+    :param str reason: The reason of the status.
+    :param headers: The headers of the response.
+    :param bytes content: The body of the response.
+    :rtype: requests.Response
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason
+    response.headers.update(headers)
+    response._content = content  # pylint: disable=protected-access
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class AioHttpTransport(object):
+    """Send the requests of async operations with aiohttp.
+
+    The timeout and the certificate verification of the client configuration
+    and of `operation_config` are applied.
+
+    :param session: The aiohttp session to use, one is created on the first
+     request otherwise and closed by `close`.
+    :type session: aiohttp.ClientSession
+    """
+
+    def __init__(self, session=None):
+        self._session = session
+        self._own_session = session is None
+
+    async def send(self, client, request, headers, content, config):
+        """Send a request of a generated operation.
+
+        :param client: The client of the operation.
+        :type client: msrest.service_client.ServiceClient
+        :param msrest.pipeline.ClientRequest request: The request.
+        :param dict headers: The headers of the operation.
+        :param content: The body of the operation.
+        :param dict config: The `operation_config` of the operation.
+        :rtype: requests.Response
+        """
+        import aiohttp
+
+        prepared = prepare_request(client, request, headers, content)
+        connection = client.config.connection
+        verify = config.get('verify', connection.verify)
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        async with self._session.request(
+                prepared.method, prepared.url,
+                headers=dict(prepared.headers),
+                data=prepared.body,
+                timeout=aiohttp.ClientTimeout(total=config.get('timeout', connection.timeout)),
+                ssl=None if verify is True else verify) as answer:
+            body = await answer.read()
+        return make_response(prepared, answer.status, answer.reason, answer.headers, body)
+
+    async def close(self):
+        """Close the session created by the transport."""
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncPaged(object):
+    """Async iterator over the items of a paged operation.
+
+    :param msrest.paging.Paged paged: The paged result of the generated
+     operation.
+    :param AsyncOperations operations: The operation group sending the page
+     requests.
+    """
+
+    def __init__(self, paged, operations):
+        self._paged = paged
+        self._operations = operations
+
+    @property
+    def raw(self):
+        return self._paged.raw
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        paged = self._paged
+        # pylint: disable=protected-access
+        while paged._current_page_iter_index >= len(paged.current_page or ()):
+            if paged.next_link is None:
+                raise StopAsyncIteration
+            await self.advance_page()
+        item = paged.current_page[paged._current_page_iter_index]
+        paged._current_page_iter_index += 1
+        return item
+
+    async def advance_page(self):
+        """Get the next page.
+
+        :return: The items of the page.
+        :raises: StopAsyncIteration after the last page.
+        """
+        paged = self._paged
+        # pylint: disable=protected-access
+        if paged.next_link is None:
+            raise StopAsyncIteration("End of paging")
+        paged._current_page_iter_index = 0
+        response = paged._response = await self._operations._call(paged._get_next, paged.next_link)
+        if hasattr(paged, '_load_page'):
+            paged._load_page(response, response.json() if response.content else None)
+        else:
+            paged._derserializer(paged, response)
+        return paged.current_page
+
+
+class AsyncOperationPoller(object):
+    """Polls a long running operation from the event loop.
+
+    The delay between status requests is the Retry-After header of the last
+    response, or the `long_running_operation_timeout` of the operation.
+    """
+
+    def __init__(self, operation, delay, operations):
+        self._operation = operation
+        self._delay = delay
+        self._operations = operations
+        self._polling = None
+
+    def status(self):
+        """The current status of the operation.
+
+        :rtype: str
+        """
+        return self._operation.operation.status
+
+    def done(self):
+        """Whether the operation is finished.
+
+        :rtype: bool
+        """
+        return self._delay is None
+
+    async def result(self):
+        """Wait for the end of the operation.
+
+        :return: The deserialized resource of the operation, if any.
+        :raises CloudError: Server problem with the query.
+        """
+        if self._polling is None:
+            self._polling = asyncio.ensure_future(self._poll())
+        return await asyncio.shield(self._polling)
+
+    async def _poll(self):
+        while self._delay is not None:
+            await asyncio.sleep(self._delay)
+            self._delay = await self._operations._step(self._operation)
+        return self._operation.operation.resource
+
+
+class AsyncOperations(object):
+    """asyncio counterpart of a generated operation group.
+
+    Every operation of the group takes the same parameters:
+
+    - operations returning a `Paged` return an `AsyncPaged`, to iterate with
+      `async for`.
+    - long running operations are coroutines sending the initial request and
+      returning an `AsyncOperationPoller`.
+    - other operations are coroutines returning the deserialized response.
+
+    :param operations: The generated operation group, or client.
+    :param transport: The transport sending the requests, such as
+     `AioHttpTransport`.
+    """
+
+    def __init__(self, operations, transport):
+        self._client = _CapturingClient(operations._client)  # pylint: disable=protected-access
+        self._operations = copy.copy(operations)
+        self._operations._client = self._client  # pylint: disable=protected-access
+        self._transport = transport
+
+    def __getattr__(self, name):
+        attribute = getattr(self._operations, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+
+        def operation(*args, **kwargs):
+            kwargs.setdefault('long_running_operation_engine', _COMMANDS_ENGINE)
+            try:
+                result = self._client.run(attribute, args, kwargs, ())
+            except _RequestCaptured as captured:
+                return self._complete(attribute, args, kwargs, captured)
+            if isinstance(result, Paged):
+                return AsyncPaged(result, self)
+            if isinstance(result, _LongRunningCommands):
+                return self._start(result)
+            return result
+        operation.__name__ = name
+        operation.__doc__ = attribute.__doc__
+        setattr(self, name, operation)
+        return operation
+
+    async def _send(self, captured):
+        return await self._transport.send(
+            self._client._wrapped, captured.request, captured.headers,  # pylint: disable=protected-access
+            captured.content, captured.config)
+
+    async def _complete(self, function, args, kwargs, captured):
+        responses = []
+        while True:
+            responses.append(await self._send(captured))
+            try:
+                return self._client.run(function, args, kwargs, responses)
+            except _RequestCaptured as error:
+                captured = error
+
+    async def _call(self, function, *args):
+        try:
+            return self._client.run(function, args, {}, ())
+        except _RequestCaptured as captured:
+            return await self._complete(function, args, {}, captured)
+
+    async def _step(self, operation):
+        try:
+            return await self._call(operation.step)
+        except Exception as err:  # pylint: disable=broad-except
+            raise operation.error(err)
+
+    async def _start(self, commands):
+        operation = _PendingOperation(None, *commands.commands)
+        delay = await self._step(operation)
+        return AsyncOperationPoller(operation, delay, self)
+
+
+class AsyncClient(object):
+    """asyncio counterpart of a management client.
+
+    The operation groups of the client are `AsyncOperations`, sharing the
+    transport of the client. Other attributes, such as `models` or `config`,
+    are the ones of the client.
+
+    :param client: The management client.
+    :param transport: The transport sending the requests, an
+     `AioHttpTransport` by default.
+    """
+
+    def __init__(self, client, transport=None):
+        self._sync_client = client
+        self._transport = transport if transport is not None else AioHttpTransport()
+
+    def __getattr__(self, name):
+        value = getattr(self._sync_client, name)
+        if not name.startswith('_') and hasattr(value, '_client') and hasattr(value, '_deserialize'):
+            value = AsyncOperations(value, self._transport)
+            setattr(self, name, value)
+        return value
+
+    async def close(self):
+        """Close the transport."""
+        close = getattr(self._transport, 'close', None)
+        if close is not None:
+            await close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+def async_client(client_class):
+    """Create the asyncio counterpart of a management client class.
+
+    The class takes the parameters of `client_class`, and a `transport`
+    keyword argument.
+
+    :param type client_class: The management client class.
+    :rtype: type
+    """
+    def __init__(self, *args, transport=None, **kwargs):
+        AsyncClient.__init__(self, client_class(*args, **kwargs), transport)
+
+    namespace = {
+        '__init__': __init__,
+        '__module__': sys._getframe(1).f_globals.get('__name__'),  # pylint: disable=protected-access
+        '__doc__': 'asyncio counterpart of :class:`{}.{}`.'.format(
+            client_class.__module__, client_class.__name__),
+    }
+    if hasattr(client_class, 'models'):
+        namespace['models'] = staticmethod(client_class.models)
+    return type(client_class.__name__, (AsyncClient,), namespace)
@@ -4,9 +4,37 @@
 # license information.
 #--------------------------------------------------------------------------
 
-from .credentials import get_azure_cli_credentials, get_cli_profile
+import threading
+
+from .credentials import get_azure_cli_credentials, get_cli_profile, get_cli_profile_mtime
 from .cloud import get_cli_active_cloud
 
+_CLIENT_KEY_PARAMETERS = ('subscription_id', 'base_url', 'api_version')
+
+_client_cache = {}
+_client_cache_lock = threading.Lock()
+
+def _cli_parameters(kwargs, cli_defaults):
+    """Return the parameters of a client, completing `kwargs` with the CLI
+    credentials, subscription and cloud, loaded in `cli_defaults` if not
+    already there."""
+    parameters = {}
+    if 'credentials' not in kwargs or 'subscription_id' not in kwargs:
+        if 'credentials' not in cli_defaults:
+            cli_defaults['credentials'], cli_defaults['subscription_id'] = get_azure_cli_credentials()
+        parameters.update({
+            'credentials': kwargs.get('credentials', cli_defaults['credentials']),
+            'subscription_id': kwargs.get('subscription_id', cli_defaults['subscription_id'])
+        })
+    if 'base_url' not in kwargs:
+        if 'base_url' not in cli_defaults:
+            cloud = get_cli_active_cloud()
+            # api_version_profile = cloud.profile # TBC using _shared
+            cli_defaults['base_url'] = cloud.endpoints.resource_manager
+        parameters['base_url'] = cli_defaults['base_url']
+    parameters.update(kwargs)
+    return parameters
+
 def get_client_from_cli_profile(clientclass, **kwargs):
     """Return a SDK client initialized with current CLI credentials, CLI default subscription and CLI default cloud.
 
@@ -32,16 +60,50 @@ def get_client_from_cli_profile(clientclass, **kwargs):
     :raises: ImportError if azure-cli-core package is not available
     """
 
-    parameters = {}
-    if 'credentials' not in kwargs or 'subscription_id' not in kwargs:
-        credentials, subscription_id = get_azure_cli_credentials()
-        parameters.update({
-            'credentials': kwargs.get('credentials', credentials),
-            'subscription_id': kwargs.get('subscription_id', subscription_id)
-        })
-    if 'base_url' not in kwargs:
-        cloud = get_cli_active_cloud()
-        # api_version_profile = cloud.profile # TBC using _shared
-        parameters['base_url'] = cloud.endpoints.resource_manager
-    parameters.update(kwargs)
-    return clientclass(**parameters)
+    return clientclass(**_cli_parameters(kwargs, {}))
+
+def get_cached_client_from_cli_profile(clientclass, **kwargs):
+    """Return a SDK client initialized as by `get_client_from_cli_profile`, reusing
+    the client already returned for the same parameters.
+
+    The CLI credentials, default subscription and default cloud are loaded once, and
+    the clients are cached by class, subscription_id, base_url, api_version and the
+    other parameters provided in kwargs, which must be hashable. The cache is emptied
+    when the CLI profile file changes, on "az login" or "az account set" for instance.
+
+    :Example:
+
+    .. code:: python
+
+        from azure.common.client_factory import get_cached_client_from_cli_profile
+        from azure.mgmt.compute import ComputeManagementClient
+        for subscription_id in subscription_ids:
+            client = get_cached_client_from_cli_profile(
+                ComputeManagementClient, subscription_id=subscription_id)
+
+    .. versionadded:: 1.1.6
+
+    :param clientclass: A SDK client class
+    :return: An instanciated client, shared by the callers
+    :raises: ImportError if azure-cli-core package is not available
+    """
+    mtime = get_cli_profile_mtime()
+    with _client_cache_lock:
+        if _client_cache.get('mtime', mtime) != mtime:
+            _client_cache.clear()
+        _client_cache['mtime'] = mtime
+        parameters = _cli_parameters(kwargs, _client_cache.setdefault('cli_defaults', {}))
+        key = (clientclass,) + tuple(parameters.get(name) for name in _CLIENT_KEY_PARAMETERS) + tuple(
+            sorted(item for item in parameters.items() if item[0] not in _CLIENT_KEY_PARAMETERS))
+        clients = _client_cache.setdefault('clients', {})
+        if key not in clients:
+            clients[key] = clientclass(**parameters)
+        return clients[key]
+
+def clear_client_cache():
+    """Remove the clients and CLI parameters cached by `get_cached_client_from_cli_profile`.
+
+    .. versionadded:: 1.1.6
+    """
+    with _client_cache_lock:
+        _client_cache.clear()
@@ -0,0 +1,218 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Compact variants of the generated models, storing their attributes in
+`__slots__` instead of a per-instance `__dict__`.
+
+A compact class is generated from a model class: it has the same name,
+attributes, defaults, `_attribute_map` and `_validation`, and compact
+variants of the model base classes as bases, so that `Serializer` and
+`Deserializer` handle both alike. Compact instances are not instances of
+the generated class.
+
+.. versionadded:: 1.1.6
+"""
+import inspect
+import threading
+import weakref
+
+_compact_classes = {}
+_compact_deserializers = weakref.WeakKeyDictionary()
+_lock = threading.RLock()
+
+
+def _model_base():
+    from msrest.serialization import Model
+    return Model
+
+
+def _init_parameters(model_class):
+    """The parameters of the generated `__init__`, and the required ones."""
+    init = model_class.__init__
+    try:
+        parameters = list(inspect.signature(init).parameters.values())[1:]
+        names = [parameter.name for parameter in parameters
+                 if parameter.kind == parameter.POSITIONAL_OR_KEYWORD]
+        required = [parameter.name for parameter in parameters
+                    if parameter.kind == parameter.POSITIONAL_OR_KEYWORD
+                    and parameter.default is parameter.empty]
+    except AttributeError:  # Python 2
+        spec = inspect.getargspec(init)  # pylint: disable=deprecated-method
+        names = spec.args[1:]
+        required = names[:len(names) - len(spec.defaults or ())]
+    return names, required
+
+
+class _CompactModelMixin(object):
+    """Methods of the compact models replacing the `__dict__` based ones of
+    `msrest.serialization.Model`."""
+
+    __slots__ = ()
+    _compact_defaults = ()
+    _compact_fields = ()
+    _compact_parameters = ()
+    _compact_required = ()
+    _compact_source = None
+
+    def __init__(self, *args, **kwargs):
+        for name, value in self._compact_defaults:
+            setattr(self, name, value)
+        if len(args) > len(self._compact_parameters):
+            raise TypeError('{}() takes at most {} positional arguments'.format(
+                type(self).__name__, len(self._compact_parameters)))
+        missing = [name for name in self._compact_required[len(args):] if name not in kwargs]
+        if missing:
+            raise TypeError('{}() missing required arguments: {}'.format(
+                type(self).__name__, ', '.join(repr(name) for name in missing)))
+        for name, value in zip(self._compact_parameters, args):
+            setattr(self, name, value)
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def _compact_values(self):
+        return {name: getattr(self, name) for name in self._compact_fields}
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            return self._compact_values() == other._compact_values()
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self._compact_values())
+
+    def __reduce__(self):
+        # The compact class has the name of the generated class, which is
+        # the one pickle finds in the module.
+        return _restore, (self._compact_source, self._compact_values())
+
+    @classmethod
+    def _infer_class_models(cls):
+        return compact_dependencies(_model_base()._infer_class_models.__func__(cls))
+
+
+def _restore(model_class, values):
+    model = compact_class(model_class).__new__(compact_class(model_class))
+    for name, value in values.items():
+        setattr(model, name, value)
+    return model
+
+
+def _compact_model():
+    """The compact root class: the mixin, with the other methods of Model."""
+    try:
+        return _compact_classes[None]
+    except KeyError:
+        pass
+    model = _model_base()
+    namespace = {name: value for name, value in vars(model).items()
+                 if name not in vars(_CompactModelMixin) and name not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = ()
+    namespace['__doc__'] = 'Base class of the compact models.'
+    _compact_classes[None] = type('CompactModel', (_CompactModelMixin,), namespace)
+    return _compact_classes[None]
+
+
+def compact_class(model_class):
+    """Return the compact variant of a generated model class.
+
+    :param type model_class: A subclass of `msrest.serialization.Model`.
+    :return: The compact class, or `model_class` itself if its generated
+     `__init__` cannot be called without arguments to find its defaults.
+    :rtype: type
+    """
+    try:
+        return _compact_classes[model_class]
+    except KeyError:
+        pass
+    with _lock:
+        if model_class not in _compact_classes:
+            _compact_classes[model_class] = _build_compact_class(model_class)
+        return _compact_classes[model_class]
+
+
+def _build_compact_class(model_class):
+    model = _model_base()
+    bases = [base for base in model_class.__bases__ if issubclass(base, model)]
+    if len(bases) != 1:
+        return model_class
+    base = _compact_model() if bases[0] is model else compact_class(bases[0])
+    if base is bases[0]:
+        return model_class
+
+    names, required = _init_parameters(model_class)
+    try:
+        probe = model_class(**{name: None for name in required})
+    except Exception:  # pylint: disable=broad-except
+        return model_class
+    defaults = vars(probe)
+    for name in model_class._attribute_map:
+        if not hasattr(model_class, name):
+            defaults.setdefault(name, None)
+
+    namespace = {name: value for name, value in vars(model_class).items()
+                 if not callable(value) and not isinstance(value, (classmethod, staticmethod, property))
+                 and name not in ('__dict__', '__weakref__')}
+    for name in namespace:
+        defaults.pop(name, None)
+    namespace['__slots__'] = tuple(sorted(set(defaults) - set(base._compact_fields)))
+    namespace['_compact_fields'] = tuple(sorted(defaults))
+    namespace['_compact_defaults'] = tuple(sorted(defaults.items()))
+    namespace['_compact_parameters'] = tuple(names)
+    namespace['_compact_required'] = tuple(required)
+    namespace['_compact_source'] = model_class
+    return type(model_class.__name__, (base,), namespace)
+
+
+def compact_dependencies(dependencies):
+    """Replace the model classes of a dependency dictionary, as given to a
+    `Serializer` or a `Deserializer`, by their compact variant.
+
+    :param dict dependencies: The classes by name.
+    :rtype: dict
+    """
+    model = _model_base()
+    return {name: compact_class(value)
+            if isinstance(value, type) and issubclass(value, model) else value
+            for name, value in dependencies.items()}
+
+
+def compact_deserializer(deserializer):
+    """Return a `Deserializer` building the compact variant of the models of
+    `deserializer`. It is created once per deserializer, of the same class,
+    and released with it.
+
+    :param msrest.serialization.Deserializer deserializer: A deserializer.
+    :rtype: msrest.serialization.Deserializer
+    """
+    with _lock:
+        compact = _compact_deserializers.get(deserializer)
+        if compact is None:
+            compact = type(deserializer)(compact_dependencies(deserializer.dependencies))
+            compact.key_extractors = deserializer.key_extractors
+            _compact_deserializers[deserializer] = compact
+        return compact
+
+
+def use_compact_models(client):
+    """Make the operations of a client return compact models.
+
+    The operation groups already created, and those created later by
+    multi API clients, deserialize their responses to compact models. The
+    models given as parameters can be compact or not.
+
+    :param client: A generated client.
+    :return: The client.
+    """
+    deserializer = client._deserialize  # pylint: disable=protected-access
+    client._deserialize = compact_deserializer(deserializer)  # pylint: disable=protected-access
+    for value in list(vars(client).values()):
+        if hasattr(value, '_deserialize'):
+            use_compact_models(value)
+    return client
@@ -0,0 +1,533 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Serializer and Deserializer of the generated clients, running functions
+compiled once per process from the `_attribute_map` and `_validation` of
+each model instead of interpreting them for every object and attribute.
+
+The functions are generated the first time a model is serialized or
+deserialized. They cover the model classes, their subtypes, nested models,
+`[Type]` and `{Type}` collections and flattened `properties.*` keys. Any
+input they do not handle, and any error, is given to the msrest
+implementation, so results and exceptions are those of msrest.
+
+Unlike msrest, `Serializer.body` does not update the nested dictionaries
+and enumeration strings of the model given as parameter to models and
+enumerations.
+
+.. versionadded:: 1.1.6
+"""
+import inspect
+import re
+import threading
+
+from enum import Enum
+from msrest import serialization
+
+_FLATTEN = re.compile(r"(?<!\\)\.")
+_TEXT = type(u'')
+_PLAIN = (str, _TEXT, int, float, bool)
+
+_compilers = {}
+_compilers_lock = threading.Lock()
+
+
+class _Fallback(Exception):
+    """Raised by the compiled functions for the inputs left to msrest."""
+
+
+def _rest_key_parts(attr_desc):
+    return [part.replace('\\.', '.') for part in _FLATTEN.split(attr_desc['key'])]
+
+
+def _identifier(name):
+    return re.sub(r'\W', '_', name)
+
+
+def _is_model(value):
+    # The compact models of azure.common.compact are not Model subclasses.
+    return isinstance(value, type) and (
+        issubclass(value, serialization.Model) or getattr(value, '_compact_source', None) is not None)
+
+
+def _attributes(instance):
+    """The attributes of an instance, in its `__dict__` or its `__slots__`,
+    and whether they are slots."""
+    try:
+        return dict(vars(instance)), False
+    except TypeError:
+        names = [name for cls in type(instance).__mro__ for name in cls.__dict__.get('__slots__', ())]
+        return {name: getattr(instance, name) for name in names if hasattr(instance, name)}, True
+
+
+def _is_enum(value):
+    return isinstance(value, type) and issubclass(value, Enum)
+
+
+def _define(name, lines, namespace):
+    source = '\n'.join(lines) + '\n'
+    exec(compile(source, '<compiled {}>'.format(name), 'exec'), namespace)  # pylint: disable=exec-used
+    return namespace[name]
+
+
+class _Compiler(object):
+    """The compiled functions of the models of a dependency dictionary."""
+
+    def __init__(self, dependencies):
+        self.dependencies = dependencies
+        self._generic = serialization.Deserializer(dependencies)
+        self._generic_serializer = serialization.Serializer(dependencies)
+        self._lock = threading.RLock()
+        self._deserializers = {}
+        self._builders = {}
+        self._fields = {}
+        self._serializers = {}
+        self._validators = {}
+        self._converters = {}
+        self._serializer_converters = {}
+
+    def _cached(self, cache, key, compile_function):
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in cache:
+                # Stands for the function while it is compiled, for the
+                # models containing themselves.
+                function = []
+                cache[key] = lambda *args: function[0](*args)
+                try:
+                    function.append(compile_function(key))
+                except Exception:  # pylint: disable=broad-except
+                    function.append(_fallback)
+                cache[key] = function[0]
+            return cache[key]
+
+    # Deserialization
+
+    def deserializer(self, model_class):
+        """The function deserializing a dictionary to `model_class`, or to
+        the subtype named by its discriminator."""
+        return self._cached(self._deserializers, model_class, self._compile_deserializer)
+
+    def builder(self, model_class):
+        """The function deserializing a dictionary to `model_class`."""
+        return self._cached(self._builders, model_class, self._compile_builder)
+
+    def converter(self, data_type):
+        """The function deserializing a value that is not None to
+        `data_type`."""
+        return self._cached(self._converters, data_type, self._compile_converter)
+
+    def _compile_deserializer(self, model_class):
+        subtype_map = model_class.__dict__.get('_subtype_map', {})
+        if not subtype_map:
+            return self.builder(model_class)
+        namespace = {'Fallback': _Fallback, 'build': self.builder(model_class)}
+        lines = ['def deserialize(data):']
+        for index, subtype_key in enumerate(subtype_map):
+            rest_key = model_class._get_rest_key_parts(subtype_key)[-1]  # pylint: disable=protected-access
+            subtypes = {}
+            for value, name in model_class._flatten_subtype(subtype_key, self.dependencies).items():  # pylint: disable=protected-access
+                if name in self.dependencies:
+                    subtypes[value] = self.builder(self.dependencies[name])
+            namespace['subtypes{}'.format(index)] = subtypes
+            lines += [
+                '    value = data.get({!r}) or data.get({!r})'.format(rest_key, subtype_key),
+                '    if not value:',
+                '        raise Fallback()',
+                '    if value != {!r}:'.format(model_class.__name__),
+                '        return subtypes{}[value](data)'.format(index),
+            ]
+        lines.append('    return build(data)')
+        return _define('deserialize', lines, namespace)
+
+    def fields(self, target_class):
+        """The function deserializing a dictionary to the dictionary of the
+        attributes of `target_class`, such as a `Paged` class."""
+        return self._cached(self._fields, target_class, self._compile_fields)
+
+    def _field_lines(self, target_class, namespace):
+        """The lines reading and deserializing the attributes of
+        `target_class` from `data`, and the (attribute, variable) pairs."""
+        lines = []
+        prefixes = {(): 'data'}
+        values = []
+        for index, (attr, attr_desc) in enumerate(target_class._attribute_map.items()):  # pylint: disable=protected-access
+            parts = _rest_key_parts(attr_desc)
+            for depth in range(1, len(parts)):
+                prefix = tuple(parts[:depth])
+                if prefix not in prefixes:
+                    # As msrest, a missing level is looked up in the top one.
+                    prefixes[prefix] = 'level{}'.format(len(prefixes))
+                    lines.append('    {} = {}.get({!r}, data)'.format(
+                        prefixes[prefix], prefixes[prefix[:-1]], parts[depth - 1]))
+            lines.append('    value = {}.get({!r})'.format(prefixes[tuple(parts[:-1])], parts[-1]))
+            data_type = attr_desc['type']
+            name = 'value{}'.format(index)
+            if data_type == 'str':
+                lines.append('    {0} = value if value is None or value.__class__ is text else convert{1}(value)'.format(
+                    name, index))
+            else:
+                lines.append('    {0} = None if value is None else convert{1}(value)'.format(name, index))
+            namespace['convert{}'.format(index)] = self.converter(data_type)
+            values.append((attr, name))
+        namespace['text'] = _TEXT
+        return lines, values
+
+    def _compile_fields(self, target_class):
+        namespace = {}
+        lines, values = self._field_lines(target_class, namespace)
+        lines.append('    return {{{}}}'.format(', '.join('{!r}: {}'.format(attr, name) for attr, name in values)))
+        return _define('fields', ['def fields(data):'] + lines, namespace)
+
+    def _compile_builder(self, model_class):
+        validation = model_class._validation  # pylint: disable=protected-access
+        subtype_keys = set(getattr(model_class, '_subtype_map', {}))
+        constants = set(name for name, rules in validation.items() if rules.get('constant'))
+        namespace = {'cls': model_class}
+        lines, values = self._field_lines(model_class, namespace)
+        lines.insert(0, 'def build(data):')
+        template, slots = self._template(model_class, constants | subtype_keys)
+        if template is not None:
+            # The attributes are in the order the generated __init__ sets them.
+            variables = {attr: name for attr, name in values
+                         if attr not in constants and attr not in subtype_keys}
+            namespace['new'] = object.__new__
+            items = []
+            for name, value in template.items():
+                if name in variables:
+                    items.append((name, variables[name]))
+                else:
+                    namespace['default_' + _identifier(name)] = value
+                    items.append((name, 'default_' + _identifier(name)))
+            lines.append('    instance = new(cls)')
+            if slots:
+                lines += ['    instance.{} = {}'.format(name, value) for name, value in items]
+            else:
+                lines.append('    instance.__dict__ = {{{}}}'.format(
+                    ', '.join('{!r}: {}'.format(name, value) for name, value in items)))
+            lines.append('    return instance')
+        else:
+            namespace['instantiate'] = self._generic._instantiate_model  # pylint: disable=protected-access
+            lines.append('    return instantiate(cls, {{{}}})'.format(
+                ', '.join('{!r}: {}'.format(attr, name) for attr, name in values)))
+        return _define('build', lines, namespace)
+
+    @staticmethod
+    def _template(model_class, excluded):
+        """The attributes set by the generated `__init__`, with the values
+        of those that deserialization does not set, and whether they are
+        slots, or None if instances cannot be created without calling
+        `__init__`."""
+        init = model_class.__init__
+        try:
+            code = init.__code__
+        except AttributeError:
+            return None, False
+        if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+            # Such as the compact models, which list their required ones.
+            required = getattr(model_class, '_compact_required', ())
+        else:
+            required = code.co_varnames[1:code.co_argcount - len(init.__defaults__ or ())]
+        try:
+            probe = model_class(**{name: None for name in required})
+            attributes, slots = _attributes(probe)
+        except Exception:  # pylint: disable=broad-except
+            return None, False
+        deserialized = set(model_class._attribute_map) - excluded  # pylint: disable=protected-access
+        if not deserialized <= set(attributes):
+            return None, False
+        for name, value in attributes.items():
+            if name in deserialized and value is not None:
+                return None, False
+            if value is not None and not isinstance(value, _PLAIN):
+                return None, False
+        return attributes, slots
+
+    def _compile_converter(self, data_type):
+        generic = self._generic
+        if not data_type:
+            return lambda value: value
+        if data_type == 'str':
+            unicode_ = generic.deserialize_unicode
+            return lambda value: value if value.__class__ is _TEXT else unicode_(value)
+        if data_type == 'bool':
+            basic = generic.deserialize_basic
+            return lambda value: value if value is True or value is False else basic(value, 'bool')
+        if data_type in ('int', 'float'):
+            return int if data_type == 'int' else float
+        if data_type in generic.deserialize_type:
+            function = generic.deserialize_type[data_type]
+            expected = generic.deserialize_expected_types.get(data_type)
+            if data_type == 'object':
+                function = generic.deserialize_object
+            if expected:
+                return lambda value: value if isinstance(value, expected) else function(value)
+            return function
+        if data_type[0] + data_type[-1] == '[]':
+            return self._list_converter(self.converter(data_type[1:-1]))
+        if data_type[0] + data_type[-1] == '{}':
+            return self._dict_converter(self.converter(data_type[1:-1]))
+        obj_type = self.dependencies.get(data_type)
+        if _is_enum(obj_type):
+            members = obj_type._value2member_map_  # pylint: disable=protected-access
+            enum = generic.deserialize_enum
+
+            def convert_enum(value):
+                if value.__class__ is _TEXT or value.__class__ is str:
+                    member = members.get(value)
+                    if member is not None:
+                        return member
+                return enum(value, obj_type)
+            return convert_enum
+        if _is_model(obj_type):
+            return self.deserializer(obj_type)
+        return lambda value: generic.deserialize_data(value, data_type)
+
+    @staticmethod
+    def _list_converter(convert):
+        def convert_list(value):
+            if not value and not isinstance(value, list):
+                return None
+            return [None if item is None else convert(item) for item in value]
+        return convert_list
+
+    @staticmethod
+    def _dict_converter(convert):
+        def convert_dict(value):
+            if isinstance(value, list):
+                return {item['key']: None if item['value'] is None else convert(item['value'])
+                        for item in value}
+            return {key: None if item is None else convert(item) for key, item in value.items()}
+        return convert_dict
+
+    # Serialization
+
+    def serializer(self, model_class):
+        """The function serializing an instance of `model_class` to a
+        dictionary, given the keyword arguments of `Serializer.body`."""
+        return self._cached(self._serializers, model_class, self._compile_serializer)
+
+    def validator(self, model_class):
+        """The function returning whether an instance of `model_class` is
+        valid."""
+        return self._cached(self._validators, model_class, self._compile_validator)
+
+    def serializer_converter(self, data_type):
+        """The function serializing a value that is not None from
+        `data_type`, given the keyword arguments of `Serializer.body`."""
+        return self._cached(self._serializer_converters, data_type, self._compile_serializer_converter)
+
+    def _compile_serializer(self, model_class):
+        validation = model_class._validation  # pylint: disable=protected-access
+        namespace = {}
+        lines = ['def serialize(instance, kwargs):',
+                 '    serialized = {}',
+                 '    keep_readonly = kwargs.get("keep_readonly", False)']
+        attributes = list(model_class._attribute_map.items())  # pylint: disable=protected-access
+        flattened = set(_rest_key_parts(attr_desc)[0] for _, attr_desc in attributes
+                        if len(_rest_key_parts(attr_desc)) > 1)
+        for index, (attr, attr_desc) in enumerate(attributes):
+            indent = '    '
+            if validation.get(attr, {}).get('readonly', False):
+                lines.append('    if keep_readonly:')
+                indent += '    '
+            data_type = attr_desc['type']
+            lines += [indent + 'value = instance.{}'.format(attr),
+                      indent + 'if value is not None:']
+            indent += '    '
+            if data_type == 'str':
+                lines.append(indent + 'if value.__class__ is not str:')
+                lines.append(indent + '    value = convert{}(value, kwargs)'.format(index))
+            else:
+                lines.append(indent + 'value = convert{}(value, kwargs)'.format(index))
+            namespace['convert{}'.format(index)] = self.serializer_converter(data_type)
+            parts = _rest_key_parts(attr_desc)
+            target = 'serialized'
+            for part in parts[:-1]:
+                lines.append(indent + 'level = {}.setdefault({!r}, {{}})'.format(target, part))
+                target = 'level'
+            if target != 'serialized' or parts[-1] in flattened:
+                lines += [indent + 'if {!r} not in {}:'.format(parts[-1], target),
+                          indent + '    {}[{!r}] = value'.format(target, parts[-1])]
+            else:
+                lines.append(indent + 'serialized[{!r}] = value'.format(parts[-1]))
+        lines.append('    return serialized')
+        return _define('serialize', lines, namespace)
+
+    def _compile_serializer_converter(self, data_type):
+        generic = self._generic_serializer
+        if data_type == 'str':
+            unicode_ = generic.serialize_unicode
+            return lambda value, kwargs: value if value.__class__ is str else unicode_(value)
+        if data_type in ('int', 'float', 'bool'):
+            function = {'int': int, 'float': float, 'bool': bool}[data_type]
+            return lambda value, kwargs: function(value)
+        if data_type in generic.serialize_type:
+            function = generic.serialize_type[data_type]
+            return lambda value, kwargs: function(value, **kwargs)
+        if data_type[0] + data_type[-1] in ('[]', '{}'):
+            convert = self.serializer_converter(data_type[1:-1])
+            # msrest builds new models from the collections of models given
+            # as lists and dictionaries only.
+            checked = self.dependencies.get(data_type[1:-1].strip('[]{}')) is not None
+            return self._serialize_collection(data_type[0], convert, checked, generic.serialize_unicode)
+        obj_type = self.dependencies.get(data_type)
+        if _is_enum(obj_type):
+            return lambda value, kwargs: generic.serialize_enum(value, enum_obj=obj_type)
+        if _is_model(obj_type):
+            return self._serialize_model
+        return lambda value, kwargs: generic.serialize_data(value, data_type, **kwargs)
+
+    def _serialize_model(self, value, kwargs):
+        if not hasattr(value, '_attribute_map'):
+            raise _Fallback()
+        return self.serializer(value.__class__)(value, kwargs)
+
+    @staticmethod
+    def _serialize_collection(kind, convert, checked, unicode_):
+        if kind == '[':
+            def serialize_list(value, kwargs):
+                if checked and not isinstance(value, list):
+                    raise _Fallback()
+                return [None if item is None else convert(item, kwargs) for item in value]
+            return serialize_list
+
+        def serialize_dict(value, kwargs):
+            if checked and not isinstance(value, dict):
+                raise _Fallback()
+            return {key if key.__class__ is str else unicode_(key):
+                    None if item is None else convert(item, kwargs)
+                    for key, item in value.items()}
+        return serialize_dict
+
+    def _compile_validator(self, model_class):
+        validation = model_class._validation  # pylint: disable=protected-access
+        plan = []
+        for attr, attr_desc in model_class._attribute_map.items():  # pylint: disable=protected-access
+            config = validation.get(attr, {})
+            rules = [(serialization.Serializer.validation[key], value)
+                     for key, value in config.items() if key in serialization.Serializer.validation]
+            if rules and _is_enum(self.dependencies.get(attr_desc['type'].strip('[]{}'))):
+                # msrest validates the enumeration members built from the
+                # strings, which only it does.
+                raise _Fallback()
+            plan.append((attr, config.get('required', False), config.get('readonly', False),
+                         rules, self._nested_validator(attr_desc['type'])))
+
+        def validate(instance):
+            for attr, required, readonly, rules, nested in plan:
+                value = getattr(instance, attr)
+                if value is None:
+                    if required:
+                        return False
+                    continue
+                if not readonly:
+                    for check, argument in rules:
+                        if check(value, argument):
+                            return False
+                if not nested(value):
+                    return False
+            return True
+        return validate
+
+    def _nested_validator(self, data_type):
+        if data_type.startswith('['):
+            inner = self._nested_validator(data_type[1:-1])
+            return lambda value: value is None or all(inner(item) for item in value)
+        if data_type.startswith('{'):
+            inner = self._nested_validator(data_type[1:-1])
+            return lambda value: value is None or all(inner(item) for item in value.values())
+        return self._validate_value
+
+    def _validate_value(self, value):
+        if value is None or value.__class__ in _PLAIN or not hasattr(value, '_validation'):
+            return True
+        if getattr(value.__class__, 'validate', None) is not serialization.Model.validate:
+            return not value.validate()
+        return self.validator(value.__class__)(value)
+
+
+def _fallback(*args):
+    raise _Fallback()
+
+
+def _compiler(dependencies):
+    key = frozenset(dependencies.items())
+    try:
+        return _compilers[key]
+    except KeyError:
+        pass
+    with _compilers_lock:
+        if key not in _compilers:
+            _compilers[key] = _Compiler(dict(dependencies))
+        return _compilers[key]
+
+
+class _Dependencies(dict):
+    """The model classes of a Deserializer, which the `Paged` results
+    built from them by `azure.common.paging.operation_paged` use."""
+
+    __slots__ = ('deserializer',)
+
+
+class Serializer(serialization.Serializer):
+    """`msrest.Serializer` running compiled functions for the request bodies
+    of models."""
+
+    def __init__(self, classes=None):
+        super(Serializer, self).__init__(classes)
+        self._compiler = _compiler(self.dependencies)
+
+    def body(self, data, data_type, **kwargs):
+        if (data is not None and hasattr(data, '_attribute_map') and not set(kwargs) - {'keep_readonly'}
+                and self.key_transformer is serialization.full_restapi_key_transformer
+                and _is_model(self.dependencies.get(data_type))):
+            try:
+                if self._compiler.validator(data.__class__)(data):
+                    return self._compiler.serializer(data.__class__)(data, kwargs)
+            except Exception:  # pylint: disable=broad-except
+                pass
+        return super(Serializer, self).body(data, data_type, **kwargs)
+
+
+class Deserializer(serialization.Deserializer):
+    """`msrest.Deserializer` running compiled functions for the response
+    bodies of models, collections and `Paged` results."""
+
+    def __init__(self, classes=None):
+        super(Deserializer, self).__init__(classes)
+        self.dependencies = _Dependencies(self.dependencies)
+        self.dependencies.deserializer = self
+        self._compiler = _compiler(self.dependencies)
+
+    def __call__(self, target_obj, response_data):
+        if (not hasattr(response_data, '_attribute_map') and target_obj is not None
+                and self.key_extractors == [serialization.rest_key_extractor]):
+            try:
+                return self._compiled(target_obj, self._unpack_content(response_data))
+            except Exception:  # pylint: disable=broad-except
+                pass
+        return super(Deserializer, self).__call__(target_obj, response_data)
+
+    def _compiled(self, target_obj, data):
+        if isinstance(target_obj, serialization.basestring):
+            target = self.dependencies.get(target_obj)
+            if target is None:
+                return None if data is None else self._compiler.converter(target_obj)(data)
+        else:
+            target = target_obj
+        if isinstance(target, type):
+            if not _is_model(target) or not (data is None or isinstance(data, dict)):
+                raise _Fallback()
+            return None if data is None else self._compiler.deserializer(target)(data)
+        # A Paged result, filled with the attributes of its class.
+        if not isinstance(data, dict):
+            raise _Fallback()
+        for attr, value in self._compiler.fields(type(target))(data).items():
+            setattr(target, attr, value)
+        return target
@@ -0,0 +1,181 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Connection pools shared by the clients of a service.
+
+.. versionadded:: 1.1.6
+"""
+import threading
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class _SharedPoolAdapter(HTTPAdapter):
+    """An adapter sending with the connections of a `ConnectionPool`, and
+    leaving them open when its session is closed."""
+
+    def __init__(self, pool, max_retries):
+        self._pool = pool
+        super(_SharedPoolAdapter, self).__init__(max_retries=max_retries)
+
+    def init_poolmanager(self, *args, **kwargs):
+        self.poolmanager = self._pool._adapter.poolmanager  # pylint: disable=protected-access
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        return self._pool._proxy_manager_for(proxy, **proxy_kwargs)  # pylint: disable=protected-access
+
+    def close(self):
+        pass
+
+
+class ConnectionPool(object):
+    """Connections kept open between the requests of the clients using the
+    pool, one pool of connections per host.
+
+    msrest sends each request with a new session, and so a new connection,
+    which is closed with the session once the response is read. Clients
+    using a pool send their requests on its connections instead.
+
+    :param int pool_connections: The number of hosts whose connections are
+     kept, those of the least recently used host being dropped first.
+    :param int pool_maxsize: The number of connections kept per host. More
+     can be open at once, unless `pool_block` is True.
+    :param bool pool_block: Whether the requests wait for a connection once
+     `pool_maxsize` are in use.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=32, pool_block=False):
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._proxy_managers = self._adapter.proxy_manager
+        self._proxy_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._disposed_connections = 0
+        self._disposed_requests = 0
+        self._count_disposed(self._adapter.poolmanager)
+
+    def _count_disposed(self, manager):
+        pools = manager.pools
+        dispose = pools.dispose_func
+
+        def dispose_pool(pool):
+            with self._lock:
+                self._disposed_connections += pool.num_connections
+                self._disposed_requests += pool.num_requests
+            if dispose is not None:
+                dispose(pool)
+        pools.dispose_func = dispose_pool
+
+    def _proxy_manager_for(self, proxy, **proxy_kwargs):
+        # HTTPAdapter.proxy_manager_for adds to the dict shared by the
+        # adapters of the pool without a lock.
+        with self._proxy_lock:
+            created = proxy not in self._proxy_managers
+            manager = self._adapter.proxy_manager_for(proxy, **proxy_kwargs)
+            if created:
+                self._count_disposed(manager)
+            return manager
+
+    def adapter(self, max_retries=0):
+        """Return an adapter sending with the connections of the pool.
+
+        :param max_retries: The retry policy of the adapter.
+        :rtype: requests.adapters.HTTPAdapter
+        """
+        return _SharedPoolAdapter(self, max_retries)
+
+    def _managers(self):
+        with self._proxy_lock:
+            return [self._adapter.poolmanager] + list(self._proxy_managers.values())
+
+    @staticmethod
+    def _host_pools(managers):
+        # Reading manager.pools[key] would make the host the most recently
+        # used one, and raise KeyError if it was dropped meanwhile.
+        host_pools = []
+        for manager in managers:
+            with manager.pools.lock:
+                host_pools.extend(manager.pools._container.values())  # pylint: disable=protected-access
+        return host_pools
+
+    def statistics(self):
+        """Return the counters of the pool.
+
+        `connections` is the number of connections opened, each with a TLS
+        handshake for HTTPS, `requests` the number of requests sent and
+        `reused` those sent on a connection already open.
+
+        :rtype: dict
+        """
+        # The dispose hook takes self._lock after the container lock is
+        # released, and clear() disposes outside of self._proxy_lock: the
+        # managers are listed first so that the locks are never nested
+        # the other way round.
+        managers = self._managers()
+        with self._lock:
+            host_pools = self._host_pools(managers)
+            connections = self._disposed_connections + sum(pool.num_connections for pool in host_pools)
+            requests = self._disposed_requests + sum(pool.num_requests for pool in host_pools)
+        reused = max(0, requests - connections)
+        return {
+            'hosts': len(host_pools),
+            'connections': connections,
+            'requests': requests,
+            'reused': reused,
+            'reuse_rate': float(reused) / requests if requests else 0.0,
+        }
+
+    def clear(self):
+        """Close the connections of the pool."""
+        for manager in self._managers():
+            manager.clear()
+
+
+def get_connection_pool(base_url, **kwargs):
+    """Return the connection pool shared by the clients of a base URL,
+    creating it with `kwargs`, the parameters of `ConnectionPool`, if
+    needed.
+
+    :param str base_url: The base URL of the clients, only its scheme and
+     host being compared.
+    :rtype: ConnectionPool
+    """
+    parsed = urlparse(base_url)
+    key = (parsed.scheme.lower(), parsed.netloc.lower())
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(**kwargs)
+        return _pools[key]
+
+
+def use_connection_pool(client, pool=None):
+    """Send the requests of a client with the connections of a pool.
+
+    :param client: A generated client.
+    :param ConnectionPool pool: The pool, the one shared by the clients
+     with the same base URL if None.
+    :return: The pool.
+    :rtype: ConnectionPool
+    """
+    service_client = client._client  # pylint: disable=protected-access
+    pool = pool if pool is not None else get_connection_pool(service_client.config.base_url)
+    configure_session = service_client._configure_session  # pylint: disable=protected-access
+
+    def configure_pooled_session(session, **config):
+        kwargs = configure_session(session, **config)
+        adapter = pool.adapter(config.get('retries', service_client.config.retry_policy()))
+        for protocol in service_client._protocols:  # pylint: disable=protected-access
+            session.mount(protocol, adapter)
+        return kwargs
+    service_client._configure_session = configure_pooled_session  # pylint: disable=protected-access
+    return pool
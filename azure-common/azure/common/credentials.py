@@ -4,18 +4,36 @@
 # license information.
 #--------------------------------------------------------------------------
 
+import datetime
 import os.path
+import threading
+import time
+
+import requests
+
+_cli_cache = {}
+_cli_cache_lock = threading.RLock()
 
 def get_cli_profile():
     """Return a CLI profile class.
 
+    The profile is loaded once, and loaded again when the profile file changes.
+
     .. versionadded:: 1.1.6
 
     :return: A CLI Profile
     :rtype: azure.cli.core._profile.Profile
     :raises: ImportError if azure-cli-core package is not available
     """
+    mtime = get_cli_profile_mtime()
+    with _cli_cache_lock:
+        if 'profile' not in _cli_cache or _cli_cache['mtime'] != mtime:
+            _cli_cache.clear()
+            _cli_cache['profile'] = _load_cli_profile()
+            _cli_cache['mtime'] = mtime
+        return _cli_cache['profile']
 
+def _load_cli_profile():
     try:
         from azure.cli.core._profile import Profile
         from azure.cli.core._session import ACCOUNT
@@ -28,7 +46,27 @@ def get_cli_profile():
     ACCOUNT.load(os.path.join(azure_folder, 'azureProfile.json'))
     return Profile(ACCOUNT)
 
-def get_azure_cli_credentials():
+def get_cli_profile_mtime():
+    """Return the modification time of the profile file of the CLI, which
+    changes on "az login" and "az account set".
+
+    .. versionadded:: 1.1.6
+
+    :return: The modification time, or None if there is no profile file
+    :rtype: float
+    :raises: ImportError if azure-cli-core package is not available
+    """
+    try:
+        from azure.cli.core._environment import get_config_dir
+    except ImportError:
+        raise ImportError("You need to install 'azure-cli-core' to load CLI credentials")
+
+    try:
+        return os.path.getmtime(os.path.join(get_config_dir(), 'azureProfile.json'))
+    except OSError:
+        return None
+
+def get_azure_cli_credentials(resource=None):
     """Return Credentials and default SubscriptionID of current loaded profile of the CLI.
 
     Credentials will be the "az login" command: 
@@ -37,14 +75,95 @@ def get_azure_cli_credentials():
     Default subscription ID is either the only one you have, or you can define it:
     https://docs.microsoft.com/cli/azure/manage-azure-subscriptions-azure-cli
 
+    The same Credentials are returned for a resource until the profile file changes,
+    and they reuse their token until it is about to expire, see `CachedTokenCredentials`.
+
     .. versionadded:: 1.1.6
 
+    :param str resource: The resource of the token, the one of Azure Resource Manager
+     if None
     :return: tuple of Credentials and SubscriptionID
     :rtype: tuple
     """
-    profile = get_cli_profile()
-    cred, subscription_id, _ = profile.get_login_credentials()
-    return cred, subscription_id
+    with _cli_cache_lock:
+        profile = get_cli_profile()
+        credentials = _cli_cache.setdefault('credentials', {})
+        if resource not in credentials:
+            if resource is None:
+                cred, subscription_id, _ = profile.get_login_credentials()
+            else:
+                cred, subscription_id, _ = profile.get_login_credentials(resource=resource)
+            credentials[resource] = (CachedTokenCredentials(cred), subscription_id)
+        return credentials[resource]
+
+def _token_expiry(token):
+    """Return the expiry timestamp of a CLI token, 0 if unknown."""
+    expires_on = token.get('expiresOn') if isinstance(token, dict) else None
+    if isinstance(expires_on, (str, type(u''))):
+        for date_format in ('%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S'):
+            try:
+                expires_on = datetime.datetime.strptime(expires_on, date_format)
+                break
+            except ValueError:
+                pass
+    if isinstance(expires_on, datetime.datetime):
+        # Local time, as written by ADAL.
+        return time.mktime(expires_on.timetuple())
+    return 0
+
+class CachedTokenCredentials(object):
+    """Credentials of the CLI reusing their token until `refresh_margin` seconds
+    before it expires, rather than asking the CLI for it on each request.
+
+    Other credentials are used as they are.
+
+    .. versionadded:: 1.1.6
+
+    :param credentials: The credentials returned by the CLI profile
+    :param int refresh_margin: Seconds before the expiry at which a new token is asked for
+    """
+
+    def __init__(self, credentials, refresh_margin=300):
+        self._credentials = credentials
+        self.refresh_margin = refresh_margin
+        self._token = None
+        self._expires_on = 0
+        self._lock = threading.Lock()
+
+    def _get_token(self, refresh=False):
+        with self._lock:
+            if refresh or self._token is None or time.time() >= self._expires_on - self.refresh_margin:
+                scheme, token, full_token = self._credentials._token_retriever()  # pylint: disable=protected-access
+                self._token = (scheme, token)
+                self._expires_on = _token_expiry(full_token)
+            return self._token
+
+    def signed_session(self):
+        """Return a requests session with the Authorization header of the cached token.
+
+        :rtype: requests.Session
+        """
+        if not hasattr(self._credentials, '_token_retriever'):
+            return self._credentials.signed_session()
+        return self._session(self._get_token())
+
+    def refresh_session(self):
+        """Return a requests session with a new token.
+
+        :rtype: requests.Session
+        """
+        if not hasattr(self._credentials, '_token_retriever'):
+            return self._credentials.refresh_session()
+        return self._session(self._get_token(refresh=True))
+
+    @staticmethod
+    def _session(token):
+        session = requests.Session()
+        session.headers['Authorization'] = '{} {}'.format(*token)
+        return session
+
+    def __getattr__(self, name):
+        return getattr(self._credentials, name)
 
 
 try:
@@ -0,0 +1,395 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Time and size of the operations of the generated clients.
+
+.. versionadded:: 1.1.6
+"""
+import collections
+import math
+import random
+import sys
+import threading
+import types
+from timeit import default_timer
+
+from msrest.paging import Paged
+
+_local = threading.local()
+
+
+class OperationRecord(object):
+    """The measures of an operation call, or of a page of a list operation.
+
+    The times are in seconds. `serialize` is the time of the Serializer
+    calls building the URL, query, headers and body, `auth` the time
+    signing the requests, including the signing done by the sessions while
+    sending them, `network` the rest of the time sending them and reading
+    the response bodies, and `deserialize` the time of the Deserializer
+    calls. The bodies of streamed responses are read by the caller, out of
+    the record.
+
+    :ivar str operation: The operation group and method, such as
+     'resource_groups.get', or the method of an operation of the client.
+    :ivar int status_code: The status of the last response, or None.
+    :ivar int requests: The number of requests sent.
+    :ivar int bytes_out: The size of the request bodies.
+    :ivar int bytes_in: The size of the response bodies.
+    :ivar float duration: The time of the whole call.
+    :ivar error: The exception raised by the call, or None.
+    """
+
+    __slots__ = ('operation', 'status_code', 'requests', 'bytes_out', 'bytes_in',
+                 'serialize', 'auth', 'network', 'deserialize', 'duration', 'error')
+
+    def __init__(self, operation):
+        self.operation = operation
+        self.status_code = None
+        self.requests = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.serialize = 0.0
+        self.auth = 0.0
+        self.network = 0.0
+        self.deserialize = 0.0
+        self.duration = 0.0
+        self.error = None
+
+
+def _body_size(body):
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, type(u'')):
+        return len(body.encode('utf-8'))
+    return 0
+
+
+def _timed(function, measure):
+    """Add the time of the calls of `function` made during an operation to
+    the `measure` of its record."""
+    def timed(*args, **kwargs):
+        record = getattr(_local, 'record', None)
+        if record is None:
+            return function(*args, **kwargs)
+        start = default_timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            setattr(record, measure, getattr(record, measure) + default_timer() - start)
+    return timed
+
+
+class _TimedSerializer(object):
+    """A Serializer adding its time to the operation records."""
+
+    def __init__(self, serializer):
+        self._serializer = serializer
+        for name in ('url', 'query', 'header', 'body'):
+            setattr(self, name, _timed(getattr(serializer, name), 'serialize'))
+
+    def __getattr__(self, name):
+        return getattr(self._serializer, name)
+
+
+class _TimedDeserializer(object):
+    """A Deserializer adding its time to the operation records."""
+
+    def __init__(self, deserializer):
+        self._deserializer = deserializer
+        self._call = _timed(deserializer, 'deserialize')
+
+    def __call__(self, target_obj, response_data):
+        return self._call(target_obj, response_data)
+
+    def __getattr__(self, name):
+        return getattr(self._deserializer, name)
+
+
+def _timed_session(create_session):
+    """Time the creation of a session, and the signing it does when sending
+    a request: its `auth` handler, such as the `SharedKeyAuth` of Batch, or
+    the token added by an `OAuth2Session`."""
+    create_session = _timed(create_session, 'auth')
+
+    def timed_session():
+        session = create_session()
+        if session.auth is not None:
+            session.auth = _timed(session.auth, 'auth')
+        oauth_client = getattr(session, '_client', None)
+        if oauth_client is not None and hasattr(oauth_client, 'add_token'):
+            oauth_client.add_token = _timed(oauth_client.add_token, 'auth')
+        return session
+    return timed_session
+
+
+class _TimedCredentials(object):
+    """Credentials adding the time signing the sessions and their requests
+    to the operation records."""
+
+    def __init__(self, credentials):
+        self._credentials = credentials
+        self.signed_session = _timed_session(credentials.signed_session)
+        if hasattr(credentials, 'refresh_session'):
+            self.refresh_session = _timed_session(credentials.refresh_session)
+
+    def __getattr__(self, name):
+        return getattr(self._credentials, name)
+
+
+class Instrumentation(object):
+    """Record the operations of clients and pass each `OperationRecord` to
+    a callback, once the call returns.
+
+    A list operation is recorded page by page, as the pages are fetched,
+    each record having the name of the operation. The status requests of
+    long running operations, made by the poller, and the pages fetched ahead
+    by `paging_prefetch_depth` are not recorded.
+
+    Clients not instrumented do no measure at all, and those instrumented do
+    not either while `enabled` is False.
+
+    :param callable callback: Called with each `OperationRecord`, on the
+     thread of the call. An exception raised by it is propagated to the
+     caller.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.enabled = True
+
+    def _operation(self, name, method):
+        def instrumented(*args, **kwargs):
+            if not self.enabled or getattr(_local, 'record', None) is not None:
+                return method(*args, **kwargs)
+            return self._record(name, method, args, kwargs)
+        instrumented.__name__ = method.__name__
+        instrumented.__doc__ = method.__doc__
+        return instrumented
+
+    def _record(self, name, function, args, kwargs):
+        record = _local.record = OperationRecord(name)
+        start = default_timer()
+        try:
+            result = function(*args, **kwargs)
+        except StopIteration:
+            raise
+        except Exception as err:
+            record.error = err
+            raise
+        finally:
+            record.duration = default_timer() - start
+            _local.record = None
+            if record.error is not None:
+                self.callback(record)
+        if isinstance(result, Paged):
+            # A list operation only creates its Paged result: its pages are
+            # recorded instead.
+            self._instrument_paged(name, result)
+        else:
+            self.callback(record)
+        return result
+
+    def _instrument_paged(self, name, paged):
+        advance_page = paged.advance_page
+
+        def instrumented_advance_page():
+            if not self.enabled or getattr(_local, 'record', None) is not None:
+                return advance_page()
+            return self._record(name, advance_page, (), {})
+        paged.advance_page = instrumented_advance_page
+        paged._derserializer = _TimedDeserializer(paged._derserializer)  # pylint: disable=protected-access
+
+    def _send(self, send):
+        def instrumented_send(request, headers=None, content=None, **config):
+            record = getattr(_local, 'record', None)
+            if record is None:
+                return send(request, headers, content, **config)
+            auth = record.auth
+            start = default_timer()
+            try:
+                response = send(request, headers, content, **config)
+                # The body is read here, unless streamed, so that its
+                # transfer is network time rather than deserialization time.
+                if config.get('stream'):
+                    size = int(response.headers.get('Content-Length') or 0)
+                else:
+                    size = len(response.content or b'')
+            finally:
+                # The signing done while sending is auth time.
+                record.network += default_timer() - start - (record.auth - auth)
+                record.requests += 1
+                record.bytes_out += _body_size(request.data)
+            record.status_code = response.status_code
+            record.bytes_in += size
+            return response
+        return instrumented_send
+
+    def instrument_group(self, name, group):
+        """Record the operations of an operation group.
+
+        :param str name: The name of the group on its client.
+        :param group: The operation group.
+        """
+        # The groups of multi API clients use the timed ones of the client.
+        if not isinstance(group._serialize, _TimedSerializer):  # pylint: disable=protected-access
+            group._serialize = _TimedSerializer(group._serialize)  # pylint: disable=protected-access
+        if not isinstance(group._deserialize, _TimedDeserializer):  # pylint: disable=protected-access
+            group._deserialize = _TimedDeserializer(group._deserialize)  # pylint: disable=protected-access
+        for method_name, method in vars(type(group)).items():
+            if isinstance(method, types.FunctionType) and not method_name.startswith('_'):
+                setattr(group, method_name, self._operation(
+                    '{}.{}'.format(name, method_name), getattr(group, method_name)))
+
+    def instrument(self, client):
+        """Record the operations of a client.
+
+        The operation groups already created, and those created later by
+        multi API clients, are recorded.
+
+        :param client: A generated client.
+        """
+        service_client = client._client  # pylint: disable=protected-access
+        service_client.send = self._send(service_client.send)
+        service_client.creds = _TimedCredentials(service_client.creds)
+        for name, value in list(vars(client).items()):
+            if not name.startswith('_') and hasattr(value, '_serialize'):
+                self.instrument_group(name, value)
+        for cls in type(client).__mro__[:-1]:
+            for name, method in vars(cls).items():
+                if isinstance(method, types.FunctionType) and not name.startswith('_') and name not in vars(client):
+                    setattr(client, name, self._operation(name, getattr(client, name)))
+        client._serialize = _TimedSerializer(client._serialize)  # pylint: disable=protected-access
+        client._deserialize = _TimedDeserializer(client._deserialize)  # pylint: disable=protected-access
+        # Used by the operation_group properties of multi API clients.
+        client._instrumentation = self  # pylint: disable=protected-access
+
+
+def use_instrumentation(client, instrumentation=None):
+    """Record the operations of a client.
+
+    :param client: A generated client.
+    :param Instrumentation instrumentation: The instrumentation, which can
+     be shared by several clients, or None for a new one passing the
+     records to a `LatencyAggregator`.
+    :return: The instrumentation.
+    :rtype: Instrumentation
+    """
+    instrumentation = instrumentation if instrumentation is not None else Instrumentation(LatencyAggregator())
+    instrumentation.instrument(client)
+    return instrumentation
+
+
+def _percentile(ordered, percent):
+    return ordered[max(0, int(math.ceil(percent / 100.0 * len(ordered))) - 1)]
+
+
+class _OperationStatistics(object):
+    """The running totals of the records of an operation, and a uniform
+    sample of their durations."""
+
+    __slots__ = ('count', 'errors', 'serialize', 'auth', 'network', 'deserialize',
+                 'bytes_out', 'bytes_in', 'durations')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.serialize = 0.0
+        self.auth = 0.0
+        self.network = 0.0
+        self.deserialize = 0.0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.durations = []
+
+    def add(self, record, sample_size, random):
+        self.count += 1
+        if record.error is not None:
+            self.errors += 1
+        self.serialize += record.serialize
+        self.auth += record.auth
+        self.network += record.network
+        self.deserialize += record.deserialize
+        self.bytes_out += record.bytes_out
+        self.bytes_in += record.bytes_in
+        # Reservoir sampling: each duration is kept with the same probability.
+        if len(self.durations) < sample_size:
+            self.durations.append(record.duration)
+        else:
+            index = random.randrange(self.count)
+            if index < sample_size:
+                self.durations[index] = record.duration
+
+
+class LatencyAggregator(object):
+    """An `Instrumentation` callback aggregating the records per operation.
+
+    Only running totals are kept, the records themselves are not. The
+    percentiles are computed from a uniform sample of at most `sample_size`
+    durations per operation.
+
+    :param int sample_size: The number of durations kept per operation.
+    """
+
+    def __init__(self, sample_size=1024):
+        self.sample_size = sample_size
+        self._operations = collections.defaultdict(_OperationStatistics)
+        self._random = random.Random()
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            self._operations[record.operation].add(record, self.sample_size, self._random)
+
+    def clear(self):
+        """Remove all records."""
+        with self._lock:
+            self._operations.clear()
+
+    def summary(self):
+        """Return the statistics of each operation.
+
+        For each operation name: the `count` of records and of `errors`,
+        the `p50` and `p99` durations, the mean `serialize`, `auth`,
+        `network` and `deserialize` times, all in seconds, and the total
+        `bytes_out` and `bytes_in`.
+
+        :rtype: dict
+        """
+        summary = {}
+        with self._lock:
+            for name, operation in self._operations.items():
+                count = operation.count
+                durations = sorted(operation.durations)
+                summary[name] = {
+                    'count': count,
+                    'errors': operation.errors,
+                    'p50': _percentile(durations, 50),
+                    'p99': _percentile(durations, 99),
+                    'serialize': operation.serialize / count,
+                    'auth': operation.auth / count,
+                    'network': operation.network / count,
+                    'deserialize': operation.deserialize / count,
+                    'bytes_out': operation.bytes_out,
+                    'bytes_in': operation.bytes_in,
+                }
+        return summary
+
+    def report(self, output=None):
+        """Print the statistics of each operation, in milliseconds.
+
+        :param output: A text file, the standard output if None.
+        """
+        output = output if output is not None else sys.stdout
+        columns = ('count', 'errors', 'p50', 'p99', 'serialize', 'auth', 'network', 'deserialize',
+                   'bytes_out', 'bytes_in')
+        summary = self.summary()
+        width = max([len('operation')] + [len(name) for name in summary])
+        output.write('{:<{}}'.format('operation', width) + ''.join(
+            ' {:>11}'.format(column) for column in columns) + '\n')
+        for name in sorted(summary):
+            statistics = summary[name]
+            output.write('{:<{}} {:>11} {:>11}'.format(name, width, statistics['count'], statistics['errors']))
+            output.write(''.join(' {:>11.2f}'.format(statistics[column] * 1000) for column in columns[2:-2]))
+            output.write(' {:>11} {:>11}\n'.format(statistics['bytes_out'], statistics['bytes_in']))
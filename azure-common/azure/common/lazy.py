@@ -0,0 +1,93 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Lazy loading of the attributes of a package.
+
+.. versionadded:: 1.1.6
+"""
+import importlib
+import sys
+import types
+
+# Modules replaced in sys.modules on Python < 3.5, kept alive so that their
+# globals are not cleared.
+_replaced = []
+
+
+class _LazyModule(types.ModuleType):
+    """Module importing its lazy attributes on first access."""
+
+    def __getattr__(self, name):
+        # Only called when the attribute is not already in the module dict.
+        lazy = self.__dict__.get('_lazy_attributes', {})
+        if name in lazy:
+            module_name, attribute = lazy[name]
+            value = self._lazy_import(module_name)
+            if attribute is not None:
+                value = getattr(value, attribute)
+        else:
+            alias = self.__dict__.get('_lazy_alias')
+            if alias is None or name.startswith('__') and name != '__all__':
+                raise AttributeError("module {!r} has no attribute {!r}".format(self.__name__, name))
+            value = getattr(self._lazy_import(alias), name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        names = set(self.__dict__)
+        names.update(self.__dict__.get('_lazy_attributes', ()))
+        alias = self.__dict__.get('_lazy_alias')
+        if alias is not None:
+            names.update(dir(self._lazy_import(alias)))
+        return sorted(names)
+
+    def _lazy_import(self, module_name):
+        # Relative names are resolved like in an import statement of the
+        # module: from its package.
+        return importlib.import_module(module_name, self.__dict__.get('__package__') or self.__name__)
+
+
+def _make_lazy(module_name):
+    module = sys.modules[module_name]
+    if isinstance(module, _LazyModule):
+        return module
+    if sys.version_info >= (3, 5):
+        module.__class__ = _LazyModule
+        return module
+    lazy = _LazyModule(module_name)
+    lazy.__dict__.update(module.__dict__)
+    _replaced.append(module)
+    sys.modules[module_name] = lazy
+    return lazy
+
+
+def lazy_module(module_name, attributes=None, submodules=(), alias=None):
+    """Make the attributes of a module load on first access.
+
+    Call it at the end of the module, usually a package `__init__`, in place
+    of the imports it defers::
+
+        lazy_module(__name__, {'WebSiteManagementClient': '.web_site_management_client'},
+                    submodules=['models'])
+
+    :param str module_name: The name of the module, `__name__`.
+    :param dict attributes: Maps each lazy attribute name to the module,
+     relative to `module_name` or absolute, defining an attribute of the same
+     name.
+    :param submodules: Names of submodules to import on first access as
+     attributes of the package.
+    :type submodules: list of str
+    :param str alias: A module, relative to `module_name` or absolute, every
+     other attribute is taken from, for modules which re-export another one
+     with `from module import *`.
+    """
+    module = _make_lazy(module_name)
+    lazy = module.__dict__.setdefault('_lazy_attributes', {})
+    for name, source in (attributes or {}).items():
+        lazy[name] = (source, name)
+    for name in submodules:
+        lazy[name] = ('.' + name, None)
+    if alias is not None:
+        module._lazy_alias = alias
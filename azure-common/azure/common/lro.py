@@ -0,0 +1,282 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Polling of long running operations from a shared scheduler thread.
+
+.. versionadded:: 1.1.6
+"""
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+
+def operation_poller(send_cmd, output_cmd, update_cmd, timeout, operation_config):
+    """Start a long running operation of a generated operation group.
+
+    Without `long_running_operation_engine` in `operation_config`, this is an
+    `AzureOperationPoller`, polling from a thread of its own. Otherwise the
+    operation is submitted to that engine and a `Future` of the deserialized
+    resource is returned.
+
+    :param callable send_cmd: The request starting the operation.
+    :param callable output_cmd: The function deserializing the resource.
+    :param callable update_cmd: The request getting the operation status.
+    :param int timeout: Seconds between status requests, when the service
+     does not send a Retry-After header.
+    :param dict operation_config: The configuration of the operation call.
+    """
+    update_cmd = _status_request(update_cmd)
+    engine = operation_config.get('long_running_operation_engine')
+    if engine is None:
+        from msrestazure.azure_operation import AzureOperationPoller
+        return AzureOperationPoller(send_cmd, output_cmd, update_cmd, timeout)
+    return engine.submit(send_cmd, output_cmd, update_cmd, timeout)
+
+
+_polling = threading.local()
+
+
+def is_polling():
+    """Whether the current thread is sending a status request of a long
+    running operation, which must not be answered from a cache.
+
+    :rtype: bool
+    """
+    return getattr(_polling, 'active', False)
+
+
+def _status_request(update_cmd):
+    def update(*args, **kwargs):
+        _polling.active = True
+        try:
+            return update_cmd(*args, **kwargs)
+        finally:
+            _polling.active = False
+    return update
+
+
+class _PendingOperation(object):
+    """The polling state of one long running operation.
+
+    Each call to `step` makes the next request of the operation, following
+    the same sequence as `AzureOperationPoller`, and makes exactly one.
+    """
+
+    def __init__(self, future, send_cmd, output_cmd, update_cmd, timeout):
+        self.future = future
+        self.send_cmd = send_cmd
+        self.output_cmd = output_cmd
+        self.update_cmd = update_cmd
+        self.timeout = timeout
+        self.response = None
+        self.operation = None
+        self.initial_url = None
+        self.final_get = False
+
+    def step(self):
+        """Make the next request of the operation.
+
+        :return: The delay in seconds before the next step, or None once the
+         operation is done.
+        :raises: BadStatus, BadResponse or OperationFailed.
+        """
+        from msrestazure.azure_operation import (
+            BadResponse, LongRunningOperation, OperationFailed, failed, finished)
+
+        operation = self.operation
+        if operation is None:
+            self.response = self.send_cmd()
+            operation = self.operation = LongRunningOperation(self.response, self.output_cmd)
+            operation.set_initial_status(self.response)
+            self.initial_url = self.response.request.url
+            return None if finished(operation.status) else self._delay()
+
+        if self.final_get:
+            self.response = self.update_cmd(self.initial_url)
+            operation.get_status_from_resource(self.response)
+            return None
+        if operation.async_url:
+            self.response = self.update_cmd(operation.async_url, self._polling_cookie())
+            operation.set_async_url_if_present(self.response)
+            operation.get_status_from_async(self.response)
+        elif operation.location_url:
+            self.response = self.update_cmd(operation.location_url, self._polling_cookie())
+            operation.set_async_url_if_present(self.response)
+            operation.get_status_from_location(self.response)
+        elif operation.method == 'PUT':
+            self.response = self.update_cmd(self.initial_url, self._polling_cookie())
+            operation.set_async_url_if_present(self.response)
+            operation.get_status_from_resource(self.response)
+        else:
+            raise BadResponse('Location header is missing from long running operation.')
+
+        if not finished(operation.status):
+            return self._delay()
+        if failed(operation.status):
+            raise OperationFailed("Operation failed or cancelled")
+        if operation.should_do_final_get():
+            self.final_get = True
+            return 0
+        return None
+
+    def _delay(self):
+        retry_after = self.response.headers.get('retry-after')
+        try:
+            return int(retry_after)
+        except (TypeError, ValueError):
+            return self.timeout
+
+    def _polling_cookie(self):
+        # Like AzureOperationPoller, only the test server gets its cookie back.
+        host = urlparse(self.response.request.url).hostname.strip('.')
+        if host == 'localhost':
+            return {'cookie': self.response.headers.get('set-cookie', '')}
+        return {}
+
+    def error(self, err):
+        """Convert the error raised by `step` to the one of the future."""
+        from msrestazure.azure_exceptions import CloudError
+        from msrestazure.azure_operation import BadResponse, BadStatus, OperationFailed
+
+        if isinstance(err, (BadStatus, OperationFailed)):
+            return CloudError(self.response)
+        if isinstance(err, BadResponse):
+            return CloudError(self.response, str(err))
+        return err
+
+
+class LongRunningOperationEngine(object):
+    """Drive many long running operations from a single scheduler thread.
+
+    Pending operations are kept in a heap ordered by the time of their next
+    request. The scheduler thread waits for the earliest one and hands the
+    request to a small pool of workers, so a slow status request does not
+    delay the others. The delay between status requests is the Retry-After
+    header of the last response, or the `timeout` of the operation.
+
+    An engine is used by passing it as `long_running_operation_engine` in the
+    `operation_config` of any long running operation of a management client::
+
+        engine = LongRunningOperationEngine()
+        futures = [client.virtual_networks.create_or_update(
+                       group, name, parameters, long_running_operation_engine=engine)
+                   for name, parameters in networks]
+        concurrent.futures.wait(futures)
+
+    The operation then returns a `concurrent.futures.Future` of the
+    deserialized resource instead of an `AzureOperationPoller`. The initial
+    request is made by the engine as well: the operation can be cancelled
+    until it is sent, and its errors are raised by the future.
+
+    :param int max_workers: The number of threads making the requests.
+    """
+
+    def __init__(self, max_workers=4):
+        self._executor = ThreadPoolExecutor(max_workers)
+        self._condition = threading.Condition()
+        self._heap = []
+        self._counter = itertools.count()
+        self._pending = 0
+        self._shutdown = False
+        self._thread = None
+
+    def submit(self, send_cmd, output_cmd, update_cmd, timeout=30):
+        """Start a long running operation.
+
+        :param callable send_cmd: The request starting the operation.
+        :param callable output_cmd: The function deserializing the resource.
+        :param callable update_cmd: The request getting the operation status.
+        :param int timeout: Seconds between status requests, when the
+         service does not send a Retry-After header.
+        :rtype: concurrent.futures.Future
+        :raises: RuntimeError if the engine is shut down.
+        """
+        future = Future()
+        operation = _PendingOperation(future, send_cmd, output_cmd, update_cmd, timeout)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('cannot submit an operation after shutdown')
+            self._pending += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='LongRunningOperationEngine')
+                self._thread.daemon = True
+                self._thread.start()
+            self._schedule(operation, 0)
+        return future
+
+    def shutdown(self, wait=True):
+        """Stop accepting operations. The scheduler thread stops once the
+        pending operations are done.
+
+        :param bool wait: Whether to wait for the pending operations.
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify()
+            thread = self._thread
+        if wait:
+            if thread is not None:
+                thread.join()
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def _schedule(self, operation, delay):
+        # Called with the condition held.
+        heapq.heappush(self._heap, (time.time() + delay, next(self._counter), operation))
+        if self._heap[0][2] is operation:
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._shutdown and not self._pending:
+                        self._executor.shutdown(wait=False)
+                        return
+                    if self._heap:
+                        delay = self._heap[0][0] - time.time()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                operation = heapq.heappop(self._heap)[2]
+            self._executor.submit(self._step, operation)
+
+    def _step(self, operation):
+        future = operation.future
+        if operation.operation is None and not future.set_running_or_notify_cancel():
+            self._done()
+            return
+        try:
+            delay = operation.step()
+        except Exception as err:  # pylint: disable=broad-except
+            future.set_exception(operation.error(err))
+            self._done()
+            return
+        if delay is None:
+            future.set_result(operation.operation.resource)
+            self._done()
+            return
+        with self._condition:
+            self._schedule(operation, delay)
+
+    def _done(self):
+        with self._condition:
+            self._pending -= 1
+            self._condition.notify()
@@ -0,0 +1,65 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Helpers shared by the management clients supporting several API versions.
+
+.. versionadded:: 1.1.6
+"""
+import threading
+
+_serializers = {}
+_serializers_lock = threading.Lock()
+
+
+def get_serializers(models):
+    """Return the Serializer and Deserializer of a models module.
+
+    The model map of a module is built once and the resulting Serializer and
+    Deserializer, which keep no state between calls, are shared by every
+    client using that module. They are those of `azure.common.compiled`.
+
+    :param models: A models module, such as the one returned by the `models`
+     class method of a multi API client.
+    :return: A (Serializer, Deserializer) tuple.
+    """
+    try:
+        return _serializers[models.__name__]
+    except KeyError:
+        pass
+    from .compiled import Serializer, Deserializer
+    with _serializers_lock:
+        if models.__name__ not in _serializers:
+            client_models = {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+            _serializers[models.__name__] = (Serializer(client_models), Deserializer(client_models))
+        return _serializers[models.__name__]
+
+
+class operation_group(object):
+    """Decorator making an operation group property of a client compute its
+    value once per client instance.
+
+    The value is stored in the instance dictionary under the name of the
+    property, so later accesses are plain attribute lookups. The operation
+    group is chosen according to the `api_version` of the client at the time
+    of the first access.
+
+    The group of a client instrumented by `azure.common.instrumentation`
+    records its operations.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.__name__ = function.__name__
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.function(instance)
+        instrumentation = instance.__dict__.get('_instrumentation')
+        if instrumentation is not None:
+            instrumentation.instrument_group(self.__name__, value)
+        instance.__dict__[self.__name__] = value
+        return value
@@ -0,0 +1,202 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Paged results of the generated list operations.
+
+.. versionadded:: 1.1.6
+"""
+import json
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+_option_classes = {}
+_option_classes_lock = threading.Lock()
+
+
+def operation_paged(paged_class, command, dependencies, config, operation_config):
+    """Create the `Paged` result of a list operation of a generated operation
+    group.
+
+    The next pages are fetched ahead of the consumer, on a background thread,
+    when `paging_prefetch_depth` is set in `operation_config`, or else on the
+    configuration of the client. Its value is the number of pages fetched
+    ahead of the current one.
+
+    With `paging_raw_items=True` in `operation_config`, the items are the
+    dictionaries of the response JSON instead of models, see `write_ndjson`.
+
+    :param type paged_class: The generated `Paged` class of the operation.
+    :param callable command: The function getting a page from its link.
+    :param dict dependencies: The model classes of the deserializer.
+    :param config: The configuration of the client.
+    :param dict operation_config: The configuration of the operation call.
+    """
+    depth = operation_config.get(
+        'paging_prefetch_depth', getattr(config, 'paging_prefetch_depth', 0))
+    raw_items = operation_config.get('paging_raw_items', False)
+    if not depth and not raw_items:
+        paged = paged_class(command, dependencies)
+    else:
+        paged = paged_class_with_options(paged_class)(command, dependencies, depth, raw_items)
+    # The compiled Deserializer of the client, see azure.common.compiled.
+    deserializer = getattr(dependencies, 'deserializer', None)
+    if deserializer is not None:
+        paged._derserializer = deserializer  # pylint: disable=protected-access
+    return paged
+
+
+def write_ndjson(paged, output):
+    """Write the items of a paged result to newline delimited JSON, one
+    item per line, page by page.
+
+    The items not consumed yet are written, starting with the rest of the
+    current page.
+
+    :param paged: The result of a list operation called with
+     `paging_raw_items=True`.
+    :type paged: msrest.paging.Paged
+    :param output: A path or a text file.
+    :return: The number of items written.
+    :rtype: int
+    """
+    if not hasattr(output, 'write'):
+        with open(output, 'w') as stream:
+            return write_ndjson(paged, stream)
+    dumps = json.JSONEncoder(separators=(',', ':')).encode
+    page = paged.current_page[paged._current_page_iter_index:]  # pylint: disable=protected-access
+    count = 0
+    while True:
+        if page:
+            output.write('\n'.join(dumps(item) for item in page))
+            output.write('\n')
+            count += len(page)
+        try:
+            page = paged.advance_page()
+        except StopIteration:
+            return count
+
+
+class _PagePrefetcher(object):
+    """Fetch the pages following a link on a background thread.
+
+    At most `depth` pages wait in the queue, so the thread stops fetching
+    while the consumer is behind.
+    """
+
+    def __init__(self, command, next_link_key, depth):
+        self._command = command
+        self._next_link_key = next_link_key
+        self._depth = depth
+        self._pages = None
+        self._stopped = None
+        self._expected_link = None
+
+    def get(self, link):
+        """Return the (response, data) of the page at `link`."""
+        if self._pages is None or link != self._expected_link:
+            self.stop()
+            self._pages = queue.Queue(self._depth)
+            self._stopped = threading.Event()
+            thread = threading.Thread(
+                target=self._fetch, name='PagePrefetcher',
+                args=(link, self._pages, self._stopped))
+            thread.daemon = True
+            thread.start()
+        response, data, next_link, error = self._pages.get()
+        if error is not None:
+            self.stop()
+            raise error
+        self._expected_link = next_link
+        return response, data
+
+    def stop(self):
+        if self._stopped is not None:
+            self._stopped.set()
+        self._pages = None
+
+    def _fetch(self, link, pages, stopped):
+        while link is not None and not stopped.is_set():
+            try:
+                response = self._command(link)
+                data = response.json() if response.content else None
+                next_link = data.get(self._next_link_key) if isinstance(data, dict) else None
+                page = (response, data, next_link, None)
+            except Exception as err:  # pylint: disable=broad-except
+                page, next_link = (None, None, None, err), None
+            while not stopped.is_set():
+                try:
+                    pages.put(page, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            link = next_link
+
+
+class _PagedWithOptions(object):
+    """Mixin of the `Paged` classes fetching their pages ahead, or keeping
+    the items of the response JSON."""
+
+    def __init__(self, command, classes, depth=0, raw_items=False):
+        super(_PagedWithOptions, self).__init__(command, classes)
+        self._raw_items = raw_items
+        self._items_key = self._json_key('current_page')
+        self._next_link_key = self._json_key('next_link')
+        self._prefetcher = _PagePrefetcher(command, self._next_link_key, depth) if depth else None
+
+    @classmethod
+    def _json_key(cls, attribute):
+        return cls._attribute_map[attribute]['key'].replace('\\.', '.')
+
+    def advance_page(self):
+        if self.next_link is None:
+            raise StopIteration("End of paging")
+        self._current_page_iter_index = 0
+        if self._prefetcher is not None:
+            self._response, data = self._prefetcher.get(self.next_link)
+        else:
+            self._response = self._get_next(self.next_link)
+            data = self._response.json() if self._response.content else None
+        self._load_page(self._response, data)
+        return self.current_page
+
+    def _load_page(self, response, data):
+        """Set the current page and the next link from a page response and
+        its parsed JSON."""
+        if not self._raw_items:
+            self._derserializer(self, data if data is not None else response)
+        elif isinstance(data, dict):
+            self.current_page = data.get(self._items_key) or []
+            self.next_link = data.get(self._next_link_key)
+        else:
+            self.current_page, self.next_link = [], None
+
+    def __del__(self):
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+
+
+def paged_class_with_options(paged_class):
+    """Return the subclass of a `Paged` class supporting the options of
+    `operation_paged`.
+
+    It takes the prefetch depth and whether to keep the raw items as third
+    and fourth parameters.
+
+    :param type paged_class: A `Paged` class.
+    :rtype: type
+    """
+    try:
+        return _option_classes[paged_class]
+    except KeyError:
+        pass
+    with _option_classes_lock:
+        if paged_class not in _option_classes:
+            _option_classes[paged_class] = type(
+                paged_class.__name__, (_PagedWithOptions, paged_class), {})
+        return _option_classes[paged_class]
@@ -0,0 +1,276 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Cache of the results of the GET operations of a client, revalidated with
+conditional requests.
+
+.. versionadded:: 1.1.6
+"""
+import collections
+import threading
+import time
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .lro import is_polling
+
+_MISSING = object()
+
+
+def _cache_key(url, partition=None):
+    """The partition of the client, the scheme and host of a URL, its path,
+    which ARM compares without case, and its sorted query parameters."""
+    parsed = urlparse(url)
+    return (partition, '{}://{}'.format(parsed.scheme, parsed.netloc).lower(), parsed.path.rstrip('/').lower(),
+            tuple(sorted(parsed.query.split('&'))) if parsed.query else ())
+
+
+class _Entry(object):
+    """A cached response, and the result deserialized from it."""
+
+    __slots__ = ('key', 'etag', 'status_code', 'headers', 'content', 'encoding',
+                 'stored', 'target', 'deserialized', 'generation')
+
+    def __init__(self, key, response, generation):
+        self.key = key
+        self.generation = generation
+        self.etag = response.headers.get('ETag')
+        self.status_code = response.status_code
+        self.headers = dict(response.headers)
+        self.content = response.content
+        self.encoding = response.encoding
+        self.stored = time.time()
+        self.target = None
+        self.deserialized = _MISSING
+
+    def response(self, request, headers=None):
+        """A response with the cached content, and the headers of the
+        response revalidating it, if any."""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        if headers is not None:
+            response.headers.update(
+                (name, value) for name, value in headers.items() if name.lower() != 'content-length')
+        response._content = self.content  # pylint: disable=protected-access
+        response.encoding = self.encoding
+        response.request = request
+        response.url = request.url
+        response._response_cache_entry = self  # pylint: disable=protected-access
+        return response
+
+
+class ResponseCache(object):
+    """An LRU cache of the results of the GET operations of clients.
+
+    A result is stored when an operation deserializes a 200 response to a
+    GET request. The next GET request for the same URL and query sends the
+    `If-None-Match` header when the response had an `ETag`, and returns the
+    stored result on a 304 response. A result without `ETag` is returned
+    without a request for `ttl` seconds.
+
+    A request with another method, such as PUT, PATCH, POST or DELETE,
+    removes the results of its URL, of the URLs under it and of the URLs
+    above it, such as the virtual network of a subnet, before it is sent
+    and once answered. The responses to GET requests sent before a removal
+    are not stored, as they may predate the write. The status requests of
+    long running operations are never answered from the cache.
+
+    The results of clients with different credentials are kept apart, so
+    that a result returned without a request was obtained with the same
+    credentials.
+
+    The cached results are shared by the callers: copy them before changing
+    them. Use `use_response_cache` to cache the results of a client, and
+    `response_cache=False` in the `operation_config` of a call to bypass
+    the cache.
+
+    :param int max_entries: The number of results kept, the least recently
+     used being removed first.
+    :param float ttl: The seconds for which a result without ETag is
+     returned without a request. Such results are not cached when 0.
+    """
+
+    def __init__(self, max_entries=1024, ttl=0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._not_modified = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # Incremented by each invalidation: results requested before are
+        # not stored.
+        self._generation = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                if entry.etag is None and time.time() - entry.stored >= self.ttl:
+                    return None
+                self._entries[key] = entry
+            return entry
+
+    def _store(self, entry):
+        with self._lock:
+            if entry.generation != self._generation:
+                return
+            self._entries.pop(entry.key, None)
+            self._entries[entry.key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, url):
+        """Remove the results of a URL, of the URLs under it and of those
+        above it.
+
+        :param str url: The URL of a resource.
+        """
+        _, origin, path, _ = _cache_key(url)
+        with self._lock:
+            self._generation += 1
+            for key in list(self._entries):
+                if key[1] == origin and (
+                        key[2] == path or key[2].startswith(path + '/') or path.startswith(key[2] + '/')):
+                    del self._entries[key]
+                    self._invalidations += 1
+
+    def clear(self):
+        """Remove all results."""
+        with self._lock:
+            self._entries.clear()
+
+    def statistics(self):
+        """Return the counters of the cache.
+
+        `hits` are the results returned without a request, `not_modified`
+        those revalidated by a 304 response and `misses` the GET requests
+        answered with a new response.
+
+        :rtype: dict
+        """
+        with self._lock:
+            lookups = self._hits + self._not_modified + self._misses
+            return {
+                'entries': len(self._entries),
+                'hits': self._hits,
+                'not_modified': self._not_modified,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'hit_rate': float(self._hits + self._not_modified) / lookups if lookups else 0.0,
+            }
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def send(self, send, request, headers=None, content=None, partition=None, **config):
+        """Send a request with the `send` method of a `ServiceClient`,
+        through the cache.
+
+        :param partition: The results are only shared between the requests
+         of the same partition, such as the credentials of a client.
+        """
+        use_cache = config.pop('response_cache', True)
+        if request.method not in ('GET', 'HEAD'):
+            # Again once answered: a GET answered during the write may
+            # have been stored meanwhile.
+            self.invalidate(request.url)
+            try:
+                return send(request, headers, content, **config)
+            finally:
+                self.invalidate(request.url)
+        if request.method != 'GET' or config.get('stream') or not use_cache or is_polling():
+            return send(request, headers, content, **config)
+
+        key = _cache_key(request.url, partition)
+        generation = self._generation
+        entry = self._get(key)
+        if entry is not None:
+            if entry.etag is None:
+                self._count('_hits')
+                return entry.response(request)
+            headers = dict(headers or {}, **{'If-None-Match': entry.etag})
+        response = send(request, headers, content, **config)
+        if entry is not None and response.status_code == 304:
+            self._count('_not_modified')
+            entry.generation = generation
+            self._store(entry)
+            return entry.response(response.request or request, response.headers)
+        self._count('_misses')
+        if response.status_code == 200 and (self.ttl > 0 or response.headers.get('ETag')):
+            # Stored once deserialized, so that the responses of the status
+            # requests of long running operations are not.
+            response._response_cache_entry = _Entry(key, response, generation)  # pylint: disable=protected-access
+        return response
+
+    def deserialize(self, deserializer, target_obj, response_data):
+        """Deserialize a response with `deserializer`, or return the result
+        cached for it."""
+        entry = getattr(response_data, '_response_cache_entry', None)
+        if entry is None:
+            return deserializer(target_obj, response_data)
+        if entry.target == target_obj and entry.deserialized is not _MISSING:
+            return entry.deserialized
+        result = deserializer(target_obj, response_data)
+        entry.target, entry.deserialized = target_obj, result
+        self._store(entry)
+        return result
+
+
+class _CachingDeserializer(object):
+    """A Deserializer returning the results cached for the responses."""
+
+    def __init__(self, deserializer, cache):
+        self._deserializer = deserializer
+        self._cache = cache
+
+    def __call__(self, target_obj, response_data):
+        return self._cache.deserialize(self._deserializer, target_obj, response_data)
+
+    def __getattr__(self, name):
+        return getattr(self._deserializer, name)
+
+
+def use_response_cache(client, cache=None):
+    """Cache the results of the GET operations of a client.
+
+    The operation groups already created, and those created later by multi
+    API clients, use the cache. A cache can be shared by several clients.
+
+    :param client: A generated client.
+    :param ResponseCache cache: The cache, a new `ResponseCache` with its
+     default settings if None.
+    :return: The cache.
+    :rtype: ResponseCache
+    """
+    cache = cache if cache is not None else ResponseCache()
+    service_client = client._client  # pylint: disable=protected-access
+    send = service_client.send
+
+    def cached_send(request, headers=None, content=None, **config):
+        return cache.send(send, request, headers, content, service_client.creds, **config)
+    service_client.send = cached_send
+    _use_deserializer(client, cache)
+    return cache
+
+
+def _use_deserializer(client, cache):
+    deserializer = _CachingDeserializer(client._deserialize, cache)  # pylint: disable=protected-access
+    client._deserialize = deserializer  # pylint: disable=protected-access
+    for value in list(vars(client).values()):
+        if hasattr(value, '_deserialize') and not isinstance(value._deserialize, _CachingDeserializer):  # pylint: disable=protected-access
+            value._deserialize = deserializer  # pylint: disable=protected-access
@@ -0,0 +1,266 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Adaptive limits on the requests of management clients, following the
+request budget Azure Resource Manager reports for each subscription.
+
+.. versionadded:: 1.1.6
+"""
+import re
+import threading
+import time
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+_SUBSCRIPTION = re.compile(r'/subscriptions/([^/?#]+)', re.IGNORECASE)
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+class _Budget(object):
+    """The requests of one kind, reads, writes or deletes, to one
+    subscription.
+
+    The permitted number of requests in flight grows by one for each
+    `permitted` successful requests and is halved by a 429 response, which
+    also holds the following requests for its Retry-After delay. Once the
+    remaining budget reported by the service falls under `reserve`, the
+    requests are sent one at a time, spaced to spread the remaining budget
+    over `window` seconds.
+    """
+
+    def __init__(self, kind, max_concurrency, reserve, window, default_retry_after):
+        self.kind = kind
+        self.max_concurrency = max_concurrency
+        self.reserve = reserve
+        self.window = window
+        self.default_retry_after = default_retry_after
+        self.limit = max_concurrency
+        self.successes = 0
+        self.remaining = None
+        self.in_flight = 0
+        self.queued = 0
+        self.blocked_until = 0.0
+        self.next_start = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.queued_seconds = 0.0
+        self._condition = threading.Condition(threading.Lock())
+
+    def _constrained(self):
+        return self.remaining is not None and self.remaining < self.reserve
+
+    def permitted(self):
+        return 1 if self._constrained() else self.limit
+
+    def interval(self):
+        return float(self.window) / max(self.remaining, 1) if self._constrained() else 0.0
+
+    def acquire(self):
+        start = time.time()
+        with self._condition:
+            self.queued += 1
+            try:
+                while True:
+                    now = time.time()
+                    ready = max(self.blocked_until, self.next_start)
+                    if self.in_flight < self.permitted() and now >= ready:
+                        break
+                    self._condition.wait(ready - now if now < ready else None)
+            finally:
+                self.queued -= 1
+            self.in_flight += 1
+            self.requests += 1
+            self.next_start = now + self.interval()
+            self.queued_seconds += now - start
+
+    def release(self, response):
+        with self._condition:
+            self.in_flight -= 1
+            if response is not None:
+                remaining = _remaining(response, self.kind)
+                if remaining is not None:
+                    self.remaining = remaining
+                if response.status_code == 429:
+                    self.throttled += 1
+                    self.limit = max(1, self.limit // 2)
+                    self.successes = 0
+                    self.blocked_until = max(self.blocked_until, time.time() + _retry_after(
+                        response, self.default_retry_after))
+                elif response.status_code < 500 and self.limit < self.max_concurrency:
+                    self.successes += 1
+                    if self.successes >= self.limit:
+                        self.limit += 1
+                        self.successes = 0
+            self._condition.notify_all()
+
+    def metrics(self):
+        with self._condition:
+            return {
+                'remaining': self.remaining,
+                'permitted': self.permitted(),
+                'in_flight': self.in_flight,
+                'queued': self.queued,
+                'interval': self.interval(),
+                'blocked_for': max(0.0, self.blocked_until - time.time()),
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'queued_seconds': self.queued_seconds,
+            }
+
+
+def _remaining(response, kind):
+    for scope in ('subscription', 'tenant'):
+        value = response.headers.get('x-ms-ratelimit-remaining-{}-{}'.format(scope, kind))
+        if value is not None:
+            try:
+                return int(value)
+            except ValueError:
+                pass
+    return None
+
+
+def _retry_after(response, default):
+    try:
+        return max(0.0, float(response.headers['Retry-After']))
+    except (KeyError, ValueError):
+        return default
+
+
+class ThrottlingLimiter(object):
+    """The limits on the requests to one subscription, reads, writes and
+    deletes being counted separately as by Azure Resource Manager.
+
+    Callers wait in `send` for their request to be permitted rather than
+    being throttled. A request still answered with 429 is sent again after
+    the Retry-After delay, up to `max_retries` times.
+
+    :param int max_concurrency: The most requests of each kind in flight.
+    :param int reserve_reads: The remaining read budget under which reads
+     are spaced.
+    :param int reserve_writes: The remaining write budget under which
+     writes are spaced.
+    :param int reserve_deletes: The remaining delete budget under which
+     deletes are spaced.
+    :param float window: The seconds over which the service renews the
+     budget.
+    :param int max_retries: The number of times a throttled request is sent
+     again.
+    :param float default_retry_after: The seconds waited after a 429
+     response without Retry-After header.
+    """
+
+    def __init__(self, max_concurrency=16, reserve_reads=500, reserve_writes=50,
+                 reserve_deletes=500, window=3600, max_retries=3, default_retry_after=5):
+        self._parameters = {
+            'max_concurrency': max_concurrency, 'reserve_reads': reserve_reads,
+            'reserve_writes': reserve_writes, 'reserve_deletes': reserve_deletes, 'window': window,
+            'max_retries': max_retries, 'default_retry_after': default_retry_after}
+        self.max_retries = max_retries
+        self.reads = _Budget('reads', max_concurrency, reserve_reads, window, default_retry_after)
+        self.writes = _Budget('writes', max_concurrency, reserve_writes, window, default_retry_after)
+        self.deletes = _Budget('deletes', max_concurrency, reserve_deletes, window, default_retry_after)
+
+    def _budget(self, method):
+        if method in ('GET', 'HEAD'):
+            return self.reads
+        return self.deletes if method == 'DELETE' else self.writes
+
+    def send(self, send, request, headers=None, content=None, **config):
+        """Send a request with the `send` method of a `ServiceClient`, once
+        permitted."""
+        budget = self._budget(request.method)
+        attempt = 0
+        while True:
+            budget.acquire()
+            response = None
+            try:
+                response = send(request, headers, content, **config)
+            finally:
+                budget.release(response)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+            # Give the connection back before waiting to send again.
+            response.close()
+            attempt += 1
+
+    def metrics(self):
+        """Return the current budget and limits of reads, writes and
+        deletes.
+
+        For each kind: the `remaining` budget last reported by the service,
+        the `permitted` requests in flight, the requests `in_flight` and
+        `queued`, the `interval` in seconds between requests, the seconds
+        the requests are `blocked_for` after a 429 response, and the total
+        `requests`, `throttled` responses and `queued_seconds`.
+
+        :rtype: dict
+        """
+        return {'reads': self.reads.metrics(), 'writes': self.writes.metrics(),
+                'deletes': self.deletes.metrics()}
+
+
+def get_limiter(subscription_id, host=None, **kwargs):
+    """Return the limiter shared by the clients of a subscription, creating
+    it with `kwargs`, the parameters of `ThrottlingLimiter`, if needed.
+
+    :param str subscription_id: The subscription, or None for the requests
+     outside of subscriptions.
+    :param str host: The host of the requests outside of subscriptions,
+     which share one limiter per host.
+    :rtype: ThrottlingLimiter
+    :raises: ValueError if the limiter exists with other values of the
+     parameters given.
+    """
+    if subscription_id:
+        key = ('subscription', subscription_id.lower())
+    else:
+        key = ('host', host.lower() if host else None)
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = ThrottlingLimiter(**kwargs)
+            return _limiters[key]
+        limiter = _limiters[key]
+    conflicts = sorted(name for name, value in kwargs.items()
+                       if limiter._parameters.get(name, value) != value)  # pylint: disable=protected-access
+    if conflicts:
+        raise ValueError('The limiter of {} {} already exists with {}'.format(
+            key[0], key[1], ', '.join('{}={!r}'.format(
+                name, limiter._parameters[name]) for name in conflicts)))  # pylint: disable=protected-access
+    return limiter
+
+
+def use_throttling_limiter(client, **kwargs):
+    """Send the requests of a client through the limiter of the
+    subscription in their URL, shared with the other clients using it.
+    Requests outside of subscriptions share a limiter per host.
+
+    :param client: A generated client.
+    :param kwargs: The parameters of `ThrottlingLimiter`, used if the
+     limiter is created.
+    :return: The client.
+    :raises: ValueError if the limiter of the subscription of the client
+     exists with other values of the parameters given.
+    """
+    service_client = client._client  # pylint: disable=protected-access
+    send = service_client.send
+    subscription_id = getattr(client.config, 'subscription_id', None)
+    if subscription_id and kwargs:
+        # Fail now rather than on the first request.
+        get_limiter(subscription_id, **kwargs)
+
+    def limited_send(request, headers=None, content=None, **config):
+        match = _SUBSCRIPTION.search(request.url or '')
+        if match:
+            limiter = get_limiter(match.group(1), **kwargs)
+        else:
+            limiter = get_limiter(None, host=urlparse(request.url or '').netloc, **kwargs)
+        return limiter.send(send, request, headers, content, **config)
+    service_client.send = limited_send
+    return client
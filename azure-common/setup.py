@@ -60,7 +60,14 @@ setup(
     extras_require={
         'autorest':[
             'msrestazure>=0.4.0,<0.5.0',
-        ]
+        ],
+        # azure.common.aio uses the async syntax: it requires Python 3.5 or
+        # later, and byte-compiling it fails, harmlessly, when the package
+        # is installed on earlier versions.
+        "aio:python_version>='3.5'": [
+            'aiohttp>=3.3',
+        ],
+        ":python_version<'3.0'": ['futures'],
     },
     cmdclass=cmdclass
 )
@@ -0,0 +1,48 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Responses and errors answered by the fake services of the tests, in
+place of the `send` method of a `ServiceClient`.
+"""
+import json
+
+import requests
+
+_batch_deserializer = []
+
+
+def make_response(body, status_code=200, request=None, headers=None):
+    """A response with a JSON body.
+
+    :param body: The object serialized as the body.
+    :param int status_code: The status code.
+    :param request: The request answered, if any.
+    :param dict headers: Headers added to the JSON content type.
+    :rtype: requests.Response
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.request = request
+    response.headers['content-type'] = 'application/json'
+    response.headers.update(headers or {})
+    response._content = json.dumps(body).encode('utf-8')  # pylint: disable=protected-access
+    return response
+
+
+def batch_error(status_code, code):
+    """A Batch service error, as raised by the operations of the client.
+
+    :param int status_code: The status code of the response.
+    :param str code: The error code.
+    :rtype: azure.batch.models.BatchErrorException
+    """
+    from msrest import Deserializer
+    import azure.batch.models as models
+    if not _batch_deserializer:
+        _batch_deserializer.append(Deserializer(
+            {k: v for k, v in models.__dict__.items() if isinstance(v, type)}))
+    response = make_response({'code': code, 'message': {'lang': 'en-US', 'value': code}}, status_code)
+    response.reason = 'Error'
+    return models.BatchErrorException(_batch_deserializer[0], response)
@@ -0,0 +1,92 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Run a scenario many times from several threads and measure it, for
+instance against a `testutils.replay_server.ReplayServer`.
+"""
+import math
+import sys
+import threading
+from timeit import default_timer
+
+
+class LoadResult(object):
+    """The measures of a load run.
+
+    :ivar int iterations: The number of scenario runs.
+    :ivar list errors: The exceptions raised by the failed runs.
+    :ivar float elapsed: The seconds of the whole load run.
+    :ivar list latencies: The seconds of each run, sorted.
+    """
+
+    def __init__(self, iterations, errors, elapsed, latencies):
+        self.iterations = iterations
+        self.errors = errors
+        self.elapsed = elapsed
+        self.latencies = sorted(latencies)
+
+    @property
+    def throughput(self):
+        """The runs per second."""
+        return self.iterations / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percent):
+        """Return the run duration under which `percent` of the runs are.
+
+        :rtype: float
+        """
+        if not self.latencies:
+            return 0.0
+        return self.latencies[max(0, int(math.ceil(percent / 100.0 * len(self.latencies))) - 1)]
+
+    def report(self, name, output=None):
+        """Print the measures on one line.
+
+        :param str name: The name of the scenario.
+        :param output: A text file, the standard output if None.
+        """
+        output = output if output is not None else sys.stdout
+        output.write('{:<40} {:>6} runs {:>4} errors {:>9.1f} runs/s p50 {:>8.2f} ms p99 {:>8.2f} ms\n'.format(
+            name, self.iterations, len(self.errors), self.throughput,
+            self.percentile(50) * 1000, self.percentile(99) * 1000))
+
+
+def run_load(scenario, iterations=100, concurrency=8):
+    """Run a scenario `iterations` times, `concurrency` runs at once.
+
+    :param callable scenario: Called without parameter for each run. A run
+     raising an exception is counted as an error.
+    :param int iterations: The number of runs.
+    :param int concurrency: The number of threads running the scenario.
+    :rtype: LoadResult
+    """
+    lock = threading.Lock()
+    remaining = [iterations]
+    errors = []
+    latencies = []
+
+    def worker():
+        while True:
+            with lock:
+                if not remaining[0]:
+                    return
+                remaining[0] -= 1
+            start = default_timer()
+            try:
+                scenario()
+            except Exception as err:  # pylint: disable=broad-except
+                with lock:
+                    errors.append(err)
+            latency = default_timer() - start
+            with lock:
+                latencies.append(latency)
+
+    threads = [threading.Thread(target=worker) for _ in range(min(concurrency, iterations))]
+    start = default_timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return LoadResult(iterations, errors, default_timer() - start, latencies)
@@ -0,0 +1,231 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Local HTTP server answering with the interactions of recorded cassettes.
+
+    python -m testutils.replay_server [--port P] [--latency S] [--concurrency N] CASSETTE...
+"""
+import argparse
+import re
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlsplit
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlsplit
+
+import yaml
+
+# Response headers describing the recorded transfer rather than the content.
+_TRANSFER_HEADERS = ('connection', 'content-length', 'content-encoding', 'transfer-encoding', 'keep-alive')
+
+
+def _request_keys(method, uri):
+    """The keys matching a request: with its sorted query, and without."""
+    parts = urlsplit(uri)
+    # As the URIs of the recordings, see RecordingTestCase._scrub_sensitive_request_info.
+    path = re.sub('(?<!:)//', '/', parts.path).rstrip('/').lower()
+    query = tuple(sorted(parts.query.split('&'))) if parts.query else ()
+    return (method.upper(), path, query), (method.upper(), path)
+
+
+class _Response(object):
+
+    __slots__ = ('status', 'message', 'headers', 'body')
+
+    def __init__(self, response, origins, base_url):
+        self.status = response['status']['code']
+        self.message = response['status'].get('message')
+        body = response.get('body', {}).get('string') or b''
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+        self.headers = []
+        for name, values in response.get('headers', {}).items():
+            if name.lower() not in _TRANSFER_HEADERS:
+                self.headers.extend((name, self._rewrite(value, origins, base_url)) for value in values)
+        self.body = self._rewrite(body, [origin.encode('utf-8') for origin in origins], base_url.encode('utf-8'))
+
+    @staticmethod
+    def _rewrite(value, origins, base_url):
+        # The next links and operation URLs point to the server.
+        for origin in origins:
+            value = value.replace(origin, base_url)
+        return value
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # The status line, headers and body are written separately: with Nagle's
+    # algorithm the body waits for the client's delayed ACK of the headers,
+    # about 40 ms per response on a kept-alive connection.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.replay._count('connections')  # pylint: disable=protected-access
+
+    def replay(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        response = self.server.replay._respond(self.command, self.path)  # pylint: disable=protected-access
+        self.send_response(response.status, response.message)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(response.body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(response.body)
+
+    do_GET = do_HEAD = do_PUT = do_POST = do_PATCH = do_DELETE = replay
+
+    def log_message(self, *args):
+        pass
+
+
+class ReplayServer(object):
+    """An HTTP server on localhost answering with the recorded interactions
+    of vcrpy cassettes, such as those of azure-mgmt/tests/recordings.
+
+    A request gets the response of the recorded request with the same
+    method, path and query, ignoring the case of the path, or else with the
+    same method and path. The responses recorded for the same request, such
+    as the status of a long running operation, are returned in turn, the
+    first one again after the last one. The URLs of the recorded hosts in
+    the responses are replaced with `base_url`, so that next links and
+    operation status URLs point to the server. An unknown request gets a 404
+    response.
+
+    :param list cassettes: The paths of the cassettes.
+    :param float latency: The seconds waited before each response.
+    :param int max_concurrency: The number of requests answered at once,
+     the others waiting, or None for no limit.
+    :param str host: The address of the server.
+    :param int port: The port of the server, any free one if 0.
+    """
+
+    def __init__(self, cassettes, latency=0, max_concurrency=None, host='127.0.0.1', port=0):
+        self.latency = latency
+        self._server = _Server((host, port), _Handler)
+        self._server.replay = self
+        self.base_url = 'http://{}:{}'.format(*self._server.server_address[:2])
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._lock = threading.Lock()
+        self._counters = {'connections': 0, 'requests': 0, 'unmatched': 0}
+        self._thread = None
+        self._responses = {}
+        self._next = {}
+        for cassette in cassettes:
+            self.load(cassette)
+        self._not_found = _Response({
+            'status': {'code': 404, 'message': 'Not Found'},
+            'headers': {'Content-Type': ['application/json']},
+            'body': {'string': '{"error": {"code": "NotRecorded", "message": "No recorded response"}}'},
+        }, [], self.base_url)
+
+    def load(self, cassette):
+        """Add the interactions of a cassette.
+
+        :param str cassette: The path of the cassette.
+        """
+        with open(cassette) as stream:
+            interactions = yaml.safe_load(stream)['interactions']
+        origins = set()
+        for interaction in interactions:
+            parts = urlsplit(interaction['request']['uri'])
+            origins.add('{}://{}'.format(parts.scheme, parts.netloc))
+        origins = sorted(origins, key=len, reverse=True)
+        with self._lock:
+            for interaction in interactions:
+                request = interaction['request']
+                response = _Response(interaction['response'], origins, self.base_url)
+                for key in _request_keys(request['method'], request['uri']):
+                    self._responses.setdefault(key, []).append(response)
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _respond(self, method, path):
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            with self._lock:
+                self._counters['requests'] += 1
+                for key in _request_keys(method, path):
+                    responses = self._responses.get(key)
+                    if responses:
+                        index = self._next.get(key, 0)
+                        self._next[key] = (index + 1) % len(responses)
+                        return responses[index]
+                self._counters['unmatched'] += 1
+                return self._not_found
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    def statistics(self):
+        """Return the number of `connections` accepted, of `requests`
+        answered and of `unmatched` requests.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def start(self):
+        """Serve the requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name='ReplayServer')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the server."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the interactions of recorded cassettes.')
+    parser.add_argument('cassettes', nargs='+', help='paths of the cassettes')
+    parser.add_argument('--port', type=int, default=8080, help='port of the server')
+    parser.add_argument('--latency', type=float, default=0, help='seconds waited before each response')
+    parser.add_argument('--concurrency', type=int, default=None, help='requests answered at once')
+    args = parser.parse_args()
+
+    server = ReplayServer(args.cassettes, args.latency, args.concurrency, port=args.port)
+    print('Serving {} cassettes on {}'.format(len(args.cassettes), server.base_url))
+    try:
+        server._server.serve_forever()  # pylint: disable=protected-access
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(server.statistics())
+
+
+if __name__ == '__main__':
+    main()
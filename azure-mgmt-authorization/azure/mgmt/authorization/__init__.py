@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .authorization_management_client import AuthorizationManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['AuthorizationManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'AuthorizationManagementClient': '.authorization_management_client'},
+    submodules=['models', 'operations'])
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -93,7 +94,9 @@ class PermissionsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.PermissionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.PermissionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -174,7 +177,9 @@ class PermissionsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.PermissionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.PermissionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -113,7 +114,9 @@ class RoleAssignmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RoleAssignmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RoleAssignmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -186,7 +189,9 @@ class RoleAssignmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RoleAssignmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RoleAssignmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -639,7 +644,9 @@ class RoleAssignmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RoleAssignmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RoleAssignmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -711,7 +718,9 @@ class RoleAssignmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RoleAssignmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RoleAssignmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .batch_management_client import BatchManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['BatchManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'BatchManagementClient': '.batch_management_client'},
+    submodules=['models', 'operations'])
@@ -10,7 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
+from azure.common.compiled import Serializer, Deserializer
 from msrestazure import AzureConfiguration
 from .version import VERSION
 from .operations.batch_account_operations import BatchAccountOperations
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -370,7 +371,9 @@ class ApplicationOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ApplicationPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ApplicationPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .billing_management_client import BillingManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['BillingManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'BillingManagementClient': '.billing_management_client'},
+    submodules=['models', 'operations'])
@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -106,7 +107,9 @@ class BillingPeriodsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.BillingPeriodPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.BillingPeriodPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
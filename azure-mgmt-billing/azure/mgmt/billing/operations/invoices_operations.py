@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -114,7 +115,9 @@ class InvoicesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.InvoicePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.InvoicePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .cdn_management_client import CdnManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['CdnManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'CdnManagementClient': '.cdn_management_client'},
+    submodules=['models', 'operations'])
@@ -10,11 +10,12 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
+from azure.common.compiled import Serializer, Deserializer
 from msrestazure import AzureConfiguration
 from .version import VERSION
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.paging import operation_paged
 import uuid
 from .operations.profiles_operations import ProfilesOperations
 from .operations.endpoints_operations import EndpointsOperations
@@ -254,7 +255,9 @@ class CdnManagementClient(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceUsagePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceUsagePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -311,7 +314,9 @@ class CdnManagementClient(object):
             return response
 
         # Deserialize response
-        deserialized = models.OperationPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.OperationPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
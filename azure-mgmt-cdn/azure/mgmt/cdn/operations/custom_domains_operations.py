@@ -10,7 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -98,7 +99,9 @@ class CustomDomainsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.CustomDomainPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.CustomDomainPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -280,9 +283,10 @@ class CustomDomainsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, profile_name, endpoint_name, custom_domain_name, custom_headers=None, raw=False, **operation_config):
@@ -374,6 +378,7 @@ class CustomDomainsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
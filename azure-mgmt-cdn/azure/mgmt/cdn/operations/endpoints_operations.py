@@ -10,7 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -93,7 +94,9 @@ class EndpointsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.EndpointPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.EndpointPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -266,9 +269,10 @@ class EndpointsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def update(
             self, resource_group_name, profile_name, endpoint_name, endpoint_update_properties, custom_headers=None, raw=False, **operation_config):
@@ -369,9 +373,10 @@ class EndpointsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, profile_name, endpoint_name, custom_headers=None, raw=False, **operation_config):
@@ -452,9 +457,10 @@ class EndpointsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def start(
             self, resource_group_name, profile_name, endpoint_name, custom_headers=None, raw=False, **operation_config):
@@ -542,9 +548,10 @@ class EndpointsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def stop(
             self, resource_group_name, profile_name, endpoint_name, custom_headers=None, raw=False, **operation_config):
@@ -632,9 +639,10 @@ class EndpointsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def purge_content(
             self, resource_group_name, profile_name, endpoint_name, content_paths, custom_headers=None, raw=False, **operation_config):
@@ -723,9 +731,10 @@ class EndpointsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def load_content(
             self, resource_group_name, profile_name, endpoint_name, content_paths, custom_headers=None, raw=False, **operation_config):
@@ -814,9 +823,10 @@ class EndpointsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def validate_custom_domain(
             self, resource_group_name, profile_name, endpoint_name, host_name, custom_headers=None, raw=False, **operation_config):
@@ -961,7 +971,9 @@ class EndpointsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceUsagePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceUsagePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -10,7 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -97,7 +98,9 @@ class OriginsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.OriginPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.OriginPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -274,6 +277,7 @@ class OriginsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
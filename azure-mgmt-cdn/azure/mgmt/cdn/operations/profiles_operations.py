@@ -10,7 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -85,7 +86,9 @@ class ProfilesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ProfilePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ProfilePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -150,7 +153,9 @@ class ProfilesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ProfilePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ProfilePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -314,9 +319,10 @@ class ProfilesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def update(
             self, resource_group_name, profile_name, tags, custom_headers=None, raw=False, **operation_config):
@@ -410,9 +416,10 @@ class ProfilesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, profile_name, custom_headers=None, raw=False, **operation_config):
@@ -490,9 +497,10 @@ class ProfilesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def generate_sso_uri(
             self, resource_group_name, profile_name, custom_headers=None, raw=False, **operation_config):
@@ -623,7 +631,9 @@ class ProfilesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceUsagePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceUsagePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
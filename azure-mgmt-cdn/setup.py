@@ -75,7 +75,7 @@ setup(
     ],
     install_requires=[
         'msrestazure~=0.4.7',
-        'azure-common~=1.1.5',
+        'azure-common~=1.1.6',
     ],
     cmdclass=cmdclass
 )
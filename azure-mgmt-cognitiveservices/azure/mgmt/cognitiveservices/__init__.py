@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .cognitive_services_management_client import CognitiveServicesManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['CognitiveServicesManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'CognitiveServicesManagementClient': '.cognitive_services_management_client'},
+    submodules=['models', 'operations'])
@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -92,7 +93,9 @@ class AccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.CognitiveServicesAccountPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.CognitiveServicesAccountPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -155,7 +158,9 @@ class AccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.CognitiveServicesAccountPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.CognitiveServicesAccountPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .usage_management_client import UsageManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['UsageManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'UsageManagementClient': '.usage_management_client'},
+    submodules=['models', 'operations'])
@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -108,7 +109,9 @@ class UsageAggregatesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.UsageAggregationPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.UsageAggregationPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -5,8 +5,15 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .compute import ComputeManagementClient
-from .containerservice import ContainerServiceClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __version__ = VERSION
+
+lazy_module(
+    __name__,
+    {
+        'ComputeManagementClient': '.compute',
+        'ContainerServiceClient': '.containerservice',
+    },
+    submodules=['models'])
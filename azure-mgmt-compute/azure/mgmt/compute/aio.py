@@ -0,0 +1,21 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""asyncio counterparts of the compute management clients.
+
+Each client takes the parameters of its synchronous counterpart and an
+optional `transport`, an :class:`azure.common.aio.AioHttpTransport` by
+default. Requires Python 3.5 or later, see :mod:`azure.common.aio`.
+"""
+from azure.common.aio import async_client
+
+from . import (
+    ComputeManagementClient as _ComputeManagementClient,
+    ContainerServiceClient as _ContainerServiceClient,
+)
+
+ComputeManagementClient = async_client(_ComputeManagementClient)
+ContainerServiceClient = async_client(_ContainerServiceClient)
@@ -5,4 +5,9 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .compute_management_client import ComputeManagementClient
\ No newline at end of file
+from azure.common.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    {'ComputeManagementClient': '.compute_management_client'},
+    submodules=['models'])
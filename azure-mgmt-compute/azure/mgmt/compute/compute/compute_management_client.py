@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from ..version import VERSION
 
 
@@ -73,10 +73,8 @@ class ComputeManagementClient(object):
         self.config = ComputeManagementClientConfiguration(credentials, subscription_id, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     @classmethod
     def models(cls, api_version='2016-04-30-preview'):
@@ -91,7 +89,7 @@ class ComputeManagementClient(object):
             return models
         raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def availability_sets(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import AvailabilitySetsOperations as OperationClass
@@ -103,7 +101,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def disks(self):
         if self.api_version == '2016-04-30-preview':
             from .v2016_04_30_preview.operations import DisksOperations as OperationClass
@@ -111,7 +109,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def images(self):
         if self.api_version == '2016-04-30-preview':
             from .v2016_04_30_preview.operations import ImagesOperations as OperationClass
@@ -119,7 +117,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def snapshots(self):
         if self.api_version == '2016-04-30-preview':
             from .v2016_04_30_preview.operations import SnapshotsOperations as OperationClass
@@ -127,7 +125,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def usage(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import UsageOperations as OperationClass
@@ -139,7 +137,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_machine_extension_images(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualMachineExtensionImagesOperations as OperationClass
@@ -151,7 +149,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_machine_extensions(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualMachineExtensionsOperations as OperationClass
@@ -163,7 +161,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_machine_images(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualMachineImagesOperations as OperationClass
@@ -175,7 +173,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_machine_scale_set_vms(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualMachineScaleSetVMsOperations as OperationClass
@@ -187,7 +185,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_machine_scale_sets(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualMachineScaleSetsOperations as OperationClass
@@ -199,7 +197,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_machine_sizes(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualMachineSizesOperations as OperationClass
@@ -211,7 +209,7 @@ class ComputeManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_machines(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualMachinesOperations as OperationClass
@@ -4,4 +4,6 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
-from .v2016_04_30_preview.models import *
\ No newline at end of file
+from azure.common.lazy import lazy_module
+
+lazy_module(__name__, alias='.v2016_04_30_preview.models')
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -286,7 +287,9 @@ class AvailabilitySetsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AvailabilitySetPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AvailabilitySetPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -356,7 +359,9 @@ class AvailabilitySetsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.VirtualMachineSizePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.VirtualMachineSizePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -126,9 +127,10 @@ class VirtualMachinesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def create_or_update(
             self, resource_group_name, vm_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -221,9 +223,10 @@ class VirtualMachinesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, vm_name, custom_headers=None, raw=False, **operation_config):
@@ -306,9 +309,10 @@ class VirtualMachinesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, vm_name, expand=None, custom_headers=None, raw=False, **operation_config):
@@ -462,9 +466,10 @@ class VirtualMachinesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def generalize(
             self, resource_group_name, vm_name, custom_headers=None, raw=False, **operation_config):
@@ -587,7 +592,9 @@ class VirtualMachinesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.VirtualMachinePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.VirtualMachinePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -652,7 +659,9 @@ class VirtualMachinesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.VirtualMachinePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.VirtualMachinePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -722,7 +731,9 @@ class VirtualMachinesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.VirtualMachineSizePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.VirtualMachineSizePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -814,9 +825,10 @@ class VirtualMachinesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def restart(
             self, resource_group_name, vm_name, custom_headers=None, raw=False, **operation_config):
@@ -899,9 +911,10 @@ class VirtualMachinesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def start(
             self, resource_group_name, vm_name, custom_headers=None, raw=False, **operation_config):
@@ -984,9 +997,10 @@ class VirtualMachinesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def redeploy(
             self, resource_group_name, vm_name, custom_headers=None, raw=False, **operation_config):
@@ -1069,6 +1083,7 @@ class VirtualMachinesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
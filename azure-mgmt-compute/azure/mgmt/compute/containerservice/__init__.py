@@ -5,4 +5,9 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .container_service_client import ContainerServiceClient
\ No newline at end of file
+from azure.common.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    {'ContainerServiceClient': '.container_service_client'},
+    submodules=['models'])
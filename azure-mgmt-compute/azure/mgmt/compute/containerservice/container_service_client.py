@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from ..version import VERSION
 
 
@@ -76,10 +76,8 @@ class ContainerServiceClient(object):
         self.config = ContainerServiceClientConfiguration(credentials, subscription_id, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     @classmethod
     def models(cls, api_version = '2017-01-31'):
@@ -89,7 +87,7 @@ class ContainerServiceClient(object):
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def container_services(self):
         if self.api_version =='2017-01-31':
             from .v2017_01_31.operations import ContainerServicesOperations as OperationClass
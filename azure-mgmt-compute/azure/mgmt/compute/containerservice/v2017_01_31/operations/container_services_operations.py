@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -95,7 +96,9 @@ class ContainerServicesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ContainerServicePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ContainerServicePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -201,9 +204,10 @@ class ContainerServicesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, container_service_name, custom_headers=None, raw=False, **operation_config):
@@ -354,9 +358,10 @@ class ContainerServicesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_by_resource_group(
             self, resource_group_name, custom_headers=None, raw=False, **operation_config):
@@ -420,7 +425,9 @@ class ContainerServicesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ContainerServicePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ContainerServicePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -69,7 +69,7 @@ setup(
     zip_safe=False,
     packages=find_packages(),
     install_requires=[
-        'azure-common~=1.1.5',
+        'azure-common~=1.1.6',
         'msrestazure~=0.4.7',
     ],
     cmdclass=cmdclass
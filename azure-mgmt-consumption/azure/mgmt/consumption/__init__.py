@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .consumption_management_client import ConsumptionManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['ConsumptionManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'ConsumptionManagementClient': '.consumption_management_client'},
+    submodules=['models', 'operations'])
@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -120,7 +121,9 @@ class UsageDetailsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.UsageDetailPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.UsageDetailPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .container_registry_management_client import ContainerRegistryManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['ContainerRegistryManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'ContainerRegistryManagementClient': '.container_registry_management_client'},
+    submodules=['models', 'operations'])
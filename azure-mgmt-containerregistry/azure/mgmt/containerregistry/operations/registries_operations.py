@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -255,9 +256,10 @@ class RegistriesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, registry_name, custom_headers=None, raw=False, **operation_config):
@@ -443,7 +445,9 @@ class RegistriesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RegistryPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RegistryPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -506,7 +510,9 @@ class RegistriesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RegistryPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RegistryPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1,8 +1,12 @@
-﻿from .account import DataLakeAnalyticsAccountManagementClient
-from .catalog import DataLakeAnalyticsCatalogManagementClient
-from .job import DataLakeAnalyticsJobManagementClient
-
+﻿from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {
+        'DataLakeAnalyticsAccountManagementClient': '.account',
+        'DataLakeAnalyticsCatalogManagementClient': '.catalog',
+        'DataLakeAnalyticsJobManagementClient': '.job',
+    })
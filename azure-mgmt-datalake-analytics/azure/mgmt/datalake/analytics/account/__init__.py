@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .data_lake_analytics_account_management_client import DataLakeAnalyticsAccountManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['DataLakeAnalyticsAccountManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'DataLakeAnalyticsAccountManagementClient': '.data_lake_analytics_account_management_client'},
+    submodules=['models', 'operations'])
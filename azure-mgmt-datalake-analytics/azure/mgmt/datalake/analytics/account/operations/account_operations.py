@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -125,7 +126,9 @@ class AccountOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DataLakeAnalyticsAccountPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DataLakeAnalyticsAccountPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -221,7 +224,9 @@ class AccountOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DataLakeAnalyticsAccountPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DataLakeAnalyticsAccountPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -370,9 +375,10 @@ class AccountOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def create(
             self, resource_group_name, account_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -469,9 +475,10 @@ class AccountOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def update(
             self, resource_group_name, account_name, parameters=None, custom_headers=None, raw=False, **operation_config):
@@ -570,6 +577,7 @@ class AccountOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -452,7 +453,9 @@ class StorageAccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.StorageContainerPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.StorageContainerPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -532,7 +535,9 @@ class StorageAccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SasTokenInfoPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SasTokenInfoPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -637,7 +642,9 @@ class StorageAccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.StorageAccountInfoPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.StorageAccountInfoPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
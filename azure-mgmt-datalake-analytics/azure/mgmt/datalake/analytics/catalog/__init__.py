@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .data_lake_analytics_catalog_management_client import DataLakeAnalyticsCatalogManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['DataLakeAnalyticsCatalogManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'DataLakeAnalyticsCatalogManagementClient': '.data_lake_analytics_catalog_management_client'},
+    submodules=['models', 'operations'])
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -744,7 +745,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlCredentialPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlCredentialPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -917,7 +920,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlExternalDataSourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlExternalDataSourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1093,7 +1098,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlProcedurePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlProcedurePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1267,7 +1274,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTablePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTablePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1374,7 +1383,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTableStatisticsPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTableStatisticsPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1551,7 +1562,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTableTypePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTableTypePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1726,7 +1739,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlPackagePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlPackagePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1900,7 +1915,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlViewPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlViewPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2084,7 +2101,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTableStatisticsPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTableStatisticsPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2268,7 +2287,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTablePartitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTablePartitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2374,7 +2395,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTypePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTypePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2555,7 +2578,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTableValuedFunctionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTableValuedFunctionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2725,7 +2750,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlAssemblyClrPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlAssemblyClrPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2893,7 +2920,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlSchemaPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlSchemaPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2997,7 +3026,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTableStatisticsPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTableStatisticsPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -3100,7 +3131,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTablePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTablePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -3204,7 +3237,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlTableValuedFunctionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlTableValuedFunctionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -3307,7 +3342,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlViewPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlViewPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -3469,7 +3506,9 @@ class CatalogOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.USqlDatabasePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.USqlDatabasePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .data_lake_analytics_job_management_client import DataLakeAnalyticsJobManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['DataLakeAnalyticsJobManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'DataLakeAnalyticsJobManagementClient': '.data_lake_analytics_job_management_client'},
+    submodules=['models', 'operations'])
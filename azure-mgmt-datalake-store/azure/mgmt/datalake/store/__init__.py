@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .data_lake_store_account_management_client import DataLakeStoreAccountManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['DataLakeStoreAccountManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'DataLakeStoreAccountManagementClient': '.data_lake_store_account_management_client'},
+    submodules=['models', 'operations'])
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .dev_test_labs_client import DevTestLabsClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['DevTestLabsClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'DevTestLabsClient': '.dev_test_labs_client'},
+    submodules=['models', 'operations'])
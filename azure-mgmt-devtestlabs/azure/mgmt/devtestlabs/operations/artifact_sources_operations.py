@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -114,7 +115,9 @@ class ArtifactSourcesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ArtifactSourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ArtifactSourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -109,7 +110,9 @@ class GlobalSchedulesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SchedulePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SchedulePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -194,7 +197,9 @@ class GlobalSchedulesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SchedulePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SchedulePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -534,9 +539,10 @@ class GlobalSchedulesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def retarget(
             self, resource_group_name, name, current_resource_id=None, target_resource_id=None, custom_headers=None, raw=False, **operation_config):
@@ -624,6 +630,7 @@ class GlobalSchedulesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
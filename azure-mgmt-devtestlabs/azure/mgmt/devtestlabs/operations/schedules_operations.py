@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -115,7 +116,9 @@ class SchedulesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SchedulePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SchedulePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -470,9 +473,10 @@ class SchedulesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_applicable(
             self, resource_group_name, lab_name, name, custom_headers=None, raw=False, **operation_config):
@@ -537,7 +541,9 @@ class SchedulesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SchedulePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SchedulePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
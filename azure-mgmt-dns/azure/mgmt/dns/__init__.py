@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .dns_management_client import DnsManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['DnsManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'DnsManagementClient': '.dns_management_client'},
+    submodules=['models', 'operations'])
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -428,7 +429,9 @@ class RecordSetsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RecordSetPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RecordSetPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -502,7 +505,9 @@ class RecordSetsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RecordSetPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RecordSetPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .document_db import DocumentDB
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['DocumentDB']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'DocumentDB': '.document_db'},
+    submodules=['models', 'operations'])
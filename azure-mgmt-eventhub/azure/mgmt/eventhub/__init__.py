@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .event_hub_management_client import EventHubManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['EventHubManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'EventHubManagementClient': '.event_hub_management_client'},
+    submodules=['models', 'operations'])
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -89,7 +90,9 @@ class NamespacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NamespaceResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NamespaceResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -155,7 +158,9 @@ class NamespacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NamespaceResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NamespaceResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -255,9 +260,10 @@ class NamespacesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, namespace_name, custom_headers=None, raw=False, **operation_config):
@@ -334,9 +340,10 @@ class NamespacesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, namespace_name, custom_headers=None, raw=False, **operation_config):
@@ -462,7 +469,9 @@ class NamespacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SharedAccessAuthorizationRuleResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SharedAccessAuthorizationRuleResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .iot_hub_client import IotHubClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['IotHubClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'IotHubClient': '.iot_hub_client'},
+    submodules=['models', 'operations'])
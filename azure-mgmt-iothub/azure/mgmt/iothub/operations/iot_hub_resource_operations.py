@@ -10,7 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -195,9 +196,10 @@ class IotHubResourceOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, resource_name, custom_headers=None, raw=False, **operation_config):
@@ -285,9 +287,10 @@ class IotHubResourceOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_by_subscription(
             self, custom_headers=None, raw=False, **operation_config):
@@ -344,7 +347,9 @@ class IotHubResourceOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.IotHubDescriptionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.IotHubDescriptionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -412,7 +417,9 @@ class IotHubResourceOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.IotHubDescriptionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.IotHubDescriptionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -547,7 +554,9 @@ class IotHubResourceOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.IotHubSkuDescriptionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.IotHubSkuDescriptionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -623,7 +632,9 @@ class IotHubResourceOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.StrPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.StrPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -905,7 +916,9 @@ class IotHubResourceOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.JobResponsePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.JobResponsePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1044,7 +1057,9 @@ class IotHubResourceOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.IotHubQuotaMetricInfoPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.IotHubQuotaMetricInfoPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1182,7 +1197,9 @@ class IotHubResourceOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SharedAccessSignatureAuthorizationRulePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SharedAccessSignatureAuthorizationRulePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .key_vault_management_client import KeyVaultManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['KeyVaultManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'KeyVaultManagementClient': '.key_vault_management_client'},
+    submodules=['models', 'operations'])
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -294,7 +295,9 @@ class VaultsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.VaultPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.VaultPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -359,7 +362,9 @@ class VaultsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DeletedVaultPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DeletedVaultPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -508,9 +513,10 @@ class VaultsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list(
             self, top=None, custom_headers=None, raw=False, **operation_config):
@@ -574,7 +580,9 @@ class VaultsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .logic_management_client import LogicManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['LogicManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'LogicManagementClient': '.logic_management_client'},
+    submodules=['models', 'operations'])
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -93,7 +94,9 @@ class IntegrationAccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.IntegrationAccountPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.IntegrationAccountPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -163,7 +166,9 @@ class IntegrationAccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.IntegrationAccountPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.IntegrationAccountPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
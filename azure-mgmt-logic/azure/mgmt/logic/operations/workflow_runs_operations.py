@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -103,7 +104,9 @@ class WorkflowRunsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.WorkflowRunPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.WorkflowRunPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
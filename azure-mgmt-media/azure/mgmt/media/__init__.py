@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .media_services_management_client import MediaServicesManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['MediaServicesManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'MediaServicesManagementClient': '.media_services_management_client'},
+    submodules=['models', 'operations'])
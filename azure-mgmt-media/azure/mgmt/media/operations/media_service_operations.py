@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -153,7 +154,9 @@ class MediaServiceOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.MediaServicePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.MediaServicePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
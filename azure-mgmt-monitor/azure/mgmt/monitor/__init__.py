@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .monitor_management_client import MonitorManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['MonitorManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'MonitorManagementClient': '.monitor_management_client'},
+    submodules=['models', 'operations'])
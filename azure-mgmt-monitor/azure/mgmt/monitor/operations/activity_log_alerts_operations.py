@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -341,7 +342,9 @@ class ActivityLogAlertsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ActivityLogAlertResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ActivityLogAlertResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -406,7 +409,9 @@ class ActivityLogAlertsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ActivityLogAlertResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ActivityLogAlertResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
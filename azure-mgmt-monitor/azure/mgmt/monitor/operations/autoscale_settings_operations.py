@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -90,7 +91,9 @@ class AutoscaleSettingsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AutoscaleSettingResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AutoscaleSettingResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from .version import VERSION
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
@@ -77,10 +77,8 @@ class NetworkManagementClient(object):
         self.config = NetworkManagementClientConfiguration(credentials, subscription_id, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     def check_dns_name_availability(
             self, location, domain_name_label=None, custom_headers=None, raw=False, **operation_config):
@@ -104,6 +102,14 @@ class NetworkManagementClient(object):
          if raw=true
         :raises: :class:`CloudError<msrestazure.azure_exceptions.CloudError>`
         """
+        return self._versioned_client.check_dns_name_availability(location,
+                                                                  domain_name_label,
+                                                                  custom_headers,
+                                                                  raw,
+                                                                  **operation_config)
+
+    @operation_group
+    def _versioned_client(self):
         if self.api_version == '2017-03-01':
             from .v2017_03_01 import NetworkManagementClient as ClientClass
         elif self.api_version == '2016-12-01':
@@ -112,14 +118,9 @@ class NetworkManagementClient(object):
             from .v2016_09_01 import NetworkManagementClient as ClientClass
         elif self.api_version == '2015-06-15':
             from .v2015_06_15 import NetworkManagementClient as ClientClass
-        localclient = ClientClass(self.config.credentials,
-                                  self.config.subscription_id,
-                                  self.config.base_url)
-        return localclient.check_dns_name_availability(location,
-                                                       domain_name_label,
-                                                       custom_headers,
-                                                       raw,
-                                                       **operation_config)
+        return ClientClass(self.config.credentials,
+                           self.config.subscription_id,
+                           self.config.base_url)
 
     @classmethod
     def models(cls, api_version='2017-03-01'):
@@ -137,7 +138,7 @@ class NetworkManagementClient(object):
             return models
         raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def application_gateways(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import ApplicationGatewaysOperations as OperationClass
@@ -151,7 +152,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def bgp_service_communities(self):
         if self.api_version == '2016-12-01':
             from .v2016_12_01.operations import BgpServiceCommunitiesOperations as OperationClass
@@ -161,7 +162,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def express_route_circuit_authorizations(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import ExpressRouteCircuitAuthorizationsOperations as OperationClass
@@ -175,7 +176,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def express_route_circuit_peerings(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import ExpressRouteCircuitPeeringsOperations as OperationClass
@@ -189,7 +190,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def express_route_circuits(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import ExpressRouteCircuitsOperations as OperationClass
@@ -203,7 +204,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def express_route_service_providers(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import ExpressRouteServiceProvidersOperations as OperationClass
@@ -217,7 +218,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def load_balancers(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import LoadBalancersOperations as OperationClass
@@ -231,7 +232,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def local_network_gateways(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import LocalNetworkGatewaysOperations as OperationClass
@@ -245,7 +246,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def network_interfaces(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import NetworkInterfacesOperations as OperationClass
@@ -259,7 +260,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def network_security_groups(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import NetworkSecurityGroupsOperations as OperationClass
@@ -273,7 +274,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def network_watchers(self):
         if self.api_version == '2016-09-01':
             from .v2016_09_01.operations import NetworkWatchersOperations as OperationClass
@@ -285,7 +286,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def packet_captures(self):
         if self.api_version == '2016-09-01':
             from .v2016_09_01.operations import PacketCapturesOperations as OperationClass
@@ -297,7 +298,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def public_ip_addresses(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import PublicIPAddressesOperations as OperationClass
@@ -311,7 +312,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def route_filter_rules(self):
         if self.api_version == '2016-12-01':
             from .v2016_12_01.operations import RouteFilterRulesOperations as OperationClass
@@ -321,7 +322,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def route_filters(self):
         if self.api_version == '2016-12-01':
             from .v2016_12_01.operations import RouteFiltersOperations as OperationClass
@@ -331,7 +332,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def route_tables(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import RouteTablesOperations as OperationClass
@@ -345,7 +346,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def routes(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import RoutesOperations as OperationClass
@@ -359,7 +360,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def security_rules(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import SecurityRulesOperations as OperationClass
@@ -373,7 +374,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def subnets(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import SubnetsOperations as OperationClass
@@ -387,7 +388,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def usages(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import UsagesOperations as OperationClass
@@ -401,7 +402,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_network_gateway_connections(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualNetworkGatewayConnectionsOperations as OperationClass
@@ -415,7 +416,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_network_gateways(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualNetworkGatewaysOperations as OperationClass
@@ -429,7 +430,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_network_peerings(self):
         if self.api_version == '2016-09-01':
             from .v2016_09_01.operations import VirtualNetworkPeeringsOperations as OperationClass
@@ -441,7 +442,7 @@ class NetworkManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def virtual_networks(self):
         if self.api_version == '2015-06-15':
             from .v2015_06_15.operations import VirtualNetworksOperations as OperationClass
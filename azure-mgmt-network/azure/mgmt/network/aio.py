@@ -0,0 +1,33 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""asyncio counterpart of the network management client.
+
+The client takes the parameters of its synchronous counterpart and an
+optional `transport`, an :class:`azure.common.aio.AioHttpTransport` by
+default. Requires Python 3.5 or later, see :mod:`azure.common.aio`.
+"""
+from azure.common.aio import AsyncOperations, async_client
+
+from . import NetworkManagementClient as _NetworkManagementClient
+
+
+class NetworkManagementClient(async_client(_NetworkManagementClient)):
+    """asyncio counterpart of :class:`azure.mgmt.network.NetworkManagementClient`."""
+
+    def check_dns_name_availability(
+            self, location, domain_name_label=None, custom_headers=None, raw=False, **operation_config):
+        """Coroutine checking whether a domain name in the cloudapp.net zone
+        is available for use.
+
+        See :meth:`azure.mgmt.network.NetworkManagementClient.check_dns_name_availability`.
+        """
+        operations = self.__dict__.get('_versioned_operations')
+        if operations is None:
+            operations = self._versioned_operations = AsyncOperations(
+                self._sync_client._versioned_client, self._transport)
+        return operations.check_dns_name_availability(
+            location, domain_name_label, custom_headers, raw, **operation_config)
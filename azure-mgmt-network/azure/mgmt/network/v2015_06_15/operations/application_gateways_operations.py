@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -109,9 +110,10 @@ class ApplicationGatewaysOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, application_gateway_name, custom_headers=None, raw=False, **operation_config):
@@ -266,9 +268,10 @@ class ApplicationGatewaysOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list(
             self, resource_group_name, custom_headers=None, raw=False, **operation_config):
@@ -327,7 +330,9 @@ class ApplicationGatewaysOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ApplicationGatewayPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ApplicationGatewayPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -390,7 +395,9 @@ class ApplicationGatewaysOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ApplicationGatewayPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ApplicationGatewayPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -472,9 +479,10 @@ class ApplicationGatewaysOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def stop(
             self, resource_group_name, application_gateway_name, custom_headers=None, raw=False, **operation_config):
@@ -549,6 +557,7 @@ class ApplicationGatewaysOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
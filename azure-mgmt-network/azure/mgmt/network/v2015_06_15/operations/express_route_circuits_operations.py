@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -109,9 +110,10 @@ class ExpressRouteCircuitsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, circuit_name, custom_headers=None, raw=False, **operation_config):
@@ -266,9 +268,10 @@ class ExpressRouteCircuitsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_arp_table(
             self, resource_group_name, circuit_name, custom_headers=None, raw=False, **operation_config):
@@ -332,7 +335,9 @@ class ExpressRouteCircuitsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ExpressRouteCircuitArpTablePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ExpressRouteCircuitArpTablePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -403,7 +408,9 @@ class ExpressRouteCircuitsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ExpressRouteCircuitRoutesTablePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ExpressRouteCircuitRoutesTablePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -473,7 +480,9 @@ class ExpressRouteCircuitsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ExpressRouteCircuitStatsPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ExpressRouteCircuitStatsPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -539,7 +548,9 @@ class ExpressRouteCircuitsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ExpressRouteCircuitPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ExpressRouteCircuitPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -602,7 +613,9 @@ class ExpressRouteCircuitsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ExpressRouteCircuitPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ExpressRouteCircuitPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
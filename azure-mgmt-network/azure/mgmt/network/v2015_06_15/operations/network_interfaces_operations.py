@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -109,9 +110,10 @@ class NetworkInterfacesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, network_interface_name, expand=None, custom_headers=None, raw=False, **operation_config):
@@ -270,9 +272,10 @@ class NetworkInterfacesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_all(
             self, custom_headers=None, raw=False, **operation_config):
@@ -328,7 +331,9 @@ class NetworkInterfacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkInterfacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkInterfacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -394,7 +399,9 @@ class NetworkInterfacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkInterfacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkInterfacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -468,7 +475,9 @@ class NetworkInterfacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkInterfacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkInterfacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -538,7 +547,9 @@ class NetworkInterfacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkInterfacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkInterfacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -110,9 +111,10 @@ class NetworkSecurityGroupsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, network_security_group_name, expand=None, custom_headers=None, raw=False, **operation_config):
@@ -274,9 +276,10 @@ class NetworkSecurityGroupsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_all(
             self, custom_headers=None, raw=False, **operation_config):
@@ -332,7 +335,9 @@ class NetworkSecurityGroupsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkSecurityGroupPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkSecurityGroupPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -398,7 +403,9 @@ class NetworkSecurityGroupsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkSecurityGroupPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkSecurityGroupPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
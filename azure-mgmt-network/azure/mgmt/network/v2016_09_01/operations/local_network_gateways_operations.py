@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -129,9 +130,10 @@ class LocalNetworkGatewaysOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, local_network_gateway_name, custom_headers=None, raw=False, **operation_config):
@@ -270,9 +272,10 @@ class LocalNetworkGatewaysOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list(
             self, resource_group_name, custom_headers=None, raw=False, **operation_config):
@@ -331,7 +334,9 @@ class LocalNetworkGatewaysOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.LocalNetworkGatewayPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.LocalNetworkGatewayPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
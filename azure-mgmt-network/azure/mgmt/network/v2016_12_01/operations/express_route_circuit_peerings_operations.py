@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -112,9 +113,10 @@ class ExpressRouteCircuitPeeringsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, circuit_name, peering_name, custom_headers=None, raw=False, **operation_config):
@@ -276,9 +278,10 @@ class ExpressRouteCircuitPeeringsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list(
             self, resource_group_name, circuit_name, custom_headers=None, raw=False, **operation_config):
@@ -340,7 +343,9 @@ class ExpressRouteCircuitPeeringsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ExpressRouteCircuitPeeringPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ExpressRouteCircuitPeeringPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -109,9 +110,10 @@ class NetworkInterfacesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, network_interface_name, expand=None, custom_headers=None, raw=False, **operation_config):
@@ -274,9 +276,10 @@ class NetworkInterfacesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_all(
             self, custom_headers=None, raw=False, **operation_config):
@@ -334,7 +337,9 @@ class NetworkInterfacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkInterfacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkInterfacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -402,7 +407,9 @@ class NetworkInterfacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkInterfacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkInterfacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -494,9 +501,10 @@ class NetworkInterfacesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_effective_network_security_groups(
             self, resource_group_name, network_interface_name, custom_headers=None, raw=False, **operation_config):
@@ -581,9 +589,10 @@ class NetworkInterfacesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_virtual_machine_scale_set_vm_network_interfaces(
             self, resource_group_name, virtual_machine_scale_set_name, virtualmachine_index, custom_headers=None, raw=False, **operation_config):
@@ -652,7 +661,9 @@ class NetworkInterfacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkInterfacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkInterfacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -724,7 +735,9 @@ class NetworkInterfacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkInterfacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkInterfacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
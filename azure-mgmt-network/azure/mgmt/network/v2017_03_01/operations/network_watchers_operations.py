@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -243,9 +244,10 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list(
             self, resource_group_name, custom_headers=None, raw=False, **operation_config):
@@ -304,7 +306,9 @@ class NetworkWatchersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkWatcherPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkWatcherPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -367,7 +371,9 @@ class NetworkWatchersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NetworkWatcherPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NetworkWatcherPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -538,9 +544,10 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get_next_hop(
             self, resource_group_name, network_watcher_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -633,9 +640,10 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get_vm_security_rules(
             self, resource_group_name, network_watcher_name, target_resource_id, custom_headers=None, raw=False, **operation_config):
@@ -729,9 +737,10 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get_troubleshooting(
             self, resource_group_name, network_watcher_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -824,9 +833,10 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get_troubleshooting_result(
             self, resource_group_name, network_watcher_name, target_resource_id, custom_headers=None, raw=False, **operation_config):
@@ -920,9 +930,10 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def set_flow_log_configuration(
             self, resource_group_name, network_watcher_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -1016,9 +1027,10 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get_flow_log_status(
             self, resource_group_name, network_watcher_name, target_resource_id, custom_headers=None, raw=False, **operation_config):
@@ -1113,9 +1125,10 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def check_connectivity(
             self, resource_group_name, network_watcher_name, source, destination, custom_headers=None, raw=False, **operation_config):
@@ -1215,6 +1228,7 @@ class NetworkWatchersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
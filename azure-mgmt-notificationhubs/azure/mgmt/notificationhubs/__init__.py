@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .notification_hubs_management_client import NotificationHubsManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['NotificationHubsManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'NotificationHubsManagementClient': '.notification_hubs_management_client'},
+    submodules=['models', 'operations'])
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -555,7 +556,9 @@ class NotificationHubsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NotificationHubResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NotificationHubResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -626,7 +629,9 @@ class NotificationHubsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SharedAccessAuthorizationRuleResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SharedAccessAuthorizationRuleResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
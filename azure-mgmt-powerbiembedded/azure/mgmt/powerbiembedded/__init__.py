@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .power_bi_embedded_management_client import PowerBIEmbeddedManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['PowerBIEmbeddedManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'PowerBIEmbeddedManagementClient': '.power_bi_embedded_management_client'},
+    submodules=['models', 'operations'])
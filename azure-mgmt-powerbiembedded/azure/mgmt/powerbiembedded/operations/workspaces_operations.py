@@ -10,6 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -93,7 +94,9 @@ class WorkspacesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.WorkspacePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.WorkspacePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .my_sql_management_client import MySQLManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['MySQLManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'MySQLManagementClient': '.my_sql_management_client'},
+    submodules=['models', 'operations'])
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -132,9 +133,10 @@ class ConfigurationsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get(
             self, resource_group_name, server_name, configuration_name, custom_headers=None, raw=False, **operation_config):
@@ -266,7 +268,9 @@ class ConfigurationsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ConfigurationPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ConfigurationPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -97,7 +98,9 @@ class LogFilesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.LogFilePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.LogFilePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .postgre_sql_management_client import PostgreSQLManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['PostgreSQLManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'PostgreSQLManagementClient': '.postgre_sql_management_client'},
+    submodules=['models', 'operations'])
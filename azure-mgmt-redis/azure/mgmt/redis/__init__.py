@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .redis_management_client import RedisManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['RedisManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'RedisManagementClient': '.redis_management_client'},
+    submodules=['models', 'operations'])
@@ -74,7 +74,7 @@ setup(
         'azure.mgmt.redis.operations',		
     ],
     install_requires=[
-        'azure-common~=1.1.5',
+        'azure-common~=1.1.6',
         'msrestazure~=0.4.7',
     ],
     cmdclass=cmdclass
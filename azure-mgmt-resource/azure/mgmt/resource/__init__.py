@@ -5,14 +5,19 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .features import FeatureClient
-from .locks import ManagementLockClient
-from .policy import PolicyClient
-from .resources import ResourceManagementClient
-from .subscriptions import SubscriptionClient
-from .links import ManagementLinkClient
-from .managedapplications import ManagedApplicationClient
-
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __version__ = VERSION
+
+lazy_module(
+    __name__,
+    {
+        'FeatureClient': '.features',
+        'ManagementLockClient': '.locks',
+        'PolicyClient': '.policy',
+        'ResourceManagementClient': '.resources',
+        'SubscriptionClient': '.subscriptions',
+        'ManagementLinkClient': '.links',
+        'ManagedApplicationClient': '.managedapplications',
+    })
@@ -0,0 +1,31 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""asyncio counterparts of the resource management clients.
+
+Each client takes the parameters of its synchronous counterpart and an
+optional `transport`, an :class:`azure.common.aio.AioHttpTransport` by
+default. Requires Python 3.5 or later, see :mod:`azure.common.aio`.
+"""
+from azure.common.aio import async_client
+
+from . import (
+    FeatureClient as _FeatureClient,
+    ManagementLockClient as _ManagementLockClient,
+    PolicyClient as _PolicyClient,
+    ResourceManagementClient as _ResourceManagementClient,
+    SubscriptionClient as _SubscriptionClient,
+    ManagementLinkClient as _ManagementLinkClient,
+    ManagedApplicationClient as _ManagedApplicationClient,
+)
+
+FeatureClient = async_client(_FeatureClient)
+ManagementLockClient = async_client(_ManagementLockClient)
+PolicyClient = async_client(_PolicyClient)
+ResourceManagementClient = async_client(_ResourceManagementClient)
+SubscriptionClient = async_client(_SubscriptionClient)
+ManagementLinkClient = async_client(_ManagementLinkClient)
+ManagedApplicationClient = async_client(_ManagedApplicationClient)
@@ -0,0 +1,228 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Run the same management operation on many subscriptions in parallel.
+
+    from azure.mgmt.compute import ComputeManagementClient
+    from azure.mgmt.resource.fanout import SubscriptionFanOut
+
+    fan_out = SubscriptionFanOut(credentials)
+    with fan_out.run(ComputeManagementClient,
+                     lambda client: client.virtual_machines.list_all()) as results:
+        for subscription_id, vm in results:
+            print(subscription_id, vm.name)
+    print(results.errors)
+
+    with fan_out.run(ComputeManagementClient,
+                     lambda client: client.virtual_machines.list_all()) as results:
+        first = next(results, None)
+
+Leaving the `with` block stops the workers, even when the results were
+not all consumed.
+"""
+import collections
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
+
+from azure.common.connection_pool import use_connection_pool
+from azure.common.throttling import use_throttling_limiter
+
+FanOutItem = collections.namedtuple('FanOutItem', ['subscription_id', 'item'])
+
+_DONE = object()
+
+try:
+    _SINGLE_ITEM_TYPES = (basestring, dict)  # pylint: disable=undefined-variable
+except NameError:
+    _SINGLE_ITEM_TYPES = (str, bytes, dict)
+
+
+class SubscriptionFanOut(object):
+    """Run operations of management clients on a set of subscriptions.
+
+    The clients are created once per class and subscription, and reused by
+    the following runs. They send their requests with the connection pool
+    of their base URL and the throttling limiter of their subscription, see
+    `azure.common.connection_pool` and `azure.common.throttling`.
+
+    :param credentials: Credentials for all the subscriptions.
+    :param int max_workers: The number of subscriptions processed at once.
+    :param client_kwargs: The other parameters of the clients, such as
+     `base_url`.
+    """
+
+    def __init__(self, credentials, max_workers=8, **client_kwargs):
+        self.credentials = credentials
+        self.max_workers = max_workers
+        self.client_kwargs = client_kwargs
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
+    def client(self, client_class, subscription_id):
+        """Return the client of a subscription.
+
+        :param type client_class: A management client class.
+        :param str subscription_id: The subscription.
+        """
+        key = (client_class, subscription_id)
+        with self._clients_lock:
+            if key not in self._clients:
+                client = client_class(self.credentials, subscription_id, **self.client_kwargs)
+                use_connection_pool(client)
+                self._clients[key] = use_throttling_limiter(client)
+            return self._clients[key]
+
+    def subscription_ids(self):
+        """Return the subscriptions of the credentials which are neither
+        disabled nor deleted.
+
+        :rtype: list
+        """
+        from .subscriptions import SubscriptionClient
+        client = SubscriptionClient(self.credentials, base_url=self.client_kwargs.get('base_url'))
+        return [subscription.subscription_id for subscription in client.subscriptions.list()
+                if getattr(subscription.state, 'value', subscription.state) not in ('Disabled', 'Deleted')]
+
+    def run(self, client_class, operation, subscription_ids=None, queue_size=1000):
+        """Start an operation on each subscription.
+
+        :param type client_class: A management client class.
+        :param callable operation: Called with the client of each
+         subscription. The items of a returned iterable, such as a `Paged`
+         result, a list or a generator, are iterated. Other results,
+         strings and dicts are single items.
+        :param list subscription_ids: The subscriptions, those of
+         `subscription_ids()` if None.
+        :param int queue_size: The number of items fetched ahead of the
+         consumer.
+        :rtype: FanOutResults
+        """
+        if subscription_ids is None:
+            subscription_ids = self.subscription_ids()
+        return FanOutResults(self, client_class, operation, list(subscription_ids), queue_size)
+
+
+class _FanOutRun(object):
+    """The state shared by the workers of a `FanOutResults`. The workers do
+    not reference the `FanOutResults`, so that dropping it cancels them."""
+
+    def __init__(self, fan_out, client_class, operation, subscription_ids, queue_size):
+        self.errors = {}
+        self.items = queue.Queue(queue_size)
+        self.cancelled = threading.Event()
+        self._fan_out = fan_out
+        self._client_class = client_class
+        self._operation = operation
+        self._pending = queue.Queue()
+        for subscription_id in subscription_ids:
+            self._pending.put(subscription_id)
+        # Daemon threads: a run never consumed does not keep the process
+        # alive.
+        for _ in range(max(1, min(fan_out.max_workers, len(subscription_ids)))):
+            thread = threading.Thread(target=self._work, name='SubscriptionFanOut')
+            thread.daemon = True
+            thread.start()
+
+    def _work(self):
+        while not self.cancelled.is_set():
+            try:
+                subscription_id = self._pending.get_nowait()
+            except queue.Empty:
+                return
+            self._run(subscription_id)
+
+    def _put(self, value):
+        while not self.cancelled.is_set():
+            try:
+                self.items.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run(self, subscription_id):
+        try:
+            result = self._operation(self._fan_out.client(self._client_class, subscription_id))
+            if isinstance(result, Iterable) and not isinstance(result, _SINGLE_ITEM_TYPES):
+                items = result
+            else:
+                items = [result]
+            for item in items:
+                if not self._put(FanOutItem(subscription_id, item)):
+                    return
+        except Exception as err:  # pylint: disable=broad-except
+            self.errors[subscription_id] = err
+        finally:
+            self._put(_DONE)
+
+
+class FanOutResults(object):
+    """The items of an operation run on several subscriptions, as
+    `FanOutItem(subscription_id, item)` tuples, in the order they are
+    fetched.
+
+    A failing subscription does not stop the others: its exception is put
+    in `errors` and the items fetched before it are kept. Iterating stops
+    once every subscription is done, or after `cancel`, which is called
+    when leaving a `with` block and when the results are garbage
+    collected.
+
+    :ivar list subscription_ids: The subscriptions of the run.
+    :ivar dict errors: The exception of each failed subscription.
+    """
+
+    def __init__(self, fan_out, client_class, operation, subscription_ids, queue_size):
+        self.subscription_ids = subscription_ids
+        self._run = _FanOutRun(fan_out, client_class, operation, subscription_ids, queue_size)
+        self._running = len(subscription_ids)
+
+    @property
+    def errors(self):
+        return self._run.errors
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self._running and not self._run.cancelled.is_set():
+            try:
+                value = self._run.items.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if value is not _DONE:
+                return value
+            self._running -= 1
+        raise StopIteration()
+
+    next = __next__  # Python 2 compatibility.
+
+    def cancel(self):
+        """Stop fetching items: the subscriptions not started are skipped,
+        and the others stop before their next page."""
+        self._run.cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._run.cancelled.is_set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cancel()
+
+    def __del__(self):
+        if '_run' in self.__dict__:
+            self.cancel()
@@ -5,4 +5,9 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .feature_client import FeatureClient
\ No newline at end of file
+from azure.common.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    {'FeatureClient': '.feature_client'},
+    submodules=['models'])
@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from ..version import VERSION
 
 
@@ -80,10 +80,8 @@ class FeatureClient(object):
         self.config = FeatureClientConfiguration(credentials, subscription_id, api_version, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     @classmethod
     def models(cls, api_version = '2015-12-01'):
@@ -93,7 +91,7 @@ class FeatureClient(object):
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def features(self):
         if self.api_version =='2015-12-01':
             from .v2015_12_01.operations.features_operations import FeaturesOperations as OperationClass
@@ -5,4 +5,9 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .management_link_client import ManagementLinkClient
+from azure.common.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    {'ManagementLinkClient': '.management_link_client'},
+    submodules=['models'])
@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from ..version import VERSION
 
 
@@ -71,10 +71,8 @@ class ManagementLinkClient(object):
         self.config = ManagementLinkClientConfiguration(credentials, subscription_id, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     @classmethod
     def models(cls, api_version = '2016-09-01'):
@@ -84,7 +82,7 @@ class ManagementLinkClient(object):
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def resource_links(self):
         if self.api_version =='2016-09-01':
             from .v2016_09_01.operations.resource_links_operations import ResourceLinksOperations as OperationClass
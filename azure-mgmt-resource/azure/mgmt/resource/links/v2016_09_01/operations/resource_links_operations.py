@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -282,7 +283,9 @@ class ResourceLinksOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceLinkPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceLinkPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -356,7 +359,9 @@ class ResourceLinksOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceLinkPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceLinkPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -5,4 +5,9 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .management_lock_client import ManagementLockClient
+from azure.common.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    {'ManagementLockClient': '.management_lock_client'},
+    submodules=['models'])
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -611,7 +612,9 @@ class ManagementLocksOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ManagementLockObjectPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ManagementLockObjectPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -695,7 +698,9 @@ class ManagementLocksOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ManagementLockObjectPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ManagementLockObjectPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -762,7 +767,9 @@ class ManagementLocksOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ManagementLockObjectPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ManagementLockObjectPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -925,7 +926,9 @@ class ManagementLocksOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ManagementLockObjectPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ManagementLockObjectPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1010,7 +1013,9 @@ class ManagementLocksOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ManagementLockObjectPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ManagementLockObjectPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1077,7 +1082,9 @@ class ManagementLocksOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ManagementLockObjectPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ManagementLockObjectPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .managed_application_client import ManagedApplicationClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['ManagedApplicationClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'ManagedApplicationClient': '.managed_application_client'},
+    submodules=['models', 'operations'])
@@ -10,7 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -170,9 +171,10 @@ class AppliancesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def create_or_update(
             self, resource_group_name, appliance_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -265,9 +267,10 @@ class AppliancesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def update(
             self, resource_group_name, appliance_name, parameters=None, custom_headers=None, raw=False, **operation_config):
@@ -400,7 +403,9 @@ class AppliancesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppliancePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppliancePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -462,7 +467,9 @@ class AppliancesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppliancePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppliancePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -604,9 +611,10 @@ class AppliancesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def create_or_update_by_id(
             self, appliance_id, parameters, custom_headers=None, raw=False, **operation_config):
@@ -698,9 +706,10 @@ class AppliancesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def update_by_id(
             self, appliance_id, parameters=None, custom_headers=None, raw=False, **operation_config):
@@ -5,4 +5,9 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .policy_client import PolicyClient
+from azure.common.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    {'PolicyClient': '.policy_client'},
+    submodules=['models'])
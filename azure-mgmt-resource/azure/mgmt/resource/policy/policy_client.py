@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from ..version import VERSION
 
 
@@ -69,10 +69,8 @@ class PolicyClient(object):
         self.config = PolicyClientConfiguration(credentials, subscription_id, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     @classmethod
     def models(cls, api_version='2016-12-01'):
@@ -87,7 +85,7 @@ class PolicyClient(object):
             return models
         raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def policy_assignments(self):
         if self.api_version == '2015-10-01-preview':
             from .v2015_10_01_preview.operations import PolicyAssignmentsOperations as OperationClass
@@ -99,7 +97,7 @@ class PolicyClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def policy_definitions(self):
         if self.api_version == '2015-10-01-preview':
             from .v2015_10_01_preview.operations import PolicyDefinitionsOperations as OperationClass
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -293,7 +294,9 @@ class PolicyAssignmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.PolicyAssignmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.PolicyAssignmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -378,7 +381,9 @@ class PolicyAssignmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.PolicyAssignmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.PolicyAssignmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -445,7 +450,9 @@ class PolicyAssignmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.PolicyAssignmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.PolicyAssignmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
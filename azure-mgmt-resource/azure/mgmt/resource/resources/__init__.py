@@ -5,4 +5,9 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .resource_management_client import ResourceManagementClient
+from azure.common.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    {'ResourceManagementClient': '.resource_management_client'},
+    submodules=['models'])
@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from ..version import VERSION
 
 
@@ -71,10 +71,8 @@ class ResourceManagementClient(object):
         self.config = ResourceManagementClientConfiguration(credentials, subscription_id, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     @classmethod
     def models(cls, api_version=LATEST_API_VERSION):
@@ -89,7 +87,7 @@ class ResourceManagementClient(object):
             return models
         raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def deployment_operations(self):
         if self.api_version == '2016-02-01':
             from .v2016_02_01.operations import DeploymentOperations as OperationClass
@@ -101,7 +99,7 @@ class ResourceManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def deployments(self):
         if self.api_version == '2016-02-01':
             from .v2016_02_01.operations import DeploymentsOperations as OperationClass
@@ -113,7 +111,7 @@ class ResourceManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def providers(self):
         if self.api_version == '2016-02-01':
             from .v2016_02_01.operations import ProvidersOperations as OperationClass
@@ -125,7 +123,7 @@ class ResourceManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def resource_groups(self):
         if self.api_version == '2016-02-01':
             from .v2016_02_01.operations import ResourceGroupsOperations as OperationClass
@@ -137,7 +135,7 @@ class ResourceManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def resources(self):
         if self.api_version == '2016-02-01':
             from .v2016_02_01.operations import ResourcesOperations as OperationClass
@@ -149,7 +147,7 @@ class ResourceManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def tags(self):
         if self.api_version == '2016-02-01':
             from .v2016_02_01.operations import TagsOperations as OperationClass
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -221,7 +222,9 @@ class ProvidersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ProviderPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ProviderPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -5,4 +5,9 @@
 # license information.
 # --------------------------------------------------------------------------
 
-from .subscription_client import SubscriptionClient
\ No newline at end of file
+from azure.common.lazy import lazy_module
+
+lazy_module(
+    __name__,
+    {'SubscriptionClient': '.subscription_client'},
+    submodules=['models'])
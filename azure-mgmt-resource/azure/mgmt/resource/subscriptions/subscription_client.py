@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from ..version import VERSION
 
 
@@ -65,10 +65,8 @@ class SubscriptionClient(object):
         self.config = SubscriptionClientConfiguration(credentials, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     @classmethod
     def models(cls, api_version = '2016-06-01'):
@@ -78,7 +76,7 @@ class SubscriptionClient(object):
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def subscriptions(self):
         if self.api_version =='2016-06-01':
             from .v2016_06_01.operations.subscriptions_operations import SubscriptionsOperations as OperationClass
@@ -86,7 +84,7 @@ class SubscriptionClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def tenants(self):
         if self.api_version =='2016-06-01':
             from .v2016_06_01.operations.tenants_operations import TenantsOperations as OperationClass
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -95,7 +96,9 @@ class SubscriptionsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.LocationPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.LocationPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -212,7 +215,9 @@ class SubscriptionsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SubscriptionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SubscriptionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .scheduler_management_client import SchedulerManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['SchedulerManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'SchedulerManagementClient': '.scheduler_management_client'},
+    submodules=['models', 'operations'])
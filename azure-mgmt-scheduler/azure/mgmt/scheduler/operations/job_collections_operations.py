@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -90,7 +91,9 @@ class JobCollectionsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.JobCollectionDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.JobCollectionDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -156,7 +159,9 @@ class JobCollectionsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.JobCollectionDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.JobCollectionDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -440,9 +445,10 @@ class JobCollectionsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def enable(
             self, resource_group_name, job_collection_name, custom_headers=None, raw=False, **operation_config):
@@ -517,9 +523,10 @@ class JobCollectionsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def disable(
             self, resource_group_name, job_collection_name, custom_headers=None, raw=False, **operation_config):
@@ -594,6 +601,7 @@ class JobCollectionsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
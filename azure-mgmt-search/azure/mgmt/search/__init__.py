@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .search_management_client import SearchManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['SearchManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'SearchManagementClient': '.search_management_client'},
+    submodules=['models', 'operations'])
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .server_management import ServerManagement
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['ServerManagement']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'ServerManagement': '.server_management'},
+    submodules=['models', 'operations'])
@@ -10,7 +10,7 @@
 # --------------------------------------------------------------------------
 
 from msrest.pipeline import ClientRawResponse
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
 import uuid
 
 from .. import models
@@ -185,9 +185,10 @@ class PowerShellOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get_command_status(
             self, resource_group_name, node_name, session, pssession, expand=None, custom_headers=None, raw=False, **operation_config):
@@ -350,9 +351,10 @@ class PowerShellOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def invoke_command(
             self, resource_group_name, node_name, session, pssession, command=None, custom_headers=None, raw=False, **operation_config):
@@ -449,9 +451,10 @@ class PowerShellOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def cancel_command(
             self, resource_group_name, node_name, session, pssession, custom_headers=None, raw=False, **operation_config):
@@ -540,9 +543,10 @@ class PowerShellOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def tab_completion(
             self, resource_group_name, node_name, session, pssession, command=None, custom_headers=None, raw=False, **operation_config):
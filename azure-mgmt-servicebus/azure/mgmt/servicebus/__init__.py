@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .service_bus_management_client import ServiceBusManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['ServiceBusManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'ServiceBusManagementClient': '.service_bus_management_client'},
+    submodules=['models', 'operations'])
@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .sql_management_client import SqlManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['SqlManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'SqlManagementClient': '.sql_management_client'},
+    submodules=['models', 'operations'])
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -104,7 +105,9 @@ class DatabasesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RestorePointPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RestorePointPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -206,9 +209,10 @@ class DatabasesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def create_import_operation(
             self, resource_group_name, server_name, database_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -307,9 +311,10 @@ class DatabasesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def export(
             self, resource_group_name, server_name, database_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -406,9 +411,10 @@ class DatabasesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete_replication_link(
             self, resource_group_name, server_name, database_name, link_id, custom_headers=None, raw=False, **operation_config):
@@ -632,9 +638,10 @@ class DatabasesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def failover_replication_link_allow_data_loss(
             self, resource_group_name, server_name, database_name, link_id, custom_headers=None, raw=False, **operation_config):
@@ -721,9 +728,10 @@ class DatabasesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_replication_links(
             self, resource_group_name, server_name, database_name, custom_headers=None, raw=False, **operation_config):
@@ -792,7 +800,9 @@ class DatabasesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ReplicationLinkPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ReplicationLinkPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -881,9 +891,10 @@ class DatabasesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def resume(
             self, resource_group_name, server_name, database_name, custom_headers=None, raw=False, **operation_config):
@@ -965,9 +976,10 @@ class DatabasesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def create_or_update(
             self, resource_group_name, server_name, database_name, parameters, custom_headers=None, raw=False, **operation_config):
@@ -1069,9 +1081,10 @@ class DatabasesOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, server_name, database_name, custom_headers=None, raw=False, **operation_config):
@@ -1282,7 +1295,9 @@ class DatabasesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DatabasePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DatabasePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1358,7 +1373,9 @@ class DatabasesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DatabaseMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DatabaseMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1506,7 +1523,9 @@ class DatabasesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ServiceTierAdvisorPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ServiceTierAdvisorPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1736,7 +1755,9 @@ class DatabasesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.TransparentDataEncryptionActivityPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.TransparentDataEncryptionActivityPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
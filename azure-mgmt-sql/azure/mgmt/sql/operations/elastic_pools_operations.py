@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -133,9 +134,10 @@ class ElasticPoolsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, server_name, elastic_pool_name, custom_headers=None, raw=False, **operation_config):
@@ -325,7 +327,9 @@ class ElasticPoolsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ElasticPoolPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ElasticPoolPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -400,7 +404,9 @@ class ElasticPoolsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ElasticPoolActivityPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ElasticPoolActivityPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -474,7 +480,9 @@ class ElasticPoolsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ElasticPoolDatabaseActivityPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ElasticPoolDatabaseActivityPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -618,7 +626,9 @@ class ElasticPoolsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DatabasePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DatabasePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
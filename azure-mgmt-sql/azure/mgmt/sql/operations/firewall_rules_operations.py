@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -304,7 +305,9 @@ class FirewallRulesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.FirewallRulePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.FirewallRulePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
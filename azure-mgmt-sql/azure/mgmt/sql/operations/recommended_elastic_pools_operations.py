@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -235,7 +236,9 @@ class RecommendedElasticPoolsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RecommendedElasticPoolPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RecommendedElasticPoolPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -309,7 +312,9 @@ class RecommendedElasticPoolsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DatabasePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DatabasePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -384,7 +389,9 @@ class RecommendedElasticPoolsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.RecommendedElasticPoolMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.RecommendedElasticPoolMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -88,7 +89,9 @@ class ServersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ServerPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ServerPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -346,7 +349,9 @@ class ServersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ServerPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ServerPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -417,7 +422,9 @@ class ServersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ServerMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ServerMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -556,7 +563,9 @@ class ServersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ServiceObjectivePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ServiceObjectivePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
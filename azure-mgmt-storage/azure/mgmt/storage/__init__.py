@@ -10,8 +10,8 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
 from msrestazure import AzureConfiguration
+from azure.common.multiapi import get_serializers, operation_group
 from .version import VERSION
 
 
@@ -78,10 +78,8 @@ class StorageManagementClient(object):
         self.config = StorageManagementClientConfiguration(credentials, subscription_id, base_url)
         self._client = ServiceClient(self.config.credentials, self.config)
 
-        client_models = {k: v for k, v in self.models(api_version).__dict__.items() if isinstance(v, type)}
         self.api_version = api_version
-        self._serialize = Serializer(client_models)
-        self._deserialize = Deserializer(client_models)
+        self._serialize, self._deserialize = get_serializers(self.models(api_version))
 
     @classmethod
     def models(cls, api_version = '2016-12-01'):
@@ -94,7 +92,7 @@ class StorageManagementClient(object):
         else:
             raise NotImplementedError("APIVersion {} is not available".format(api_version))
 
-    @property
+    @operation_group
     def storage_accounts(self):
         if self.api_version =='2016-12-01':
             from .v2016_12_01.operations import StorageAccountsOperations as OperationClass
@@ -104,7 +102,7 @@ class StorageManagementClient(object):
             raise NotImplementedError("APIVersion {} is not available".format(self.api_version))
         return OperationClass(self._client, self.config, self._serialize, self._deserialize)
 
-    @property
+    @operation_group
     def usage(self):
         if self.api_version =='2016-12-01':
             from .v2016_12_01.operations import UsageOperations as OperationClass
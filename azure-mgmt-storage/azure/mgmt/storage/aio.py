@@ -0,0 +1,19 @@
+# coding=utf-8
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""asyncio counterparts of the storage management client.
+
+Each client takes the parameters of its synchronous counterpart and an
+optional `transport`, an :class:`azure.common.aio.AioHttpTransport` by
+default. Requires Python 3.5 or later, see :mod:`azure.common.aio`.
+"""
+from azure.common.aio import async_client
+
+from . import (
+    StorageManagementClient as _StorageManagementClient,
+)
+
+StorageManagementClient = async_client(_StorageManagementClient)
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -199,9 +200,10 @@ class StorageAccountsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, account_name, custom_headers=None, raw=False, **operation_config):
@@ -464,7 +466,9 @@ class StorageAccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.StorageAccountPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.StorageAccountPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -533,7 +537,9 @@ class StorageAccountsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.StorageAccountPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.StorageAccountPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
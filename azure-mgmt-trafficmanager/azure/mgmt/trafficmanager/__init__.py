@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .traffic_manager_management_client import TrafficManagerManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['TrafficManagerManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'TrafficManagerManagementClient': '.traffic_manager_management_client'},
+    submodules=['models', 'operations'])
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -159,7 +160,9 @@ class ProfilesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ProfilePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ProfilePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -222,7 +225,9 @@ class ProfilesOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ProfilePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ProfilePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
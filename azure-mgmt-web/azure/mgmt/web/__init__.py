@@ -9,10 +9,14 @@
 # regenerated.
 # --------------------------------------------------------------------------
 
-from .web_site_management_client import WebSiteManagementClient
+from azure.common.lazy import lazy_module
 from .version import VERSION
 
 __all__ = ['WebSiteManagementClient']
 
 __version__ = VERSION
 
+lazy_module(
+    __name__,
+    {'WebSiteManagementClient': '.web_site_management_client'},
+    submodules=['models', 'operations'])
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -92,7 +93,9 @@ class AppServiceCertificateOrdersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppServiceCertificateOrderPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppServiceCertificateOrderPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -220,7 +223,9 @@ class AppServiceCertificateOrdersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppServiceCertificateOrderPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppServiceCertificateOrderPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -389,9 +394,10 @@ class AppServiceCertificateOrdersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, certificate_order_name, custom_headers=None, raw=False, **operation_config):
@@ -513,7 +519,9 @@ class AppServiceCertificateOrdersOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppServiceCertificateResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppServiceCertificateResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -686,9 +694,10 @@ class AppServiceCertificateOrdersOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete_certificate(
             self, resource_group_name, certificate_order_name, name, custom_headers=None, raw=False, **operation_config):
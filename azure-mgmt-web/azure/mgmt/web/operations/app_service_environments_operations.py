@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -92,7 +93,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppServiceEnvironmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppServiceEnvironmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -161,7 +164,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppServiceEnvironmentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppServiceEnvironmentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -330,9 +335,10 @@ class AppServiceEnvironmentsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, name, force_delete=None, custom_headers=None, raw=False, **operation_config):
@@ -416,9 +422,10 @@ class AppServiceEnvironmentsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_capacities(
             self, resource_group_name, name, custom_headers=None, raw=False, **operation_config):
@@ -485,7 +492,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.StampCapacityPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.StampCapacityPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -833,7 +842,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -905,7 +916,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.WorkerPoolResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.WorkerPoolResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1072,9 +1085,10 @@ class AppServiceEnvironmentsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_multi_role_pool_instance_metric_definitions(
             self, resource_group_name, name, instance, custom_headers=None, raw=False, **operation_config):
@@ -1144,7 +1158,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1226,7 +1242,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1300,7 +1318,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1397,7 +1417,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1468,7 +1490,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SkuInfoPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SkuInfoPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1539,7 +1563,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.UsagePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.UsagePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1731,7 +1757,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1803,7 +1831,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppServicePlanPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppServicePlanPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1879,7 +1909,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1950,7 +1982,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2030,7 +2064,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.CsmUsageQuotaPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.CsmUsageQuotaPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2102,7 +2138,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.WorkerPoolResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.WorkerPoolResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2275,9 +2313,10 @@ class AppServiceEnvironmentsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_worker_pool_instance_metric_definitions(
             self, resource_group_name, name, worker_pool_name, instance, custom_headers=None, raw=False, **operation_config):
@@ -2350,7 +2389,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2443,7 +2484,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2518,7 +2561,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2608,7 +2653,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2682,7 +2729,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SkuInfoPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SkuInfoPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2756,7 +2805,9 @@ class AppServiceEnvironmentsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.UsagePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.UsagePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -99,7 +100,9 @@ class AppServicePlansOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppServicePlanPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppServicePlanPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -168,7 +171,9 @@ class AppServicePlansOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.AppServicePlanPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.AppServicePlanPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -334,9 +339,10 @@ class AppServicePlansOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, name, custom_headers=None, raw=False, **operation_config):
@@ -732,7 +738,9 @@ class AppServicePlansOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.StrPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.StrPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -871,7 +879,9 @@ class AppServicePlansOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.HybridConnectionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.HybridConnectionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -945,7 +955,9 @@ class AppServicePlansOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1030,7 +1042,9 @@ class AppServicePlansOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1181,7 +1195,9 @@ class AppServicePlansOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -91,7 +92,9 @@ class DeletedWebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DeletedSitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DeletedSitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -160,7 +163,9 @@ class DeletedWebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DeletedSitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DeletedSitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
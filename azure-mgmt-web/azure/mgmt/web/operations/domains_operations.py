@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -157,7 +158,9 @@ class DomainsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DomainPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DomainPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -290,7 +293,9 @@ class DomainsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.NameIdentifierPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.NameIdentifierPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -358,7 +363,9 @@ class DomainsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DomainPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DomainPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -522,9 +529,10 @@ class DomainsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, domain_name, force_hard_delete_domain=None, custom_headers=None, raw=False, **operation_config):
@@ -652,7 +660,9 @@ class DomainsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DomainOwnershipIdentifierPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DomainOwnershipIdentifierPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
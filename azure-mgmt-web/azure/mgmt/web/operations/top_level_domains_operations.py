@@ -11,6 +11,7 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -91,7 +92,9 @@ class TopLevelDomainsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.TopLevelDomainPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.TopLevelDomainPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -234,7 +237,9 @@ class TopLevelDomainsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.TldLegalAgreementPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.TldLegalAgreementPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
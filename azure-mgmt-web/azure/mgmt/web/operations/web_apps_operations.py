@@ -11,7 +11,8 @@
 
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
-from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.lro import operation_poller
+from azure.common.paging import operation_paged
 import uuid
 
 from .. import models
@@ -91,7 +92,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -165,7 +168,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -354,9 +359,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete(
             self, resource_group_name, name, delete_metrics=None, delete_empty_server_farm=None, skip_dns_registration=None, custom_headers=None, raw=False, **operation_config):
@@ -703,7 +709,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.BackupItemPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.BackupItemPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -1089,9 +1097,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_configurations(
             self, resource_group_name, name, custom_headers=None, raw=False, **operation_config):
@@ -1156,7 +1165,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SiteConfigResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SiteConfigResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -2128,9 +2139,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def update_site_push_settings(
             self, resource_group_name, name, push_settings, custom_headers=None, raw=False, **operation_config):
@@ -2884,7 +2896,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DeploymentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DeploymentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -3163,7 +3177,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.IdentifierPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.IdentifierPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -3520,7 +3536,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.HostNameBindingPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.HostNameBindingPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -4577,7 +4595,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SiteInstancePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SiteInstancePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -4656,7 +4676,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DeploymentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DeploymentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -5019,7 +5041,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -5104,7 +5128,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -5207,9 +5233,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def migrate_my_sql(
             self, resource_group_name, name, migration_request_envelope, custom_headers=None, raw=False, **operation_config):
@@ -5302,9 +5329,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def get_migrate_my_sql_status(
             self, resource_group_name, name, custom_headers=None, raw=False, **operation_config):
@@ -5713,7 +5741,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.PerfMonResponsePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.PerfMonResponsePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -6229,9 +6259,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def reset_production_slot_config(
             self, resource_group_name, name, custom_headers=None, raw=False, **operation_config):
@@ -6488,7 +6519,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SitePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SitePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -6685,9 +6718,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete_slot(
             self, resource_group_name, name, slot, delete_metrics=None, delete_empty_server_farm=None, skip_dns_registration=None, custom_headers=None, raw=False, **operation_config):
@@ -7054,7 +7088,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.BackupItemPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.BackupItemPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -7460,9 +7496,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_configurations_slot(
             self, resource_group_name, name, slot, custom_headers=None, raw=False, **operation_config):
@@ -7531,7 +7568,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SiteConfigResourcePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SiteConfigResourcePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -8559,9 +8598,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def update_site_push_settings_slot(
             self, resource_group_name, name, push_settings, slot, custom_headers=None, raw=False, **operation_config):
@@ -9209,7 +9249,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DeploymentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DeploymentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9504,7 +9546,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.IdentifierPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.IdentifierPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -9881,7 +9925,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.HostNameBindingPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.HostNameBindingPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -10994,7 +11040,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SiteInstancePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SiteInstancePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11077,7 +11125,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.DeploymentPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.DeploymentPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11460,7 +11510,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricDefinitionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricDefinitionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11549,7 +11601,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.ResourceMetricPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.ResourceMetricPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -11986,7 +12040,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.PerfMonResponsePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.PerfMonResponsePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -12530,9 +12586,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def reset_slot_configuration_slot(
             self, resource_group_name, name, slot, custom_headers=None, raw=False, **operation_config):
@@ -12816,7 +12873,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SlotDifferencePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SlotDifferencePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -12916,9 +12975,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_snapshots_slot(
             self, resource_group_name, name, slot, custom_headers=None, raw=False, **operation_config):
@@ -12985,7 +13045,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SnapshotPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SnapshotPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -13163,9 +13225,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete_source_control_slot(
             self, resource_group_name, name, slot, custom_headers=None, raw=False, **operation_config):
@@ -13550,7 +13613,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.CsmUsageQuotaPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.CsmUsageQuotaPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -14248,7 +14313,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SlotDifferencePaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SlotDifferencePaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -14344,9 +14411,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def list_snapshots(
             self, resource_group_name, name, custom_headers=None, raw=False, **operation_config):
@@ -14410,7 +14478,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.SnapshotPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SnapshotPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -14578,9 +14648,10 @@ class WebAppsOperations(object):
         long_running_operation_timeout = operation_config.get(
             'long_running_operation_timeout',
             self.config.long_running_operation_timeout)
-        return AzureOperationPoller(
+        return operation_poller(
             long_running_send, get_long_running_output,
-            get_long_running_status, long_running_operation_timeout)
+            get_long_running_status, long_running_operation_timeout,
+            operation_config)
 
     def delete_source_control(
             self, resource_group_name, name, custom_headers=None, raw=False, **operation_config):
@@ -14940,7 +15011,9 @@ class WebAppsOperations(object):
             return response
 
         # Deserialize response
-        deserialized = models.CsmUsageQuotaPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.CsmUsageQuotaPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -10,12 +10,13 @@
 # --------------------------------------------------------------------------
 
 from msrest.service_client import ServiceClient
-from msrest import Serializer, Deserializer
+from azure.common.compiled import Serializer, Deserializer
 from msrestazure import AzureConfiguration
 from .version import VERSION
 from msrest.pipeline import ClientRawResponse
 from msrestazure.azure_exceptions import CloudError
 from msrestazure.azure_operation import AzureOperationPoller
+from azure.common.paging import operation_paged
 import uuid
 from .operations.app_service_certificate_orders_operations import AppServiceCertificateOrdersOperations
 from .operations.app_service_environments_operations import AppServiceEnvironmentsOperations
@@ -302,7 +303,9 @@ class WebSiteManagementClient(object):
             return response
 
         # Deserialize response
-        deserialized = models.SourceControlPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.SourceControlPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -521,7 +524,9 @@ class WebSiteManagementClient(object):
             return response
 
         # Deserialize response
-        deserialized = models.GeoRegionPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.GeoRegionPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -588,7 +593,9 @@ class WebSiteManagementClient(object):
             return response
 
         # Deserialize response
-        deserialized = models.PremierAddOnOfferPaged(internal_paging, self._deserialize.dependencies)
+        deserialized = operation_paged(
+            models.PremierAddOnOfferPaged, internal_paging, self._deserialize.dependencies,
+            self.config, operation_config)
 
         if raw:
             header_dict = {}
@@ -0,0 +1,144 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""The tests of azure.common.aio, imported by test_mgmt_aio on Python 3.5
+and later only: the module uses the async syntax."""
+import asyncio
+import json
+import unittest
+
+from msrest.authentication import BasicTokenAuthentication
+from msrestazure.azure_exceptions import CloudError
+
+from azure.common.aio import AsyncOperationPoller, AsyncPaged, make_response, prepare_request
+from azure.mgmt.network.aio import NetworkManagementClient
+from azure.mgmt.resource.aio import ResourceManagementClient
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+BASE_URL = 'https://management.azure.com/subscriptions/' + SUBSCRIPTION_ID
+STATUS_URL = 'https://management.azure.com/operations/vnet'
+
+
+class FakeTransport(object):
+    """Answers from a dictionary of (method, path) to (status, body, headers),
+    suspending each request so that concurrent ones overlap."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def send(self, client, request, headers, content, config):
+        prepared = prepare_request(client, request, headers, content)
+        self.requests.append(prepared)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        path = prepared.url.split('?')[0].replace(BASE_URL, '')
+        answers = self.routes[(prepared.method, path)]
+        status_code, body, headers = answers.pop(0) if isinstance(answers, list) else answers
+        headers = dict(headers, **{'content-type': 'application/json'})
+        return make_response(prepared, status_code, 'OK', headers, json.dumps(body).encode('utf-8'))
+
+    async def close(self):
+        self.closed = True
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class MgmtAsyncOperationsTest(unittest.TestCase):
+
+    def client(self, client_class, routes):
+        self.transport = FakeTransport(routes)
+        return client_class(
+            BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID,
+            transport=self.transport)
+
+    def test_operation(self):
+        client = self.client(ResourceManagementClient, {
+            ('GET', '/resourcegroups/group'): (200, {'name': 'group', 'location': 'westus'}, {}),
+            ('GET', '/resourcegroups/missing'): (404, {'error': {'code': 'ResourceGroupNotFound', 'message': 'Not found'}}, {}),
+        })
+
+        async def scenario():
+            async with client:
+                groups = await asyncio.gather(*[client.resource_groups.get('group') for _ in range(10)])
+                with self.assertRaises(CloudError):
+                    await client.resource_groups.get('missing')
+            return groups
+
+        groups = run(scenario())
+        self.assertEqual([group.name for group in groups], ['group'] * 10)
+        self.assertIsInstance(groups[0], client.models().ResourceGroup)
+        self.assertEqual(len(self.transport.requests), 11)
+        self.assertEqual(self.transport.max_in_flight, 10)
+        self.assertTrue(self.transport.closed)
+        request = self.transport.requests[0]
+        self.assertIn('api-version=', request.url)
+        self.assertEqual(request.headers['Authorization'], 'Bearer token')
+        self.assertIn('resourcemanagementclient', request.headers['User-Agent'])
+
+    def test_paged(self):
+        next_link = BASE_URL + '/resourcegroups-page-2'
+        client = self.client(ResourceManagementClient, {
+            ('GET', '/resourcegroups'): (200, {'value': [{'name': 'a'}, {'name': 'b'}], 'nextLink': next_link}, {}),
+            ('GET', '/resourcegroups-page-2'): (200, {'value': [{'name': 'c'}]}, {}),
+        })
+
+        async def scenario():
+            groups = client.resource_groups.list()
+            self.assertIsInstance(groups, AsyncPaged)
+            self.assertEqual(self.transport.requests, [])
+            return [group.name async for group in groups]
+
+        self.assertEqual(run(scenario()), ['a', 'b', 'c'])
+        self.assertEqual(len(self.transport.requests), 2)
+
+        async def raw_items():
+            return [group async for group in client.resource_groups.list(paging_raw_items=True)]
+
+        self.assertEqual(run(raw_items()), [{'name': 'a'}, {'name': 'b'}, {'name': 'c'}])
+
+    def test_long_running_operation(self):
+        path = '/resourceGroups/group/providers/Microsoft.Network/virtualNetworks/vnet'
+        client = self.client(NetworkManagementClient, {
+            ('PUT', path): (201, {'name': 'vnet', 'properties': {'provisioningState': 'Updating'}},
+                            {'azure-asyncoperation': STATUS_URL, 'retry-after': '0'}),
+            ('GET', STATUS_URL): [(200, {'status': 'InProgress'}, {'retry-after': '0'}),
+                                  (200, {'status': 'Succeeded'}, {})],
+            ('GET', path): (200, {'name': 'vnet', 'properties': {'provisioningState': 'Succeeded'}}, {}),
+            ('GET', '/providers/Microsoft.Network/locations/westus/CheckDnsNameAvailability'):
+                (200, {'available': True}, {}),
+        })
+        parameters = client.models().VirtualNetwork(location='westus')
+
+        async def scenario():
+            poller = await client.virtual_networks.create_or_update('group', 'vnet', parameters)
+            self.assertIsInstance(poller, AsyncOperationPoller)
+            self.assertFalse(poller.done())
+            network = await poller.result()
+            self.assertTrue(poller.done())
+            availability = await client.check_dns_name_availability('westus', 'label')
+            return network, availability
+
+        network, availability = run(scenario())
+        self.assertEqual(network.provisioning_state, 'Succeeded')
+        self.assertTrue(availability.available)
+        self.assertEqual([request.method for request in self.transport.requests],
+                         ['PUT', 'GET', 'GET', 'GET', 'GET'])
+        self.assertEqual(json.loads(self.transport.requests[0].body)['location'], 'westus')
+
@@ -0,0 +1,83 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import unittest
+
+import requests
+
+from azure.batch.batch_auth import SharedKeyAuth
+
+
+ACCOUNT_NAME = 'pythonsdktest'
+ACCOUNT_KEY = 'YmF0Y2gtdGVzdC1rZXliYXRjaC10ZXN0LWtleWJhdGNoLXRlc3Qta2V5YmF0Y2gtdGVzdC1rZXk='
+ACCOUNT_URL = 'https://pythonsdktest.brazilsouth.batch.azure.com'
+
+
+def prepare_request(method, path, headers=None, body=None):
+    request = requests.Request(method, ACCOUNT_URL + path, headers=headers, data=body)
+    return request.prepare()
+
+
+class BatchSharedKeyAuthTest(unittest.TestCase):
+
+    def setUp(self):
+        self.auth = SharedKeyAuth('Authorization', ACCOUNT_NAME, ACCOUNT_KEY)
+
+    def test_sign_request(self):
+        request = prepare_request(
+            'POST',
+            '/jobs/job%2F1/addtaskcollection?api-version=2017-05-01.5.0&timeout=30',
+            headers={
+                'ocp-date': 'Mon, 15 May 2017 00:00:00 GMT',
+                'client-request-id': 'a7b3c1d2',
+                'Content-Type': 'application/json; odata=minimalmetadata; charset=utf-8'},
+            body='{"value": []}')
+
+        self.auth(request)
+
+        self.assertEqual(
+            request.headers['Authorization'],
+            'SharedKey pythonsdktest:sWyHmj1QebFPB/f85gxmeCra6vZV/oCDhTWgKVTzkt8=')
+
+    def test_sign_request_is_repeatable(self):
+        first = prepare_request('GET', '/pools', {'ocp-date': 'Mon, 15 May 2017 00:00:00 GMT'})
+        second = prepare_request('GET', '/pools', {'ocp-date': 'Mon, 15 May 2017 00:00:00 GMT'})
+
+        self.auth(first)
+        self.auth(second)
+
+        self.assertEqual(first.headers['Authorization'], second.headers['Authorization'])
+
+    def test_sign_request_ocp_header_case(self):
+        date = {'ocp-date': 'Mon, 15 May 2017 00:00:00 GMT'}
+        plain = prepare_request('GET', '/pools', dict(date))
+        lower = prepare_request('GET', '/pools', dict(date, **{'ocp-custom': 'value'}))
+        mixed = prepare_request('GET', '/pools', dict(date, **{'Ocp-Custom': 'value'}))
+
+        for request in (plain, lower, mixed):
+            self.auth(request)
+
+        # Only the names containing a lowercase 'ocp-' are canonicalized.
+        self.assertNotEqual(lower.headers['Authorization'], plain.headers['Authorization'])
+        self.assertEqual(mixed.headers['Authorization'], plain.headers['Authorization'])
+
+    def test_sign_request_adds_date(self):
+        request = prepare_request('GET', '/pools')
+
+        self.auth(request)
+
+        self.assertIn('ocp-date', request.headers)
+        self.assertTrue(request.headers['Authorization'].startswith('SharedKey pythonsdktest:'))
+
+    def test_invalid_key(self):
+        with self.assertRaises(ValueError):
+            SharedKeyAuth('Authorization', ACCOUNT_NAME, 'not a base64 key')
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+import requests
+
+from azure.batch.batch_file_download import FileDownloader
+
+
+LAST_MODIFIED = datetime.datetime(2017, 5, 15)
+
+
+class FakeFileOperations(object):
+    """Serves `content` honouring ocp-range, failing the first read of the
+    ranges listed in `fail_once` part way through."""
+
+    def __init__(self, content, fail_once=()):
+        self.content = content
+        self.ranges = []
+        self._fail_once = set(fail_once)
+        self._lock = threading.Lock()
+
+    def get_properties_from_task(self, job_id, task_id, file_path, raw=False, **kwargs):
+        properties = MagicMock()
+        properties.headers = {
+            'Content-Length': len(self.content),
+            'Last-Modified': LAST_MODIFIED}
+        return properties
+
+    get_properties_from_compute_node = get_properties_from_task
+
+    def get_from_task(self, job_id, task_id, file_path, options=None, **kwargs):
+        assert options.if_unmodified_since == LAST_MODIFIED
+        start, end = (int(i) for i in options.ocp_range[len('bytes='):].split('-'))
+        with self._lock:
+            self.ranges.append((start, end))
+            fail = start in self._fail_once
+            self._fail_once.discard(start)
+        return self._stream(start, end, fail)
+
+    get_from_compute_node = get_from_task
+
+    def _stream(self, start, end, fail):
+        data = self.content[start:end + 1]
+        for index in range(0, len(data), 7):
+            if fail and index > 0:
+                raise requests.ConnectionError('connection reset')
+            yield data[index:index + 7]
+
+
+class BatchFileDownloadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.working_folder = tempfile.mkdtemp()
+        self.destination = os.path.join(self.working_folder, 'stdout.txt')
+        self.content = os.urandom(1000)
+
+    def tearDown(self):
+        shutil.rmtree(self.working_folder)
+
+    def make_downloader(self, operations, **kwargs):
+        client = MagicMock()
+        client.file = operations
+        return FileDownloader(client, range_size=64, retry_interval=0, **kwargs)
+
+    def test_download_from_task(self):
+        operations = FakeFileOperations(self.content)
+        progress = []
+        downloader = self.make_downloader(operations, max_workers=4)
+
+        size = downloader.download_from_task(
+            'job', 'task', 'stdout.txt', self.destination,
+            progress_callback=lambda current, total: progress.append((current, total)))
+
+        self.assertEqual(size, 1000)
+        with open(self.destination, 'rb') as stream:
+            self.assertEqual(stream.read(), self.content)
+        self.assertEqual(len(operations.ranges), 16)
+        self.assertEqual(progress[-1], (1000, 1000))
+
+    def test_retry_failed_range_only(self):
+        operations = FakeFileOperations(self.content, fail_once=[128])
+        downloader = self.make_downloader(operations)
+
+        downloader.download_from_compute_node('pool', 'node', 'startup/stdout.txt', self.destination)
+
+        with open(self.destination, 'rb') as stream:
+            self.assertEqual(stream.read(), self.content)
+        # the failed range resumes after the bytes already written
+        self.assertIn((135, 191), operations.ranges)
+        self.assertEqual(len(operations.ranges), 17)
+
+    def test_download_empty_file(self):
+        downloader = self.make_downloader(FakeFileOperations(b''))
+
+        self.assertEqual(
+            downloader.download_from_task('job', 'task', 'stderr.txt', self.destination), 0)
+        self.assertEqual(os.path.getsize(self.destination), 0)
+
+    def test_failed_download_removes_file(self):
+        operations = FakeFileOperations(self.content, fail_once=[0])
+        downloader = self.make_downloader(operations, max_retries=0)
+
+        with self.assertRaises(requests.ConnectionError):
+            downloader.download_from_task('job', 'task', 'stdout.txt', self.destination)
+        self.assertFalse(os.path.exists(self.destination))
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
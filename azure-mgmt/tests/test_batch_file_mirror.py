@@ -0,0 +1,136 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+from msrest.serialization import TZ_UTC
+
+import azure.batch.models as models
+from azure.batch.batch_file_mirror import FileMirror
+
+
+LAST_MODIFIED = datetime.datetime(2017, 5, 15, 10, 30, tzinfo=TZ_UTC)
+
+
+class FakeFileOperations(object):
+
+    def __init__(self, files):
+        self.files = files
+        self.downloads = []
+        self._lock = threading.Lock()
+
+    def list_from_compute_node(self, pool_id, node_id, recursive=None, **kwargs):
+        assert recursive
+        for name, content in sorted(self.files.items()):
+            if content is None:
+                yield models.NodeFile(name=name, is_directory=True)
+            else:
+                yield models.NodeFile(
+                    name=name, is_directory=False,
+                    properties=models.FileProperties(LAST_MODIFIED, len(content)))
+
+    def get_from_compute_node(self, pool_id, node_id, file_path, options=None, **kwargs):
+        with self._lock:
+            self.downloads.append(file_path)
+        start, end = (int(i) for i in options.ocp_range[len('bytes='):].split('-'))
+        yield self.files[file_path][start:end + 1]
+
+
+class BatchFileMirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.working_folder = tempfile.mkdtemp()
+        self.operations = FakeFileOperations({
+            'startup': None,
+            'startup/stdout.txt': b'started',
+            'startup/stderr.txt': b'',
+            'workitems/job/job-1/task/wd/output.bin': os.urandom(300),
+        })
+        client = MagicMock()
+        client.file = self.operations
+        self.mirror = FileMirror(client, max_workers=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.working_folder)
+
+    def read(self, *path):
+        with open(os.path.join(self.working_folder, *path), 'rb') as stream:
+            return stream.read()
+
+    def test_mirror_compute_node(self):
+        result = self.mirror.mirror_compute_node('pool', 'node', self.working_folder)
+
+        self.assertEqual(len(result.downloaded), 3)
+        self.assertEqual(result.failed, {})
+        self.assertEqual(self.read('startup', 'stdout.txt'), b'started')
+        self.assertEqual(self.read('startup', 'stderr.txt'), b'')
+        self.assertEqual(
+            self.read('workitems', 'job', 'job-1', 'task', 'wd', 'output.bin'),
+            self.operations.files['workitems/job/job-1/task/wd/output.bin'])
+
+    def test_mirror_is_incremental(self):
+        self.mirror.mirror_compute_node('pool', 'node', self.working_folder)
+        self.operations.downloads = []
+        self.operations.files['startup/stdout.txt'] = b'started again'
+
+        result = self.mirror.mirror_compute_node('pool', 'node', self.working_folder)
+
+        self.assertEqual(result.downloaded, ['startup/stdout.txt'])
+        self.assertEqual(len(result.skipped), 2)
+        self.assertEqual(self.operations.downloads, ['startup/stdout.txt'])
+
+    def test_mirror_bandwidth_limit(self):
+        self.mirror.max_bandwidth = 200
+        start = time.time()
+
+        self.mirror.mirror_compute_node('pool', 'node', self.working_folder)
+
+        # 307 bytes at 200 bytes/s, after an initial burst of 200 bytes
+        self.assertGreaterEqual(time.time() - start, 0.5)
+
+    def test_bandwidth_limit_per_node(self):
+        self.mirror.max_bandwidth = 400
+        destinations = [os.path.join(self.working_folder, name) for name in ('a', 'b')]
+        threads = [threading.Thread(target=self.mirror.mirror_compute_node,
+                                    args=('pool', 'node', destination))
+                   for destination in destinations]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 614 bytes at 400 bytes/s for both mirrors, after an initial burst
+        # of 400 bytes
+        self.assertGreaterEqual(time.time() - start, 0.5)
+        self.assertEqual(self.mirror._throttles, {})
+
+    def test_reject_names_outside_destination(self):
+        self.operations.files = {'../outside.txt': b'data', 'inside.txt': b'data'}
+
+        result = self.mirror.mirror_compute_node('pool', 'node', self.working_folder)
+
+        self.assertEqual(list(result.failed), ['../outside.txt'])
+        self.assertIsInstance(result.failed['../outside.txt'], ValueError)
+        self.assertEqual(result.downloaded, ['inside.txt'])
+        self.assertFalse(os.path.exists(os.path.join(self.working_folder, '..', 'outside.txt')))
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
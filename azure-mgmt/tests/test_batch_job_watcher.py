@@ -0,0 +1,154 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import datetime
+import unittest
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+from msrest.serialization import TZ_UTC
+
+import azure.batch.models as models
+from azure.batch.batch_job_watcher import JobWatcher
+
+
+START = datetime.datetime(2017, 5, 15, 10, 0, tzinfo=TZ_UTC)
+
+
+class FakeTaskOperations(object):
+    """Serves a mutable table of tasks, honouring stateTransitionTime filters."""
+
+    def __init__(self):
+        self.tasks = {}
+        self.options = []
+        self.clock = 0
+
+    def set_state(self, task_id, state, exit_code=None, result=None):
+        self.clock += 1
+        execution_info = None
+        if state == models.TaskState.completed:
+            execution_info = models.TaskExecutionInformation(
+                0, 0, exit_code=exit_code, result=result)
+        self.tasks[task_id] = models.CloudTask(
+            id=task_id, state=state, execution_info=execution_info,
+            state_transition_time=START + datetime.timedelta(seconds=self.clock))
+
+    def list(self, job_id, task_list_options=None, **kwargs):
+        self.options.append(task_list_options)
+        since = None
+        if task_list_options.filter:
+            since = task_list_options.filter.split("'")[1]
+        # Each task is read when listed, as the service pages through them.
+        for task_id in sorted(self.tasks):
+            task = self.tasks[task_id]
+            if since is None or task.state_transition_time.isoformat().replace('+00:00', 'Z') >= since:
+                yield task
+
+    def now(self):
+        return START + datetime.timedelta(seconds=self.clock)
+
+
+class BatchJobWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.operations = FakeTaskOperations()
+        client = MagicMock()
+        client.task = self.operations
+        self.completed = []
+        self.failed = []
+        self.watcher = JobWatcher(
+            client, 'job', poll_interval=0, clock_skew=0,
+            on_completed=self.completed.append, on_failed=self.failed.append)
+        self.watcher._now = self.operations.now
+
+    def test_poll_selects_and_filters(self):
+        self.operations.set_state('task1', models.TaskState.active)
+        self.watcher.poll()
+        self.operations.set_state('task2', models.TaskState.running)
+        self.watcher.poll()
+
+        first, second = self.operations.options
+        self.assertEqual(first.select, 'id,state,stateTransitionTime,executionInfo')
+        self.assertIsNone(first.filter)
+        self.assertEqual(second.filter, "stateTransitionTime ge datetime'2017-05-15T10:00:01.000Z'")
+        self.assertEqual(self.watcher.counts(), {'active': 1, 'running': 1})
+
+    def test_completion_and_failure_events(self):
+        self.operations.set_state('task1', models.TaskState.running)
+        self.operations.set_state('task2', models.TaskState.running)
+        self.watcher.poll()
+
+        self.operations.set_state('task1', models.TaskState.completed, 0, models.TaskExecutionResult.success)
+        self.operations.set_state('task2', models.TaskState.completed, 1, models.TaskExecutionResult.failure)
+        completed = self.watcher.poll()
+        self.watcher.poll()
+
+        self.assertEqual(sorted(r.id for r in completed), ['task1', 'task2'])
+        self.assertEqual([r.id for r in self.completed], ['task1'])
+        self.assertEqual([r.id for r in self.failed], ['task2'])
+        self.assertEqual(self.failed[0].exit_code, 1)
+        self.assertTrue(self.watcher.is_complete())
+
+    def test_state_change_during_listing(self):
+        self.operations.set_state('task1', models.TaskState.running)
+        self.operations.set_state('task2', models.TaskState.running)
+        listing = self.operations.list
+
+        def list_and_complete(job_id, task_list_options=None, **kwargs):
+            tasks = listing(job_id, task_list_options)
+            yield next(tasks)
+            # task1 completes after being listed, before task2 is listed
+            self.operations.set_state('task1', models.TaskState.completed, 0)
+            self.operations.set_state('task2', models.TaskState.completed, 0)
+            for task in tasks:
+                yield task
+
+        self.operations.list = list_and_complete
+        self.assertEqual([r.id for r in self.watcher.poll()], ['task2'])
+        self.operations.list = listing
+
+        self.assertEqual([r.id for r in self.watcher.poll()], ['task1'])
+        self.assertTrue(self.watcher.is_complete())
+
+    def test_wait_all(self):
+        self.operations.set_state('task1', models.TaskState.running)
+        self.assertFalse(self.watcher.wait_all(timeout=0))
+
+        self.operations.set_state('task1', models.TaskState.completed, 0)
+        self.assertTrue(self.watcher.wait_all(timeout=0))
+        self.assertEqual(len(self.completed), 1)
+
+    def test_wait_any(self):
+        self.operations.set_state('task1', models.TaskState.running)
+        self.operations.set_state('task2', models.TaskState.running)
+        self.assertEqual(self.watcher.wait_any(timeout=0), [])
+
+        self.operations.set_state('task2', models.TaskState.completed, 0)
+        self.assertEqual([r.id for r in self.watcher.wait_any(timeout=0)], ['task2'])
+
+    def test_deleted_tasks(self):
+        self.watcher.full_poll_every = 2
+        self.operations.set_state('task1', models.TaskState.running)
+        self.operations.set_state('task2', models.TaskState.completed, 0)
+        self.operations.set_state('task3', models.TaskState.running)
+        self.watcher.poll()
+
+        del self.operations.tasks['task1']
+        del self.operations.tasks['task2']
+        self.operations.set_state('task3', models.TaskState.completed, 0)
+
+        self.assertTrue(self.watcher.wait_all(timeout=5))
+        self.assertEqual(sorted(self.watcher.tasks), ['task3'])
+        self.assertEqual(self.operations.options[-1].filter, None)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import datetime
+import threading
+import unittest
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+import azure.batch.models as models
+from azure.batch.batch_node_operations import BulkComputeNodeOperations
+from testutils.fake_responses import batch_error
+
+
+POOL_ID = 'python-bulk-pool'
+
+
+class FakeComputeNodeOperations(object):
+    """Nodes reboot in two polls; tracks how many are rebooting at once.
+    Nodes with task scheduling disabled are offline once idle."""
+
+    def __init__(self, node_count, busy_once=()):
+        self.clock = 0
+        self.nodes = dict(
+            ('node{}'.format(i), ['idle', self._now()]) for i in range(node_count))
+        self.calls = []
+        self.list_options = None
+        self.rebooting = {}
+        self.max_rebooting = 0
+        self.disabled = set()
+        self.reboot_state = 'idle'
+        self._busy_once = set(busy_once)
+        self._lock = threading.Lock()
+
+    def _now(self):
+        self.clock += 1
+        return datetime.datetime(2017, 5, 15) + datetime.timedelta(seconds=self.clock)
+
+    def list(self, pool_id, compute_node_list_options=None, **kwargs):
+        self.list_options = compute_node_list_options
+        return [models.ComputeNode(id=node_id) for node_id in sorted(self.nodes)
+                if node_id != 'node0']
+
+    def get(self, pool_id, node_id, compute_node_get_options=None, **kwargs):
+        with self._lock:
+            state = self.nodes[node_id]
+            if state[0] == 'rebooting':
+                self.rebooting[node_id] -= 1
+                if not self.rebooting[node_id]:
+                    del self.rebooting[node_id]
+                    settled = self.reboot_state
+                    if settled == 'idle' and node_id in self.disabled:
+                        settled = 'offline'
+                    state[:] = [settled, self._now()]
+            return models.ComputeNode(
+                id=node_id, state=state[0], state_transition_time=state[1],
+                scheduling_state='disabled' if node_id in self.disabled else 'enabled')
+
+    def _record(self, name, node_id):
+        with self._lock:
+            self.calls.append((name, node_id))
+            if node_id in self._busy_once:
+                self._busy_once.discard(node_id)
+                raise batch_error(503, 'ServerBusy')
+
+    def reboot(self, pool_id, node_id, node_reboot_option=None, **kwargs):
+        self._record('reboot', node_id)
+        with self._lock:
+            self.nodes[node_id][:] = ['rebooting', self._now()]
+            self.rebooting[node_id] = 2
+            self.max_rebooting = max(self.max_rebooting, len(self.rebooting))
+
+    def disable_scheduling(self, pool_id, node_id, node_disable_scheduling_option=None, **kwargs):
+        self._record('disable_scheduling', node_id)
+        with self._lock:
+            self.disabled.add(node_id)
+            if self.nodes[node_id][0] == 'idle':
+                self.nodes[node_id][:] = ['offline', self._now()]
+
+    def delete_user(self, pool_id, node_id, user_name, **kwargs):
+        self._record('delete_user', node_id)
+        if node_id == 'node1':
+            raise batch_error(404, 'UserNotFound')
+
+
+class BatchBulkComputeNodeOperationsTest(unittest.TestCase):
+
+    def make_operations(self, operations, **kwargs):
+        client = MagicMock()
+        client.compute_node = operations
+        return BulkComputeNodeOperations(
+            client, poll_interval=0, retry_interval=0, **kwargs)
+
+    def test_disable_scheduling_from_filter(self):
+        operations = FakeComputeNodeOperations(5, busy_once=['node2'])
+        bulk = self.make_operations(operations)
+
+        results = bulk.disable_scheduling(
+            POOL_ID, models.ComputeNodeListOptions(filter="state eq 'idle'"))
+
+        self.assertEqual(operations.list_options.filter, "state eq 'idle'")
+        self.assertEqual(operations.list_options.select, 'id')
+        self.assertEqual(sorted(r.node_id for r in results), ['node1', 'node2', 'node3', 'node4'])
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertEqual(len(operations.calls), 5)
+
+    def test_per_node_failures(self):
+        operations = FakeComputeNodeOperations(3)
+        bulk = self.make_operations(operations)
+
+        results = dict((r.node_id, r) for r in bulk.delete_user(
+            POOL_ID, ['node0', 'node1', 'node2'], 'admin'))
+
+        self.assertTrue(results['node0'].succeeded)
+        self.assertFalse(results['node1'].succeeded)
+        self.assertIsInstance(results['node1'].error, models.BatchErrorException)
+        self.assertTrue(results['node2'].succeeded)
+
+    def test_rolling_reboot(self):
+        operations = FakeComputeNodeOperations(10)
+        bulk = self.make_operations(operations, max_workers=8, max_unavailable=3)
+
+        results = bulk.reboot(POOL_ID, sorted(operations.nodes))
+
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(r.succeeded and r.state == 'idle' for r in results))
+        self.assertLessEqual(operations.max_rebooting, 3)
+        self.assertEqual(operations.rebooting, {})
+
+    def test_rolling_reboot_after_disable_scheduling(self):
+        operations = FakeComputeNodeOperations(4)
+        bulk = self.make_operations(operations, max_unavailable=2)
+        bulk.disable_scheduling(POOL_ID, ['node0', 'node1'])
+
+        results = dict((r.node_id, r) for r in bulk.reboot(POOL_ID, sorted(operations.nodes)))
+
+        # Drained nodes come back offline, the others idle.
+        self.assertTrue(all(r.succeeded for r in results.values()))
+        self.assertEqual([results[node_id].state for node_id in sorted(results)],
+                         ['offline', 'offline', 'idle', 'idle'])
+
+    def test_rolling_reboot_unusable(self):
+        operations = FakeComputeNodeOperations(2)
+        operations.reboot_state = 'unusable'
+        bulk = self.make_operations(operations, max_unavailable=2)
+
+        results = bulk.reboot(POOL_ID, sorted(operations.nodes))
+
+        self.assertTrue(all(not r.succeeded and r.state == 'unusable' for r in results))
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import datetime
+import unittest
+
+try:
+    from urllib.parse import parse_qs, urlsplit
+except ImportError:
+    from urlparse import parse_qs, urlsplit
+
+from msrest.authentication import BasicTokenAuthentication
+
+import azure.batch
+from azure.batch import models
+from azure.batch.batch_projection import ProjectedListOperations, ProjectedRecord
+from testutils.fake_responses import make_response
+
+
+BASE_URL = 'https://account.westus.batch.azure.com'
+
+TASK_PAGES = [
+    {'value': [
+        {'id': 'task-1', 'state': 'completed', 'stateTransitionTime': '2017-05-15T10:00:00Z',
+         'executionInfo': {'exitCode': 0, 'retryCount': 0, 'requeueCount': 0, 'result': 'success'}},
+        {'id': 'task-2', 'state': 'running', 'stateTransitionTime': '2017-05-15T10:05:00.5Z'}],
+     'odata.nextLink': BASE_URL + '/jobs/job-1/tasks?$skiptoken=2'},
+    {'value': [
+        {'id': 'task-3', 'state': 'active'}]},
+]
+
+
+def query(request):
+    return {key: value[0] for key, value in parse_qs(urlsplit(request.url).query).items()}
+
+
+class BatchProjectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = azure.batch.BatchServiceClient(
+            BasicTokenAuthentication({'access_token': 'token'}), base_url=BASE_URL)
+        self.requests = []
+        self.pages = list(TASK_PAGES)
+
+        def send(request, headers=None, content=None, **config):
+            self.requests.append(request)
+            return make_response(self.pages[len(self.requests) - 1])
+        self.client._client.send = send
+
+    def test_records_match_models(self):
+        select = 'id,state,stateTransitionTime,executionInfo'
+        records = list(ProjectedListOperations(self.client).list_tasks('job-1', select))
+        self.requests = []
+        tasks = list(self.client.task.list('job-1', models.TaskListOptions(select=select)))
+
+        self.assertEqual(len(records), 3)
+        for record, task in zip(records, tasks):
+            self.assertIsInstance(record, ProjectedRecord)
+            self.assertEqual(record.id, task.id)
+            self.assertEqual(record.state, task.state)
+            self.assertEqual(record.state_transition_time, task.state_transition_time)
+        self.assertEqual(records[0].execution_info.exit_code, 0)
+        self.assertEqual(records[0].execution_info.result, models.TaskExecutionResult.success)
+        self.assertIsNone(records[2].state_transition_time)
+        self.assertFalse(hasattr(records[0], 'display_name'))
+        self.assertEqual(query(self.requests[0])['$select'], select)
+
+    def test_tuples(self):
+        operations = ProjectedListOperations(self.client, as_tuples=True)
+        options = models.TaskListOptions(filter="state eq 'completed'", select='ignored')
+
+        rows = list(operations.list_tasks('job-1', ['id', 'stateTransitionTime'], options))
+
+        self.assertEqual(rows[0], (
+            'task-1', datetime.datetime(2017, 5, 15, 10, tzinfo=rows[0][1].tzinfo)))
+        self.assertEqual([row[0] for row in rows], ['task-1', 'task-2', 'task-3'])
+        self.assertEqual(query(self.requests[0])['$select'], 'id,stateTransitionTime')
+        self.assertEqual(query(self.requests[0])['$filter'], "state eq 'completed'")
+        self.assertEqual(options.select, 'ignored')
+        self.assertEqual(len(self.requests), 2)
+
+    def test_compute_nodes(self):
+        self.pages = [{'value': [{'id': 'node-1', 'state': 'idle', 'isDedicated': True}]}]
+
+        nodes = list(ProjectedListOperations(self.client).list_compute_nodes(
+            'pool-1', 'id,state,isDedicated'))
+
+        self.assertEqual(nodes[0].as_dict(), {
+            'id': 'node-1', 'state': models.ComputeNodeState.idle, 'is_dedicated': True})
+        self.assertEqual(type(nodes[0]).__name__, 'ComputeNodeRecord')
+
+    def test_unknown_property(self):
+        with self.assertRaises(ValueError):
+            ProjectedListOperations(self.client).list_pools('id,displayname')
+
+    def test_error(self):
+        self.pages = [{'odata.metadata': BASE_URL + '/$metadata#Microsoft.Azure.Batch.Protocol.Entities.Container.errors/@Element',
+                       'code': 'JobNotFound',
+                       'message': {'lang': 'en-US', 'value': 'The specified job does not exist.'}}]
+        self.client._client.send = lambda *args, **kwargs: make_response(self.pages[0], 404)
+
+        with self.assertRaises(models.BatchErrorException):
+            list(ProjectedListOperations(self.client).list_tasks('job-1', 'id'))
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import threading
+import unittest
+
+try:
+    from urllib.parse import parse_qs, urlsplit
+except ImportError:
+    from urlparse import parse_qs, urlsplit
+
+import isodate
+from msrest.authentication import BasicTokenAuthentication
+
+import azure.batch
+from azure.batch.batch_statistics import StatisticsAggregator
+from testutils.fake_responses import make_response
+
+
+BASE_URL = 'https://account.westus.batch.azure.com'
+
+
+def usage(pool_id, start, core_hours):
+    return {'poolId': pool_id, 'startTime': start, 'endTime': start, 'vmSize': 'small',
+            'totalCoreHours': core_hours, 'dataIngressGiB': 0.5, 'dataEgressGiB': 0.25}
+
+
+class FakeBatchService(object):
+    """Serves the responses of the fields below by request path and
+    records the query of each request."""
+
+    def __init__(self):
+        self.nodes = {'pool-1': [{'id': 'n1', 'state': 'idle'}, {'id': 'n2', 'state': 'running'},
+                                 {'id': 'n3', 'state': 'idle'}]}
+        self.usage = [usage('pool-1', '2017-05-15T10:00:00Z', 2.0),
+                      usage('pool-1', '2017-05-15T09:30:00Z', 1.0),
+                      usage('pool-2', '2017-05-15T10:00:00Z', 8.0)]
+        self.tasks = [{'id': 't1', 'state': 'active', 'stateTransitionTime': '2017-05-15T10:00:00Z'},
+                      {'id': 't2', 'state': 'completed', 'stateTransitionTime': '2017-05-15T10:01:00Z',
+                       'executionInfo': {'exitCode': 0, 'retryCount': 0, 'requeueCount': 0}}]
+        self.preparation = [
+            {'nodeId': 'n1', 'jobPreparationTaskExecutionInfo': {
+                'startTime': '2017-05-15T10:00:00Z', 'state': 'completed', 'retryCount': 0}},
+            {'nodeId': 'n2', 'jobPreparationTaskExecutionInfo': {
+                'startTime': '2017-05-15T10:00:00Z', 'state': 'running', 'retryCount': 0}}]
+        self.fail = set()
+        self.queries = {}
+        self._lock = threading.Lock()
+
+    def send(self, request, headers=None, content=None, **config):
+        url = urlsplit(request.url)
+        query = {key: value[0] for key, value in parse_qs(url.query).items()}
+        with self._lock:
+            self.queries.setdefault(url.path, []).append(query)
+        if url.path in self.fail:
+            return make_response({'code': 'ServerBusy', 'message': {'value': 'busy'}}, 503)
+        if url.path == '/lifetimepoolstats':
+            return make_response({
+                'url': BASE_URL + '/lifetimepoolstats', 'startTime': '2017-01-01T00:00:00Z',
+                'lastUpdateTime': '2017-05-15T10:00:00Z',
+                'usageStats': {'startTime': '2017-01-01T00:00:00Z',
+                               'lastUpdateTime': '2017-05-15T10:00:00Z',
+                               'dedicatedCoreTime': 'PT90M'}})
+        if url.path == '/poolusagemetrics':
+            return make_response({'value': self.usage})
+        if url.path == '/jobs/job-1/tasks':
+            return make_response({'value': self.tasks})
+        if url.path == '/jobs/job-1/jobpreparationandreleasetaskstatus':
+            return make_response({'value': self.preparation})
+        pool_id = url.path.split('/')[2]
+        return make_response({'value': self.nodes.get(pool_id, [])})
+
+
+
+class BatchStatisticsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.service = FakeBatchService()
+        self.client = azure.batch.BatchServiceClient(
+            BasicTokenAuthentication({'access_token': 'token'}), base_url=BASE_URL)
+        self.client._client.send = self.service.send
+        self.aggregator = StatisticsAggregator(
+            self.client, pool_ids=['pool-1', 'pool-2'], job_ids=['job-1'], max_workers=4)
+
+    def test_refresh(self):
+        snapshot = self.aggregator.refresh()
+
+        self.assertEqual(snapshot.errors, {})
+        self.assertEqual(snapshot.lifetime_core_hours, 1.5)
+        pool = snapshot.pools['pool-1']
+        self.assertEqual(pool.node_states, {'idle': 2, 'running': 1})
+        self.assertEqual(pool.core_hours, 3.0)
+        self.assertEqual(pool.data_ingress_gib, 1.0)
+        self.assertEqual(snapshot.pools['pool-2'].core_hours, 8.0)
+        self.assertEqual(snapshot.pools['pool-2'].node_states, {})
+        job = snapshot.jobs['job-1']
+        self.assertEqual(job.task_states, {'active': 1, 'completed': 1})
+        self.assertEqual(job.preparation_task_states, {'completed': 1, 'running': 1})
+        self.assertEqual(job.release_task_states, {})
+
+        self.assertEqual(self.service.queries['/pools/pool-1/nodes'][0]['$select'], 'id,state')
+        self.assertEqual(self.service.queries['/poolusagemetrics'][0]['$filter'],
+                         "poolId eq 'pool-1' or poolId eq 'pool-2'")
+        self.assertNotIn('starttime', self.service.queries['/poolusagemetrics'][0])
+
+    def test_incremental_refresh(self):
+        self.aggregator.refresh()
+        # the latest interval of pool-1 is updated and a new one appears;
+        # the earlier interval is sent again and must not be counted twice
+        self.service.usage = [usage('pool-1', '2017-05-15T09:30:00Z', 1.0),
+                              usage('pool-1', '2017-05-15T10:00:00Z', 2.5),
+                              usage('pool-1', '2017-05-15T10:30:00Z', 4.0)]
+        self.service.tasks = [{'id': 't1', 'state': 'completed',
+                               'stateTransitionTime': '2017-05-15T10:02:00Z'}]
+
+        snapshot = self.aggregator.refresh()
+
+        self.assertEqual(snapshot.pools['pool-1'].core_hours, 7.5)
+        self.assertEqual(snapshot.pools['pool-2'].core_hours, 8.0)
+        self.assertEqual(snapshot.jobs['job-1'].task_states, {'completed': 2})
+        usage_query = self.service.queries['/poolusagemetrics'][1]
+        self.assertTrue(usage_query['starttime'].startswith('2017-05-15T10:00:00'))
+        task_query = self.service.queries['/jobs/job-1/tasks'][1]
+        # from the start of the previous refresh, not the latest transition
+        self.assertTrue(task_query['$filter'].startswith("stateTransitionTime ge datetime'"))
+        self.assertNotIn('2017-05-15', task_query['$filter'])
+
+    def test_usage_of_pool_without_metrics(self):
+        self.service.usage = [usage('pool-1', '2017-05-15T10:00:00Z', 2.0)]
+        aggregator = StatisticsAggregator(
+            self.client, pool_ids=['pool-1', 'pool-2'],
+            usage_start_time=isodate.parse_datetime('2017-05-01T00:00:00Z'))
+        aggregator.refresh()
+        aggregator.refresh()
+
+        first, second = self.service.queries['/poolusagemetrics']
+        self.assertTrue(first['starttime'].startswith('2017-05-01T00:00:00'))
+        # pool-2 has no metrics yet: not read again from usage_start_time
+        self.assertTrue(second['starttime'].startswith('2017-05-15T10:00:00'))
+
+    def test_failed_request_keeps_counters(self):
+        self.aggregator.refresh()
+        self.service.fail.add('/pools/pool-1/nodes')
+        self.service.nodes['pool-1'] = []
+
+        snapshot = self.aggregator.refresh()
+
+        self.assertEqual(list(snapshot.errors), ['nodes of pool pool-1'])
+        self.assertEqual(snapshot.pools['pool-1'].node_states, {'idle': 2, 'running': 1})
+        self.assertEqual(snapshot.jobs['job-1'].task_states, {'active': 1, 'completed': 1})
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
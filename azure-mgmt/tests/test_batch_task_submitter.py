@@ -0,0 +1,130 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import threading
+import unittest
+
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+import azure.batch.models as models
+from azure.batch.batch_task_submitter import BulkTaskSubmitter
+from testutils.fake_responses import batch_error
+
+
+JOB_ID = 'python-bulk-job'
+
+
+def make_tasks(count):
+    for index in range(count):
+        yield models.TaskAddParameter('task{}'.format(index), 'cmd /c echo hello')
+
+
+class FakeTaskOperations(object):
+    """Records add_collection calls and answers them with `behaviour`."""
+
+    def __init__(self, behaviour=None):
+        self.calls = []
+        self._lock = threading.Lock()
+        self._behaviour = behaviour or (lambda tasks, call: None)
+
+    def add_collection(self, job_id, value, task_add_collection_options=None, **kwargs):
+        with self._lock:
+            call = len(self.calls)
+            self.calls.append([task.id for task in value])
+        statuses = self._behaviour(value, call) or {}
+        return models.TaskAddCollectionResult(value=[
+            models.TaskAddResult(
+                status=statuses.get(task.id, models.TaskAddStatus.success),
+                task_id=task.id)
+            for task in value])
+
+
+def make_client(task_operations):
+    client = MagicMock()
+    client.task = task_operations
+    return client
+
+
+class BatchBulkTaskSubmitterTest(unittest.TestCase):
+
+    def test_add_tasks_in_chunks(self):
+        operations = FakeTaskOperations()
+        submitter = BulkTaskSubmitter(make_client(operations), max_workers=3)
+
+        result = submitter.add_tasks(JOB_ID, make_tasks(250))
+
+        self.assertEqual(len(result.value), 250)
+        self.assertEqual(sorted(len(c) for c in operations.calls), [50, 100, 100])
+        self.assertEqual(
+            set(r.task_id for r in result.value),
+            set('task{}'.format(i) for i in range(250)))
+
+    def test_resubmit_server_errors_only(self):
+        def behaviour(tasks, call):
+            if call == 0:
+                return {'task3': models.TaskAddStatus.server_error,
+                        'task7': models.TaskAddStatus.client_error}
+
+        operations = FakeTaskOperations(behaviour)
+        submitter = BulkTaskSubmitter(make_client(operations), retry_interval=0)
+
+        result = submitter.add_tasks(JOB_ID, make_tasks(10))
+
+        self.assertEqual(len(operations.calls), 2)
+        self.assertEqual(operations.calls[1], ['task3'])
+        statuses = dict((r.task_id, r.status) for r in result.value)
+        self.assertEqual(len(statuses), 10)
+        self.assertEqual(statuses['task3'], models.TaskAddStatus.success)
+        self.assertEqual(statuses['task7'], models.TaskAddStatus.client_error)
+
+    def test_retry_server_busy(self):
+        def behaviour(tasks, call):
+            if call < 2:
+                raise batch_error(503, 'ServerBusy')
+
+        operations = FakeTaskOperations(behaviour)
+        submitter = BulkTaskSubmitter(make_client(operations), retry_interval=0)
+
+        result = submitter.add_tasks(JOB_ID, make_tasks(5))
+
+        self.assertEqual(len(operations.calls), 3)
+        self.assertEqual(len(result.value), 5)
+
+    def test_bisect_request_body_too_large(self):
+        def behaviour(tasks, call):
+            if len(tasks) > 25:
+                raise batch_error(413, 'RequestBodyTooLarge')
+
+        operations = FakeTaskOperations(behaviour)
+        submitter = BulkTaskSubmitter(make_client(operations), max_workers=1)
+
+        result = submitter.add_tasks(JOB_ID, make_tasks(100))
+
+        self.assertEqual(len(result.value), 100)
+        self.assertEqual(
+            [len(c) for c in operations.calls], [100, 50, 25, 25, 50, 25, 25])
+
+    def test_non_retryable_error(self):
+        def behaviour(tasks, call):
+            raise batch_error(404, 'JobNotFound')
+
+        submitter = BulkTaskSubmitter(make_client(FakeTaskOperations(behaviour)))
+
+        with self.assertRaises(models.BatchErrorException):
+            submitter.add_tasks(JOB_ID, make_tasks(10))
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            BulkTaskSubmitter(MagicMock(), chunk_size=101)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import sys
+import unittest
+
+if sys.version_info >= (3, 5):
+    from tests.mgmt_aio_cases import MgmtAsyncOperationsTest
+else:
+    @unittest.skip('azure.common.aio requires Python 3.5 or later')
+    class MgmtAsyncOperationsTest(unittest.TestCase):
+
+        def test_operation(self):
+            pass
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
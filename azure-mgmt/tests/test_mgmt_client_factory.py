@@ -0,0 +1,75 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.common import client_factory
+from azure.mgmt.compute import ComputeManagementClient
+from azure.mgmt.resource import ResourceManagementClient
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+OTHER_SUBSCRIPTION_ID = '11111111-1111-1111-1111-111111111111'
+
+
+class MgmtClientFactoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mtime = 1.0
+        self.credentials = BasicTokenAuthentication({'access_token': 'token'})
+        cloud = mock.Mock()
+        cloud.endpoints.resource_manager = 'https://management.azure.com'
+        patches = [
+            mock.patch.object(client_factory, 'get_cli_profile_mtime', lambda: self.mtime),
+            mock.patch.object(client_factory, 'get_azure_cli_credentials',
+                              return_value=(self.credentials, SUBSCRIPTION_ID)),
+            mock.patch.object(client_factory, 'get_cli_active_cloud', return_value=cloud),
+        ]
+        self.get_credentials, self.get_cloud = [patch.start() for patch in patches][1:]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+        client_factory.clear_client_cache()
+        self.addCleanup(client_factory.clear_client_cache)
+
+    def test_cached_clients(self):
+        get = client_factory.get_cached_client_from_cli_profile
+        client = get(ComputeManagementClient)
+        self.assertIs(client.config.credentials, self.credentials)
+        self.assertEqual(client.config.subscription_id, SUBSCRIPTION_ID)
+        self.assertEqual(client.config.base_url, 'https://management.azure.com')
+        self.assertIs(get(ComputeManagementClient), client)
+        self.assertIs(get(ComputeManagementClient, subscription_id=SUBSCRIPTION_ID), client)
+
+        other = get(ComputeManagementClient, subscription_id=OTHER_SUBSCRIPTION_ID)
+        self.assertEqual(other.config.subscription_id, OTHER_SUBSCRIPTION_ID)
+        self.assertIsNot(get(ResourceManagementClient), client)
+        versioned = get(ResourceManagementClient, api_version='2016-09-01')
+        self.assertEqual(versioned.api_version, '2016-09-01')
+        self.assertIs(get(ResourceManagementClient, api_version='2016-09-01'), versioned)
+        self.assertEqual((self.get_credentials.call_count, self.get_cloud.call_count), (1, 1))
+
+        # Not cached.
+        self.assertIsNot(client_factory.get_client_from_cli_profile(ComputeManagementClient), client)
+
+    def test_profile_change(self):
+        get = client_factory.get_cached_client_from_cli_profile
+        client = get(ComputeManagementClient)
+        self.mtime = 2.0
+        self.assertIsNot(get(ComputeManagementClient), client)
+        self.assertEqual((self.get_credentials.call_count, self.get_cloud.call_count), (2, 2))
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import copy
+import gc
+import json
+import pickle
+import unittest
+
+import requests
+from msrest.authentication import BasicTokenAuthentication
+from msrest.serialization import Deserializer, Serializer
+
+from azure.common import compact, compiled
+from azure.common.compact import compact_class, compact_deserializer, use_compact_models
+from azure.mgmt.commerce.models import RateCardQueryParameters
+from azure.mgmt.commerce import models as commerce_models
+from azure.mgmt.network import NetworkManagementClient
+from azure.mgmt.network.v2017_03_01 import models as network_models
+from azure.mgmt.storage.v2016_12_01 import models as storage_models
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+INTERFACE = {
+    'id': '/subscriptions/sub/resourceGroups/group/providers/Microsoft.Network/networkInterfaces/nic',
+    'name': 'nic',
+    'location': 'westus',
+    'tags': {'environment': 'test'},
+    'properties': {
+        'primary': True,
+        'ipConfigurations': [{
+            'name': 'ipconfig1',
+            'properties': {'privateIPAddress': '10.0.0.4', 'privateIPAllocationMethod': 'Dynamic'},
+        }],
+    },
+}
+
+
+def network_deserializer():
+    classes = {k: v for k, v in network_models.__dict__.items() if isinstance(v, type)}
+    return Deserializer(classes)
+
+
+class MgmtCompactModelsTest(unittest.TestCase):
+
+    def test_compact_class(self):
+        interface_class = compact_class(network_models.NetworkInterface)
+        self.assertIs(compact_class(network_models.NetworkInterface), interface_class)
+        self.assertEqual(interface_class.__name__, 'NetworkInterface')
+        self.assertIs(interface_class.__bases__[0], compact_class(network_models.Resource))
+
+        interface = interface_class(id='nic-id', location='westus')
+        self.assertFalse(hasattr(interface, '__dict__'))
+        self.assertEqual(interface.location, 'westus')
+        self.assertIsNone(interface.name)
+        self.assertIsNone(interface.ip_configurations)
+        with self.assertRaises(AttributeError):
+            interface.unknown = True
+
+        subnet = compact_class(network_models.SubResource)('subnet-id')
+        self.assertEqual(subnet.id, 'subnet-id')
+        self.assertEqual(subnet, compact_class(network_models.SubResource)(id='subnet-id'))
+
+    def test_required_parameters(self):
+        # Required by the generated __init__, as by the compact one.
+        with self.assertRaises(TypeError):
+            network_models.ApplicationGatewayFirewallDisabledRuleGroup()
+        group_class = compact_class(network_models.ApplicationGatewayFirewallDisabledRuleGroup)
+        with self.assertRaises(TypeError):
+            group_class()
+        with self.assertRaises(TypeError):
+            group_class(rules=[1])
+        self.assertEqual(group_class('group').rule_group_name, 'group')
+        self.assertEqual(group_class(rule_group_name='group', rules=[1]).rules, [1])
+
+    def test_serialization_matches_generated_models(self):
+        deserializer = network_deserializer()
+        generated = deserializer('NetworkInterface', INTERFACE)
+        compact = compact_deserializer(deserializer)('NetworkInterface', INTERFACE)
+        self.assertIs(type(compact), compact_class(network_models.NetworkInterface))
+        self.assertIs(type(compact.ip_configurations[0]),
+                      compact_class(network_models.NetworkInterfaceIPConfiguration))
+        self.assertEqual(compact.ip_configurations[0].private_ip_address, '10.0.0.4')
+
+        serializer = Serializer()
+        self.assertEqual(serializer.body(compact, 'NetworkInterface'),
+                         serializer.body(generated, 'NetworkInterface'))
+        self.assertEqual(compact.as_dict(), generated.as_dict())
+        self.assertEqual(compact.validate(), [])
+
+        for restored in (pickle.loads(pickle.dumps(compact)), copy.deepcopy(compact)):
+            self.assertIs(type(restored), type(compact))
+            self.assertEqual(restored, compact)
+            self.assertIsNot(restored.ip_configurations[0], compact.ip_configurations[0])
+
+    def test_constants_and_polymorphism(self):
+        encryption = compact_class(storage_models.Encryption)()
+        self.assertEqual(encryption.key_source, 'Microsoft.Storage')
+        self.assertNotIn('key_source', type(encryption).__slots__)
+
+        classes = {k: v for k, v in commerce_models.__dict__.items() if isinstance(v, type)}
+        deserializer = compact_deserializer(Deserializer(classes))
+        terms = deserializer('[OfferTermInfo]', [{'Name': 'Recurring Charge', 'RecurringCharge': 10}])
+        self.assertIs(type(terms[0]), compact_class(commerce_models.RecurringCharge))
+        self.assertEqual(terms[0].recurring_charge, 10)
+        self.assertIsInstance(terms[0], compact_class(commerce_models.OfferTermInfo))
+
+        parameters = compact_class(RateCardQueryParameters)('MS-AZR-0003P', 'USD', 'en-US', 'US')
+        self.assertEqual(parameters.currency, 'USD')
+        self.assertEqual(parameters.region_info, 'US')
+
+    def test_use_compact_models(self):
+        client = NetworkManagementClient(
+            BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID)
+
+        def send(request, headers=None, content=None, **config):
+            response = requests.Response()
+            response.status_code = 200
+            response.request = request
+            response.headers['content-type'] = 'application/json'
+            response._content = json.dumps({'value': [INTERFACE, INTERFACE]}).encode('utf-8')
+            return response
+        client._client.send = send
+        self.assertIs(use_compact_models(client), client)
+
+        interfaces = list(client.network_interfaces.list_all())
+        self.assertEqual(len(interfaces), 2)
+        self.assertFalse(hasattr(interfaces[0], '__dict__'))
+        self.assertEqual(interfaces[0].name, 'nic')
+        self.assertEqual(type(interfaces[0]).__name__, 'NetworkInterface')
+
+        # Compact and generated models are accepted as parameters.
+        parameters = client._serialize.body(interfaces[0], 'NetworkInterface')
+        self.assertEqual(parameters['location'], 'westus')
+        self.assertEqual(parameters['properties']['ipConfigurations'][0]['name'], 'ipconfig1')
+
+    def test_compact_deserializer_lifetime(self):
+        classes = {k: v for k, v in network_models.__dict__.items() if isinstance(v, type)}
+        deserializer = compiled.Deserializer(classes)
+        compact_interfaces = compact_deserializer(deserializer)
+        self.assertIs(compact_deserializer(deserializer), compact_interfaces)
+        # The compiled functions build the compact models too.
+        self.assertIs(type(compact_interfaces), compiled.Deserializer)
+        interface = compact_interfaces('NetworkInterface', INTERFACE)
+        self.assertIs(type(interface), compact_class(network_models.NetworkInterface))
+        self.assertEqual(interface.ip_configurations[0].private_ip_address, '10.0.0.4')
+
+        count = len(compact._compact_deserializers)
+        del deserializer, compact_interfaces
+        gc.collect()
+        self.assertEqual(len(compact._compact_deserializers), count - 1)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import copy
+import json
+import unittest
+
+import msrest
+import requests
+from msrest.authentication import BasicTokenAuthentication
+from msrest.exceptions import DeserializationError, ValidationError
+
+from azure.common import compiled
+from azure.mgmt.commerce import models as commerce_models
+from azure.mgmt.network import NetworkManagementClient
+from azure.mgmt.network.v2017_03_01 import models as network_models
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+INTERFACE = {
+    'id': '/subscriptions/sub/resourceGroups/group/providers/Microsoft.Network/networkInterfaces/nic',
+    'name': 'nic',
+    'type': 'Microsoft.Network/networkInterfaces',
+    'location': 'westus',
+    'tags': {'environment': 'test'},
+    'properties': {
+        'primary': 'true',
+        'provisioningState': 'Succeeded',
+        'ipConfigurations': [{
+            'name': 'ipconfig1',
+            'properties': {
+                'privateIPAddress': '10.0.0.4',
+                'privateIPAllocationMethod': 'dynamic',
+                'subnet': {'id': 'subnet-id'},
+            },
+        }, None],
+    },
+}
+
+
+def classes(models):
+    return {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+
+
+def attributes(value):
+    if isinstance(value, list):
+        return [attributes(item) for item in value]
+    if hasattr(value, '_attribute_map'):
+        return type(value), [(k, attributes(v)) for k, v in vars(value).items()]
+    return value
+
+
+class MgmtCompiledModelsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.msrest_deserializer = msrest.Deserializer(classes(network_models))
+        self.msrest_serializer = msrest.Serializer(classes(network_models))
+        self.deserializer = compiled.Deserializer(classes(network_models))
+        self.serializer = compiled.Serializer(classes(network_models))
+
+    def test_deserialize(self):
+        for data_type, data in [('NetworkInterface', INTERFACE),
+                                ('[NetworkInterface]', [INTERFACE, None]),
+                                ('{NetworkInterface}', {'nic': INTERFACE}),
+                                ('NetworkInterface', None)]:
+            expected = self.msrest_deserializer(data_type, copy.deepcopy(data))
+            self.assertEqual(attributes(self.deserializer(data_type, data)), attributes(expected))
+
+        interface = self.deserializer('NetworkInterface', INTERFACE)
+        self.assertIs(interface.primary, True)
+        self.assertEqual(interface.type, 'Microsoft.Network/networkInterfaces')
+        self.assertEqual(interface.ip_configurations[0].subnet.id, 'subnet-id')
+        self.assertIsNone(interface.ip_configurations[1])
+
+    def test_deserialize_subtypes(self):
+        msrest_deserializer = msrest.Deserializer(classes(commerce_models))
+        deserializer = compiled.Deserializer(classes(commerce_models))
+        terms = [{'Name': 'Recurring Charge', 'RecurringCharge': 10},
+                 {'Name': 'Monetary Credit', 'Credit': 5, 'ExcludedMeterIds': ['meter']}]
+        expected = msrest_deserializer('[OfferTermInfo]', copy.deepcopy(terms))
+        self.assertEqual(attributes(deserializer('[OfferTermInfo]', terms)), attributes(expected))
+        self.assertEqual(terms[0]['Name'], 'Recurring Charge')
+
+        for deserialize in (msrest_deserializer, deserializer):
+            with self.assertRaises(DeserializationError):
+                deserialize('OfferTermInfo', {'Name': 'Unknown'})
+
+    def test_serialize(self):
+        interface = self.deserializer('NetworkInterface', INTERFACE)
+        for kwargs in ({}, {'keep_readonly': True}):
+            self.assertEqual(self.serializer.body(interface, 'NetworkInterface', **kwargs),
+                             self.msrest_serializer.body(interface, 'NetworkInterface', **kwargs))
+        self.assertNotIn('type', self.serializer.body(interface, 'NetworkInterface'))
+        body = self.serializer.body(interface, 'NetworkInterface', keep_readonly=True)
+        self.assertEqual(body['type'], 'Microsoft.Network/networkInterfaces')
+        self.assertEqual(body['properties']['ipConfigurations'][0]['properties']['subnet'], {'id': 'subnet-id'})
+
+        # Dictionaries given for models are left to msrest.
+        parameters = network_models.NetworkInterface(
+            location='westus', ip_configurations=[{'name': 'ipconfig1', 'subnet': {'id': 'subnet-id'}}])
+        expected = self.msrest_serializer.body(copy.deepcopy(parameters), 'NetworkInterface')
+        self.assertEqual(self.serializer.body(parameters, 'NetworkInterface'), expected)
+        self.assertEqual(expected['properties']['ipConfigurations'][0]['properties']['subnet'], {'id': 'subnet-id'})
+
+        invalid = network_models.SecurityRule('Tcp', '*', None, 'Allow', 'Inbound')
+        for serializer in (self.msrest_serializer, self.serializer):
+            with self.assertRaises(ValidationError):
+                serializer.body(invalid, 'SecurityRule')
+
+    def test_client(self):
+        client = NetworkManagementClient(
+            BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID)
+        requests_sent = []
+
+        def send(request, headers=None, content=None, **config):
+            requests_sent.append(request)
+            response = requests.Response()
+            response.status_code = 200
+            response.request = request
+            response.headers['content-type'] = 'application/json; charset=utf-8'
+            response._content = json.dumps({'value': [INTERFACE]}).encode('utf-8')
+            return response
+        client._client.send = send
+
+        group = client.network_interfaces
+        self.assertIsInstance(group._deserialize, compiled.Deserializer)
+        self.assertIsInstance(group._serialize, compiled.Serializer)
+        paged = group.list_all()
+        self.assertIs(paged._derserializer, group._deserialize)
+        interfaces = list(paged)
+        self.assertEqual(attributes(interfaces),
+                         attributes([self.msrest_deserializer('NetworkInterface', copy.deepcopy(INTERFACE))]))
+        self.assertEqual(len(requests_sent), 1)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
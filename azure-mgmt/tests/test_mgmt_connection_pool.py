@@ -0,0 +1,165 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import json
+import threading
+import unittest
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.common.connection_pool import ConnectionPool, get_connection_pool, use_connection_pool
+from azure.mgmt.resource import ResourceManagementClient
+from azure.mgmt.storage import StorageManagementClient
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = json.dumps({'name': 'group', 'location': 'westus', 'value': []}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MgmtConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = Server(('127.0.0.1', 0), Handler)
+        self.server.connections = 0
+        self.base_url = 'http://127.0.0.1:{}'.format(self.server.server_port)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def create_client(self, client_class):
+        return client_class(BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID,
+                            base_url=self.base_url)
+
+    def test_without_pool(self):
+        client = self.create_client(ResourceManagementClient)
+        for _ in range(3):
+            client.resource_groups.get('group')
+        self.assertEqual(self.server.connections, 3)
+
+    def test_shared_pool(self):
+        resource_client = self.create_client(ResourceManagementClient)
+        storage_client = self.create_client(StorageManagementClient)
+        pool = use_connection_pool(resource_client)
+        self.assertIs(use_connection_pool(storage_client), pool)
+        self.assertIs(get_connection_pool(self.base_url + '/other'), pool)
+        for _ in range(3):
+            resource_client.resource_groups.get('group')
+            list(storage_client.storage_accounts.list())
+        self.assertEqual(self.server.connections, 1)
+        statistics = pool.statistics()
+        self.assertEqual((statistics['hosts'], statistics['connections'], statistics['requests'],
+                          statistics['reused']), (1, 1, 6, 5))
+        self.assertAlmostEqual(statistics['reuse_rate'], 5 / 6.0)
+
+        pool.clear()
+        resource_client.resource_groups.get('group')
+        self.assertEqual(self.server.connections, 2)
+        self.assertEqual(pool.statistics()['connections'], 2)
+
+    def test_pool_size(self):
+        pool = ConnectionPool(pool_connections=1)
+        client = self.create_client(ResourceManagementClient)
+        use_connection_pool(client, pool)
+        client.resource_groups.get('group')
+        # A second host replaces the first one.
+        client.config.base_url = self.base_url.replace('127.0.0.1', 'localhost')
+        client.resource_groups.get('group')
+        statistics = pool.statistics()
+        self.assertEqual((statistics['hosts'], statistics['connections'], statistics['requests']), (1, 2, 2))
+
+    def test_proxy(self):
+        pool = ConnectionPool()
+        clients = []
+        for _ in range(4):
+            client = ResourceManagementClient(BasicTokenAuthentication({'access_token': 'token'}),
+                                              SUBSCRIPTION_ID, base_url='http://management.invalid')
+            client.config.proxies.add('http', self.base_url)
+            use_connection_pool(client, pool)
+            clients.append(client)
+        threads = [threading.Thread(target=client.resource_groups.get, args=('group',))
+                   for client in clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # The adapters of the pool share one manager per proxy.
+        self.assertEqual(len(pool._proxy_managers), 1)
+        statistics = pool.statistics()
+        self.assertEqual((statistics['hosts'], statistics['requests']), (1, 4))
+        self.assertEqual(statistics['connections'], self.server.connections)
+
+    def test_clear_during_statistics(self):
+        pool = ConnectionPool()
+        client = self.create_client(ResourceManagementClient)
+        use_connection_pool(client, pool)
+        proxied = ResourceManagementClient(BasicTokenAuthentication({'access_token': 'token'}),
+                                           SUBSCRIPTION_ID, base_url='http://management.invalid')
+        proxied.config.proxies.add('http', self.base_url)
+        use_connection_pool(proxied, pool)
+        done = threading.Event()
+
+        def read_statistics():
+            while not done.is_set():
+                pool.statistics()
+
+        threads = [threading.Thread(target=read_statistics) for _ in range(2)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            for _ in range(20):
+                client.resource_groups.get('group')
+                proxied.resource_groups.get('group')
+                clearing = threading.Thread(target=pool.clear)
+                clearing.daemon = True
+                clearing.start()
+                clearing.join(5)
+                self.assertFalse(clearing.is_alive(), 'clear() deadlocked with statistics()')
+        finally:
+            done.set()
+        for thread in threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive(), 'statistics() deadlocked with clear()')
+        self.assertEqual(pool.statistics()['requests'], 40)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
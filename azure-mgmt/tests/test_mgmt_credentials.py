@@ -0,0 +1,109 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import datetime
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from msrest.authentication import Authentication, BasicTokenAuthentication
+
+from azure.common import credentials
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+
+class FakeAdalAuthentication(Authentication):
+    """The credentials of the CLI profile, as in azure.cli.core.adal_authentication."""
+
+    def __init__(self, token_retriever):
+        self._token_retriever = token_retriever
+
+
+class FakeProfile(object):
+
+    def __init__(self, test):
+        self.test = test
+        self.resources = []
+
+    def get_login_credentials(self, resource='https://management.core.windows.net/'):
+        self.resources.append(resource)
+        return FakeAdalAuthentication(lambda: self.test.retrieve_token(resource)), SUBSCRIPTION_ID, 'tenant'
+
+
+class MgmtCredentialsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mtime = 1.0
+        self.profiles = []
+        self.tokens = []
+        self.expires_in = 3600
+        patches = [
+            mock.patch.object(credentials, 'get_cli_profile_mtime', lambda: self.mtime),
+            mock.patch.object(credentials, '_load_cli_profile', self.load_profile),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        credentials._cli_cache.clear()
+        self.addCleanup(credentials._cli_cache.clear)
+
+    def load_profile(self):
+        self.profiles.append(FakeProfile(self))
+        return self.profiles[-1]
+
+    def retrieve_token(self, resource):
+        self.tokens.append(resource)
+        expires_on = datetime.datetime.now() + datetime.timedelta(seconds=self.expires_in)
+        return 'Bearer', 'token{}'.format(len(self.tokens)), {
+            'accessToken': 'token', 'expiresOn': expires_on.strftime('%Y-%m-%d %H:%M:%S.%f')}
+
+    def test_profile(self):
+        profile = credentials.get_cli_profile()
+        self.assertIs(credentials.get_cli_profile(), profile)
+        cred, subscription_id = credentials.get_azure_cli_credentials()
+        self.assertEqual(subscription_id, SUBSCRIPTION_ID)
+        self.assertIs(credentials.get_azure_cli_credentials()[0], cred)
+        other, _ = credentials.get_azure_cli_credentials(resource='https://vault.azure.net')
+        self.assertIsNot(other, cred)
+        self.assertEqual(profile.resources, ['https://management.core.windows.net/', 'https://vault.azure.net'])
+
+        # "az login" writes the profile file.
+        self.mtime = 2.0
+        self.assertIsNot(credentials.get_cli_profile(), profile)
+        self.assertIsNot(credentials.get_azure_cli_credentials()[0], cred)
+        self.assertEqual(len(self.profiles), 2)
+
+    def test_token_cache(self):
+        cred, _ = credentials.get_azure_cli_credentials()
+        for _ in range(3):
+            self.assertEqual(cred.signed_session().headers['Authorization'], 'Bearer token1')
+        vault_cred, _ = credentials.get_azure_cli_credentials(resource='https://vault.azure.net')
+        self.assertEqual(vault_cred.signed_session().headers['Authorization'], 'Bearer token2')
+        self.assertEqual(cred.signed_session().headers['Authorization'], 'Bearer token1')
+        self.assertEqual(cred.refresh_session().headers['Authorization'], 'Bearer token3')
+
+        # A token about to expire is replaced.
+        self.expires_in = 60
+        self.assertEqual(cred.refresh_session().headers['Authorization'], 'Bearer token4')
+        self.assertEqual(cred.signed_session().headers['Authorization'], 'Bearer token5')
+        self.assertEqual(self.tokens, ['https://management.core.windows.net/', 'https://vault.azure.net'] +
+                         ['https://management.core.windows.net/'] * 3)
+
+    def test_other_credentials(self):
+        cred = credentials.CachedTokenCredentials(BasicTokenAuthentication({'access_token': 'token'}))
+        self.assertEqual(cred.signed_session().headers['Authorization'], 'Bearer token')
+        self.assertEqual(cred.token, {'access_token': 'token'})
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
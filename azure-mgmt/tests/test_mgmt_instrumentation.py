@@ -0,0 +1,214 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import io
+import json
+import time
+import unittest
+
+import requests
+from msrest.authentication import BasicTokenAuthentication
+from msrestazure.azure_exceptions import CloudError
+
+from azure.common.instrumentation import (
+    Instrumentation, LatencyAggregator, OperationRecord, use_instrumentation)
+from azure.keyvault import KeyVaultClient
+from azure.mgmt.resource import ResourceManagementClient
+from azure.mgmt.dns import DnsManagementClient
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+NEXT_LINK = 'https://management.azure.com/next'
+
+
+class FakeCredentials(BasicTokenAuthentication):
+    """Credentials of sessions answering with a function."""
+
+    def __init__(self, request):
+        super(FakeCredentials, self).__init__({'access_token': 'token'})
+        self.request = request
+
+    def signed_session(self):
+        session = super(FakeCredentials, self).signed_session()
+        session.request = self.request
+        return session
+
+
+class SlowBody(io.BytesIO):
+    """A response body taking `delay` seconds to arrive."""
+
+    def __init__(self, content, delay):
+        super(SlowBody, self).__init__(content)
+        self.delay = delay
+
+    def read(self, *args):
+        time.sleep(self.delay)
+        self.delay = 0
+        return super(SlowBody, self).read(*args)
+
+
+class SigningCredentials(BasicTokenAuthentication):
+    """Credentials of sessions signing each request in `delay` seconds, as
+    the SharedKeyAuth of Batch, and answering with a slow body."""
+
+    def __init__(self, delay):
+        super(SigningCredentials, self).__init__({'access_token': 'token'})
+        self.delay = delay
+
+    def sign(self, request):
+        time.sleep(self.delay)
+        return request
+
+    def signed_session(self):
+        session = super(SigningCredentials, self).signed_session()
+        session.auth = self.sign
+
+        def request(method, url, data=None, headers=None, **kwargs):
+            session.auth(requests.Request(method, url).prepare())
+            response = requests.Response()
+            response.status_code = 200
+            response.headers['content-type'] = 'application/json; charset=utf-8'
+            response.raw = SlowBody(b'{"name": "group", "location": "westus"}', self.delay)
+            response._content = False
+            return response
+        session.request = request
+        return session
+
+
+class MgmtInstrumentationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.credentials = FakeCredentials(self.request)
+        self.records = []
+        self.sizes = []
+        self.instrumentation = Instrumentation(self.records.append)
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        response = requests.Response()
+        response.headers['content-type'] = 'application/json; charset=utf-8'
+        path = url.split('?')[0]
+        if method == 'HEAD':
+            response.status_code = 204
+            body = None
+        elif path.endswith('/missing'):
+            response.status_code = 404
+            body = {'error': {'code': 'ResourceGroupNotFound', 'message': 'Not found'}}
+        elif path.endswith('/resourcegroups'):
+            response.status_code = 200
+            body = {'value': [{'name': 'first', 'location': 'westus'}], 'nextLink': NEXT_LINK}
+        elif path == NEXT_LINK:
+            response.status_code = 200
+            body = {'value': [{'name': 'second', 'location': 'westus'}]}
+        else:
+            response.status_code = 200
+            body = {'name': 'group', 'location': 'westus', 'id': path, 'value': 'secret'}
+        response._content = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.sizes.append(len(response._content))
+        return response
+
+    def create_client(self, client_class, *args):
+        client = client_class(self.credentials, *args)
+        use_instrumentation(client, self.instrumentation)
+        return client
+
+    def test_operations(self):
+        client = self.create_client(ResourceManagementClient, SUBSCRIPTION_ID)
+        client.resource_groups.create_or_update('group', {'location': 'westus'})
+        client.resource_groups.get('group')
+        with self.assertRaises(CloudError):
+            client.resource_groups.get('missing')
+        self.assertEqual([record.operation for record in self.records], [
+            'resource_groups.create_or_update', 'resource_groups.get', 'resource_groups.get'])
+        create, get, missing = self.records
+        self.assertEqual((create.status_code, create.requests, create.bytes_out),
+                         (200, 1, len(b'{"location": "westus"}')))
+        self.assertEqual([record.bytes_in for record in self.records], self.sizes)
+        self.assertEqual(get.bytes_out, 0)
+        for record in self.records:
+            self.assertGreater(record.serialize, 0)
+            self.assertGreater(record.auth, 0)
+            self.assertGreater(record.network, 0)
+            # CloudError parses the error responses itself.
+            self.assertEqual(record.deserialize > 0, record.error is None)
+            self.assertGreaterEqual(
+                record.duration, record.serialize + record.auth + record.network + record.deserialize)
+        self.assertIsNone(get.error)
+        self.assertIsInstance(missing.error, CloudError)
+        self.assertEqual(missing.status_code, 404)
+
+    def test_paging(self):
+        client = self.create_client(ResourceManagementClient, SUBSCRIPTION_ID)
+        groups = client.resource_groups.list()
+        self.assertEqual(self.records, [])
+        self.assertEqual([group.name for group in groups], ['first', 'second'])
+        self.assertEqual([record.operation for record in self.records], ['resource_groups.list'] * 2)
+        self.assertTrue(all(record.requests == 1 and record.deserialize > 0 for record in self.records))
+
+    def test_client_operations(self):
+        # Groups created by the client constructor.
+        client = self.create_client(DnsManagementClient, SUBSCRIPTION_ID)
+        client.zones.get('group', 'zone.com')
+        # Operations of the client itself.
+        client = self.create_client(KeyVaultClient)
+        bundle = client.get_secret('https://vault.vault.azure.net', 'name', '')
+        self.assertEqual(bundle.value, 'secret')
+        self.assertEqual([record.operation for record in self.records], ['zones.get', 'get_secret'])
+
+    def test_disabled_and_report(self):
+        aggregator = LatencyAggregator()
+        self.instrumentation.callback = aggregator
+        client = self.create_client(ResourceManagementClient, SUBSCRIPTION_ID)
+        for _ in range(3):
+            client.resource_groups.get('group')
+        self.instrumentation.enabled = False
+        client.resource_groups.get('group')
+        self.instrumentation.enabled = True
+        client.resource_groups.check_existence('group')
+
+        summary = aggregator.summary()
+        self.assertEqual(sorted(summary), ['resource_groups.check_existence', 'resource_groups.get'])
+        get = summary['resource_groups.get']
+        self.assertEqual((get['count'], get['errors']), (3, 0))
+        self.assertLessEqual(get['p50'], get['p99'])
+        self.assertGreater(get['bytes_in'], 0)
+        output = io.StringIO()
+        aggregator.report(output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith('operation'))
+        self.assertTrue(lines[2].startswith('resource_groups.get '))
+
+    def test_signing_and_body_times(self):
+        client = ResourceManagementClient(SigningCredentials(0.05), SUBSCRIPTION_ID)
+        use_instrumentation(client, self.instrumentation)
+        client.resource_groups.get('group')
+        record, = self.records
+        self.assertGreaterEqual(record.auth, 0.05)
+        # The body transfer, but not the signing.
+        self.assertGreaterEqual(record.network, 0.05)
+        self.assertLess(record.network, 0.1)
+        self.assertLess(record.deserialize, 0.05)
+        self.assertEqual(record.bytes_in, len(b'{"name": "group", "location": "westus"}'))
+
+    def test_aggregator_sample(self):
+        aggregator = LatencyAggregator(sample_size=10)
+        for index in range(1000):
+            record = OperationRecord('operation')
+            record.duration = index / 1000.0
+            record.bytes_in = 1
+            record.error = ValueError() if index % 10 == 0 else None
+            aggregator(record)
+        operation = aggregator._operations['operation']
+        self.assertEqual(len(operation.durations), 10)
+        summary = aggregator.summary()['operation']
+        self.assertEqual((summary['count'], summary['errors'], summary['bytes_in']), (1000, 100, 1000))
+        self.assertLessEqual(summary['p50'], summary['p99'])
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
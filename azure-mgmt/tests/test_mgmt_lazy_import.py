@@ -0,0 +1,58 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import unittest
+
+
+def run(code):
+    """Run `code` in a fresh interpreter, where nothing is imported yet."""
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.check_output(
+        [sys.executable, '-c', code], env=environment).decode('utf-8').split()
+
+
+class MgmtLazyImportTest(unittest.TestCase):
+
+    def test_package_import_defers_client(self):
+        loaded = run(
+            "import sys\n"
+            "import azure.mgmt.web\n"
+            "print('azure.mgmt.web.web_site_management_client' in sys.modules)\n"
+            "from azure.mgmt.web.models import Site\n"
+            "print('azure.mgmt.web.operations' in sys.modules)\n"
+            "print(azure.mgmt.web.WebSiteManagementClient.__name__)\n"
+            "print(azure.mgmt.web.models.Site is Site)\n")
+        self.assertEqual(loaded, ['False', 'False', 'WebSiteManagementClient', 'True'])
+
+    def test_models_alias(self):
+        loaded = run(
+            "import sys\n"
+            "import azure.mgmt.compute.models\n"
+            "print(any('v2016_04_30_preview.models' in name for name in sys.modules))\n"
+            "from azure.mgmt.compute.models import *\n"
+            "print(VirtualMachine.__module__)\n"
+            "print('OSDisk' in dir(azure.mgmt.compute.models))\n")
+        self.assertEqual(loaded, [
+            'False',
+            'azure.mgmt.compute.compute.v2016_04_30_preview.models.virtual_machine',
+            'True'])
+
+    def test_unknown_attribute(self):
+        import azure.mgmt.resource
+        with self.assertRaises(AttributeError):
+            azure.mgmt.resource.UnknownClient
+        self.assertFalse(hasattr(azure.mgmt.resource, '__wrapped__'))
+        from azure.mgmt.resource import ResourceManagementClient
+        self.assertIs(azure.mgmt.resource.ResourceManagementClient, ResourceManagementClient)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
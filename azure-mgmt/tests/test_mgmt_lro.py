@@ -0,0 +1,108 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import threading
+import unittest
+from concurrent.futures import Future, wait
+
+from msrest.authentication import BasicTokenAuthentication
+from msrestazure.azure_exceptions import CloudError
+from msrestazure.azure_operation import AzureOperationPoller
+
+from azure.common.lro import LongRunningOperationEngine
+from azure.mgmt.network import NetworkManagementClient
+from testutils.fake_responses import make_response
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+STATUS_URL = 'https://management.azure.com/operations/{}'
+
+
+class FakeService(object):
+    """Virtual network creation taking `polls` status requests, which
+    answers with a Retry-After of 0 so that polling does not wait."""
+
+    def __init__(self, polls=2, final_status='Succeeded'):
+        self.polls = polls
+        self.final_status = final_status
+        self.lock = threading.Lock()
+        self.status_requests = {}
+        self.threads = set()
+
+    def send(self, request, headers=None, content=None, **config):
+        with self.lock:
+            self.threads.add(threading.current_thread().name)
+        name = request.url.split('?')[0].rsplit('/', 1)[-1]
+        if request.method == 'PUT':
+            return make_response(
+                {'name': name, 'properties': {'provisioningState': 'Updating'}}, 201, request,
+                {'azure-asyncoperation': STATUS_URL.format(name), 'retry-after': '0'})
+        if request.url.startswith(STATUS_URL.format('')):
+            with self.lock:
+                count = self.status_requests[name] = self.status_requests.get(name, 0) + 1
+            status = self.final_status if count >= self.polls else 'InProgress'
+            return make_response({'status': status}, request=request, headers={'retry-after': '0'})
+        return make_response({'name': name, 'properties': {'provisioningState': 'Succeeded'}}, request=request)
+
+
+class MgmtLongRunningOperationEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = NetworkManagementClient(
+            BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID)
+        self.service = FakeService()
+        self.client._client.send = self.service.send
+        self.parameters = self.client.models().VirtualNetwork(location='westus')
+
+    def test_default_poller(self):
+        poller = self.client.virtual_networks.create_or_update('group', 'vnet', self.parameters)
+        self.assertIsInstance(poller, AzureOperationPoller)
+        self.assertEqual(poller.result().name, 'vnet')
+
+    def test_operations_share_scheduler(self):
+        with LongRunningOperationEngine(max_workers=2) as engine:
+            futures = [
+                self.client.virtual_networks.create_or_update(
+                    'group', 'vnet-{}'.format(index), self.parameters,
+                    long_running_operation_timeout=30, long_running_operation_engine=engine)
+                for index in range(20)]
+            done, not_done = wait(futures, timeout=10)
+
+        self.assertFalse(not_done)
+        self.assertIsInstance(futures[0], Future)
+        self.assertEqual([future.result().name for future in futures],
+                         ['vnet-{}'.format(index) for index in range(20)])
+        self.assertEqual(set(self.service.status_requests.values()), {2})
+        self.assertLessEqual(len(self.service.threads), 2)
+
+    def test_failed_operation(self):
+        self.service.final_status = 'Failed'
+        with LongRunningOperationEngine() as engine:
+            future = self.client.virtual_networks.create_or_update(
+                'group', 'vnet', self.parameters, long_running_operation_engine=engine)
+            with self.assertRaises(CloudError):
+                future.result(timeout=10)
+
+    def test_cancel_before_send(self):
+        engine = LongRunningOperationEngine()
+        engine.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.client.virtual_networks.delete('group', 'vnet', long_running_operation_engine=engine)
+
+        engine = LongRunningOperationEngine(max_workers=1)
+        blocked = threading.Event()
+        engine.submit(blocked.wait, None, None)
+        future = engine.submit(self.fail, None, None)
+        self.assertTrue(future.cancel())
+        blocked.set()
+        engine.shutdown()
+        self.assertTrue(future.cancelled())
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import unittest
+
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.mgmt.compute import ComputeManagementClient
+from azure.mgmt.network import NetworkManagementClient
+from azure.mgmt.resource import PolicyClient, ResourceManagementClient
+
+
+CREDENTIALS = BasicTokenAuthentication({'access_token': 'token'})
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+
+class MgmtMultiApiTest(unittest.TestCase):
+
+    def test_serializers_shared_per_api_version(self):
+        first = ComputeManagementClient(CREDENTIALS, SUBSCRIPTION_ID)
+        second = ComputeManagementClient(CREDENTIALS, SUBSCRIPTION_ID)
+        other = ComputeManagementClient(CREDENTIALS, SUBSCRIPTION_ID, api_version='2015-06-15')
+
+        self.assertIs(first._serialize, second._serialize)
+        self.assertIs(first._deserialize, second._deserialize)
+        self.assertIsNot(first._deserialize, other._deserialize)
+        self.assertIn('OSDisk', first._deserialize.dependencies)
+        self.assertNotIn('Disk', other._deserialize.dependencies)
+
+    def test_operation_groups_memoized_per_client(self):
+        first = ResourceManagementClient(CREDENTIALS, SUBSCRIPTION_ID)
+        second = ResourceManagementClient(CREDENTIALS, SUBSCRIPTION_ID)
+
+        self.assertIs(first.resource_groups, first.resource_groups)
+        self.assertIsNot(first.resource_groups, second.resource_groups)
+        self.assertIs(first.resource_groups._deserialize, first._deserialize)
+
+    def test_operation_group_api_version(self):
+        client = PolicyClient(CREDENTIALS, SUBSCRIPTION_ID, api_version='2015-10-01-preview')
+
+        self.assertEqual(
+            type(client.policy_definitions).__module__,
+            'azure.mgmt.resource.policy.v2015_10_01_preview.operations.policy_definitions_operations')
+        with self.assertRaises(NotImplementedError):
+            NetworkManagementClient(CREDENTIALS, SUBSCRIPTION_ID, api_version='2000-01-01')
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import io
+import json
+import threading
+import time
+import unittest
+
+from msrest.authentication import BasicTokenAuthentication
+from msrestazure.azure_exceptions import CloudError
+
+from azure.common.paging import write_ndjson
+from azure.mgmt.network import NetworkManagementClient
+from testutils.fake_responses import make_response
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+PAGE_URL = 'https://management.azure.com/page/{}'
+
+
+class MgmtPagingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = NetworkManagementClient(
+            BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID)
+        self.client._client.send = self.send
+        self.pages = 5
+        self.failing_page = None
+        self.requests = []
+
+    def send(self, request, headers=None, content=None, **config):
+        self.requests.append(threading.current_thread())
+        index = int(request.url.rsplit('/', 1)[1]) if request.url.startswith(PAGE_URL.format('')) else 0
+        if index == self.failing_page:
+            return make_response({'error': {'code': 'InternalError', 'message': 'Failed'}}, 500, request)
+        body = {'value': [{'name': 'nic-{}-{}'.format(index, item)} for item in range(2)]}
+        if index + 1 < self.pages:
+            body['nextLink'] = PAGE_URL.format(index + 1)
+        return make_response(body, request=request)
+
+    def names(self, paged):
+        return [interface.name for interface in paged]
+
+    def test_default_is_not_prefetched(self):
+        paged = self.client.network_interfaces.list_all()
+        self.assertIs(type(paged), self.client.models().NetworkInterfacePaged)
+        self.assertEqual(len(self.names(paged)), 10)
+        self.assertEqual(set(self.requests), {threading.current_thread()})
+
+    def test_prefetch_per_call(self):
+        expected = self.names(self.client.network_interfaces.list_all())
+        self.requests = []
+
+        paged = self.client.network_interfaces.list_all(paging_prefetch_depth=2)
+        self.assertIsInstance(paged, self.client.models().NetworkInterfacePaged)
+        self.assertEqual(self.names(paged), expected)
+        self.assertEqual(len(self.requests), 5)
+        self.assertNotIn(threading.current_thread(), self.requests)
+
+    def test_prefetch_per_client_and_backpressure(self):
+        self.client.config.paging_prefetch_depth = 1
+        paged = self.client.network_interfaces.list_all()
+        self.assertEqual(next(paged).name, 'nic-0-0')
+        time.sleep(0.5)
+        # The current page, the queued one and the one waiting for room.
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(len(self.names(paged)), 9)
+        self.assertEqual(len(self.requests), 5)
+
+    def test_prefetch_error(self):
+        self.failing_page = 2
+        paged = self.client.network_interfaces.list_all(paging_prefetch_depth=4)
+        with self.assertRaises(CloudError):
+            self.names(paged)
+        self.assertEqual(len(self.requests), 3)
+
+    def test_raw_items(self):
+        for depth in (0, 2):
+            items = list(self.client.network_interfaces.list_all(
+                paging_raw_items=True, paging_prefetch_depth=depth))
+            self.assertEqual(len(items), 10)
+            self.assertEqual(items[0], {'name': 'nic-0-0'})
+
+    def test_write_ndjson(self):
+        paged = self.client.network_interfaces.list_all(paging_raw_items=True)
+        self.assertEqual(next(paged)['name'], 'nic-0-0')
+        output = io.StringIO()
+        self.assertEqual(write_ndjson(paged, output), 9)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 9)
+        self.assertEqual(lines[0], '{"name":"nic-0-1"}')
+        self.assertEqual(json.loads(lines[-1]), {'name': 'nic-4-1'})
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
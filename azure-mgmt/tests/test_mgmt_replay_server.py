@@ -0,0 +1,62 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import os
+import unittest
+
+from msrest.authentication import BasicTokenAuthentication
+from msrestazure.azure_exceptions import CloudError
+
+from azure.common.connection_pool import ConnectionPool, use_connection_pool
+from azure.mgmt.storage import StorageManagementClient
+from azure.mgmt.storage.models import Kind, Sku, StorageAccountCreateParameters
+from testutils.load_driver import run_load
+from testutils.replay_server import ReplayServer
+
+
+RECORDING = os.path.join(os.path.dirname(__file__), 'recordings', 'test_mgmt_storage.test_storage_accounts.yaml')
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+GROUP = 'test_mgmt_storage_test_storage_accounts43b8102a'
+ACCOUNT = 'pyarmstorage43b8102a'
+
+
+class MgmtReplayServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ReplayServer([RECORDING], max_concurrency=2).start()
+        self.addCleanup(self.server.stop)
+        self.client = StorageManagementClient(
+            BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID, base_url=self.server.base_url)
+        self.client.config.long_running_operation_timeout = 0
+
+    def test_replay(self):
+        account = self.client.storage_accounts.create(GROUP, ACCOUNT, StorageAccountCreateParameters(
+            sku=Sku('Standard_LRS'), kind=Kind.storage, location='westus')).result()
+        self.assertEqual(account.name, ACCOUNT)
+        self.assertEqual(self.client.storage_accounts.get_properties(GROUP, ACCOUNT.upper()).name, ACCOUNT)
+        self.assertEqual([account.name for account in self.client.storage_accounts.list_by_resource_group(GROUP)],
+                         [ACCOUNT])
+        with self.assertRaises(CloudError):
+            self.client.storage_accounts.get_properties(GROUP, 'missing')
+        statistics = self.server.statistics()
+        self.assertEqual((statistics['requests'], statistics['unmatched']), (5, 1))
+
+    def test_load(self):
+        pool = use_connection_pool(self.client, ConnectionPool())
+        result = run_load(lambda: self.client.storage_accounts.get_properties(GROUP, ACCOUNT), 20, 4)
+        self.assertEqual((result.iterations, result.errors, len(result.latencies)), (20, [], 20))
+        self.assertLessEqual(result.percentile(50), result.percentile(99))
+        self.assertGreater(result.throughput, 0)
+        statistics = self.server.statistics()
+        self.assertEqual(statistics['requests'], 20)
+        self.assertLessEqual(statistics['connections'], 4)
+        self.assertEqual(pool.statistics()['connections'], statistics['connections'])
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
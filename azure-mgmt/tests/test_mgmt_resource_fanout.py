@@ -0,0 +1,121 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import gc
+import json
+import threading
+import time
+import unittest
+
+import requests
+from msrest.authentication import BasicTokenAuthentication
+from msrestazure.azure_exceptions import CloudError
+
+from azure.mgmt.resource import ResourceManagementClient
+from azure.mgmt.resource.fanout import FanOutItem, SubscriptionFanOut
+
+
+BASE_URL = 'https://management.example.com'
+SUBSCRIPTIONS = {
+    'aaaaaaaa-0000-0000-0000-000000000000': 'Enabled',
+    'bbbbbbbb-0000-0000-0000-000000000000': 'Enabled',
+    'cccccccc-0000-0000-0000-000000000000': 'Warned',
+    'dddddddd-0000-0000-0000-000000000000': 'Disabled',
+}
+FIRST, FAILING, THIRD, _ = sorted(SUBSCRIPTIONS)
+
+
+class FakeCredentials(BasicTokenAuthentication):
+    """Credentials of sessions answering with a function."""
+
+    def __init__(self, request):
+        super(FakeCredentials, self).__init__({'access_token': 'token'})
+        self.request = request
+
+    def signed_session(self):
+        session = super(FakeCredentials, self).signed_session()
+        session.request = self.request
+        return session
+
+
+class MgmtResourceFanOutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.fan_out = SubscriptionFanOut(FakeCredentials(self.request), max_workers=2, base_url=BASE_URL)
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        path = url[len(BASE_URL):].split('?')[0]
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['content-type'] = 'application/json; charset=utf-8'
+        if path == '/subscriptions':
+            body = {'value': [{'subscriptionId': subscription_id, 'state': state}
+                              for subscription_id, state in sorted(SUBSCRIPTIONS.items())]}
+        else:
+            subscription_id = path.split('/')[2]
+            page = 2 if path.endswith('/page2') else 1
+            if page == 2:
+                self.release.wait(5)
+            if subscription_id == FAILING:
+                response.status_code = 500
+                body = {'error': {'code': 'InternalServerError', 'message': 'Failed'}}
+            else:
+                body = {'value': [{'name': '{}-{}'.format(subscription_id[0], page)}]}
+                if subscription_id == FIRST and page == 1:
+                    body['nextLink'] = '{}/subscriptions/{}/page2'.format(BASE_URL, subscription_id)
+        response._content = json.dumps(body).encode('utf-8')
+        return response
+
+    def test_fan_out(self):
+        self.assertEqual(self.fan_out.subscription_ids(), [FIRST, FAILING, THIRD])
+        with self.fan_out.run(ResourceManagementClient, lambda client: client.resources.list()) as results:
+            items = list(results)
+        self.assertEqual(sorted((item.subscription_id, item.item.name) for item in items),
+                         [(FIRST, 'a-1'), (FIRST, 'a-2'), (THIRD, 'c-1')])
+        self.assertIsInstance(items[0], FanOutItem)
+        self.assertEqual(list(results.errors), [FAILING])
+        self.assertIsInstance(results.errors[FAILING], CloudError)
+
+        # The clients are reused by the next runs.
+        client = self.fan_out.client(ResourceManagementClient, THIRD)
+        results = self.fan_out.run(ResourceManagementClient, lambda client: client, [THIRD])
+        self.assertEqual(list(results), [FanOutItem(THIRD, client)])
+
+    def test_cancel(self):
+        self.release.clear()
+        results = self.fan_out.run(ResourceManagementClient, lambda client: client.resources.list(), [FIRST])
+        self.assertEqual(next(results).item.name, 'a-1')
+        results.cancel()
+        self.release.set()
+        self.assertEqual(list(results), [])
+        self.assertTrue(results.cancelled)
+        self.assertEqual(results.errors, {})
+
+    def test_early_exit(self):
+        def generate(client):
+            for index in range(100):
+                yield index
+
+        for item in self.fan_out.run(ResourceManagementClient, generate, [FIRST, THIRD], queue_size=1):
+            break
+        self.assertIn(item.item, (0, 1))
+        workers = [thread for thread in threading.enumerate() if thread.name == 'SubscriptionFanOut']
+        self.assertTrue(all(thread.daemon for thread in workers))
+
+        # Dropping the results stops the workers blocked on the full queue.
+        gc.collect()
+        deadline = time.time() + 5
+        while any(thread.is_alive() for thread in workers) and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(any(thread.is_alive() for thread in workers))
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import json
+import unittest
+
+import requests
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.common.lro import operation_poller
+from azure.common.response_cache import ResponseCache, use_response_cache
+from azure.mgmt.resource import ResourceManagementClient
+
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+
+class MgmtResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = ResourceManagementClient(
+            BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID)
+        self.client._client.send = self.send
+        self.requests = []
+        self.etags = {}
+        self.version = 0
+
+    def send(self, request, headers=None, content=None, **config):
+        self.requests.append((request.method, request.url, dict(headers or {})))
+        name = request.url.split('?')[0].rsplit('/', 1)[1]
+        response = requests.Response()
+        response.request = request
+        response.headers['content-type'] = 'application/json; charset=utf-8'
+        response.headers['x-ms-request-id'] = str(len(self.requests))
+        etag = self.etags.get(name)
+        if request.method == 'PUT':
+            self.version += 1
+        if etag is not None:
+            etag = '"{}-{}"'.format(etag, self.version)
+            response.headers['ETag'] = etag
+            if (headers or {}).get('If-None-Match') == etag:
+                response.status_code = 304
+                return response
+        response.status_code = 200
+        response._content = json.dumps(
+            {'name': name, 'location': 'westus', 'tags': {'version': str(self.version)}}).encode('utf-8')
+        return response
+
+    def test_etag_revalidation(self):
+        self.etags['group'] = 'etag'
+        cache = use_response_cache(self.client)
+        group = self.client.resource_groups.get('group')
+        self.assertIs(self.client.resource_groups.get('group'), group)
+        raw = self.client.resource_groups.get('group', raw=True)
+        self.assertIs(raw.output, group)
+        self.assertEqual(raw.response.status_code, 200)
+        self.assertEqual(raw.response.headers['x-ms-request-id'], '3')
+        self.assertEqual(len(self.requests), 3)
+        self.assertNotIn('If-None-Match', self.requests[0][2])
+        self.assertEqual(self.requests[1][2]['If-None-Match'], '"etag-0"')
+
+        # The client's own writes invalidate the result.
+        self.client.resource_groups.create_or_update('group', {'location': 'westus'})
+        group = self.client.resource_groups.get('group')
+        self.assertEqual(group.tags, {'version': '1'})
+        self.assertNotIn('If-None-Match', self.requests[-1][2])
+
+        statistics = cache.statistics()
+        self.assertEqual((statistics['hits'], statistics['not_modified'], statistics['misses']), (0, 2, 2))
+        self.assertEqual(statistics['hit_rate'], 0.5)
+        self.assertEqual(statistics['invalidations'], 1)
+        self.assertEqual(statistics['entries'], 1)
+
+    def test_ttl(self):
+        cache = use_response_cache(self.client, ResponseCache(ttl=60))
+        group = self.client.resource_groups.get('group')
+        self.assertIs(self.client.resource_groups.get('Group'), group)
+        self.assertEqual(len(self.requests), 1)
+        self.assertIsNot(self.client.resource_groups.get('group', response_cache=False), group)
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(cache.statistics()['hits'], 1)
+
+        cache.ttl = 0
+        self.client.resource_groups.get('group')
+        self.assertEqual(len(self.requests), 3)
+
+    def test_without_etag_or_ttl(self):
+        cache = use_response_cache(self.client)
+        self.client.resource_groups.get('group')
+        self.client.resource_groups.get('group')
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(cache.statistics()['entries'], 0)
+
+    def test_hosts_and_credentials_kept_apart(self):
+        cache = use_response_cache(self.client, ResponseCache(ttl=60))
+        other_host = ResourceManagementClient(
+            self.client._client.creds, SUBSCRIPTION_ID, base_url='https://management.example.com')
+        other_credentials = ResourceManagementClient(
+            BasicTokenAuthentication({'access_token': 'other'}), SUBSCRIPTION_ID)
+        for client in (other_host, other_credentials):
+            client._client.send = self.send
+            use_response_cache(client, cache)
+
+        group = self.client.resource_groups.get('group')
+        self.assertIsNot(other_host.resource_groups.get('group'), group)
+        self.assertIsNot(other_credentials.resource_groups.get('group'), group)
+        self.assertIs(self.client.resource_groups.get('group'), group)
+        self.assertEqual([url.split('/subscriptions')[0] for _, url, _ in self.requests],
+                         ['https://management.azure.com', 'https://management.example.com',
+                          'https://management.azure.com'])
+
+        # A write through another client invalidates the results of its host.
+        other_credentials.resource_groups.create_or_update('group', {'location': 'westus'})
+        self.assertIsNot(self.client.resource_groups.get('group'), group)
+        self.assertEqual(cache.statistics()['entries'], 2)
+
+    def test_long_running_operation_status_not_cached(self):
+        cache = use_response_cache(self.client, ResponseCache(ttl=60))
+        self.client.resource_groups.get('group')
+        started = requests.Response()
+        started.request = requests.Request('PUT', self.requests[0][1]).prepare()
+        started.status_code = 201
+        started.headers['content-type'] = 'application/json'
+        started._content = b'{"properties": {"provisioningState": "Creating"}}'
+
+        def get_long_running_status(status_link, headers=None):
+            return self.client._client.send(self.client._client.get(status_link))
+
+        poller = operation_poller(lambda: started, lambda response: response.json().get('name'),
+                                  get_long_running_status, 0, {})
+        self.assertEqual(poller.result(), 'group')
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(cache.statistics()['hits'], 0)
+
+    def test_read_during_write_not_cached(self):
+        send = self.send
+        reads = []
+
+        def send_with_concurrent_read(request, headers=None, content=None, **config):
+            if request.method == 'PUT' and not reads:
+                # Answered with the state before the write.
+                reads.append(self.client.resource_groups.get('group'))
+            return send(request, headers, content, **config)
+        self.client._client.send = send_with_concurrent_read
+        cache = use_response_cache(self.client, ResponseCache(ttl=60))
+
+        self.client.resource_groups.create_or_update('group', {'location': 'westus'})
+
+        self.assertEqual(reads[0].tags, {'version': '0'})
+        self.assertEqual(cache.statistics()['entries'], 0)
+        self.assertEqual(self.client.resource_groups.get('group').tags, {'version': '1'})
+
+    def test_lru_eviction(self):
+        cache = use_response_cache(self.client, ResponseCache(max_entries=2, ttl=60))
+        for name in ('a', 'b', 'a', 'c', 'a', 'b'):
+            self.client.resource_groups.get(name)
+        self.assertEqual([url.split('?')[0].rsplit('/', 1)[1] for _, url, _ in self.requests],
+                         ['a', 'b', 'c', 'b'])
+        statistics = cache.statistics()
+        self.assertEqual(statistics['evictions'], 2)
+        self.assertEqual(statistics['entries'], 2)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import io
+import json
+import threading
+import time
+import unittest
+import uuid
+
+import requests
+from msrest.authentication import BasicTokenAuthentication
+from msrestazure.azure_exceptions import CloudError
+
+from azure.common.throttling import get_limiter, use_throttling_limiter
+from azure.mgmt.resource import ResourceManagementClient
+
+
+class MgmtThrottlingTest(unittest.TestCase):
+
+    def setUp(self):
+        # The limiters are shared by the process: one subscription per test.
+        self.subscription_id = str(uuid.uuid4())
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.most_in_flight = 0
+        self.requests = []
+        self.responses = []
+        self.responses_sent = []
+
+    def create_client(self, **kwargs):
+        client = ResourceManagementClient(
+            BasicTokenAuthentication({'access_token': 'token'}), self.subscription_id)
+        client._client.send = self.send
+        return use_throttling_limiter(client, **kwargs)
+
+    def send(self, request, headers=None, content=None, **config):
+        with self.lock:
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+            self.requests.append((time.time(), request.method))
+            status_code, response_headers = self.responses.pop(0) if self.responses else (200, {})
+        time.sleep(0.01)
+        response = requests.Response()
+        response.raw = io.BytesIO()
+        self.responses_sent.append(response)
+        response.request = request
+        response.status_code = status_code
+        response.headers['content-type'] = 'application/json; charset=utf-8'
+        response.headers.update(response_headers)
+        response._content = json.dumps({'name': 'group', 'location': 'westus'}).encode('utf-8')
+        with self.lock:
+            self.in_flight -= 1
+        return response
+
+    def run_threads(self, function, count):
+        threads = [threading.Thread(target=function) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_shared_concurrency(self):
+        limiter = get_limiter(self.subscription_id, max_concurrency=2)
+        clients = [self.create_client(), self.create_client()]
+        self.run_threads(lambda: [client.resource_groups.get('group') for client in clients], 4)
+        self.assertEqual(len(self.requests), 8)
+        self.assertEqual(self.most_in_flight, 2)
+        metrics = limiter.metrics()
+        self.assertEqual(metrics['reads']['requests'], 8)
+        self.assertEqual(metrics['reads']['in_flight'], 0)
+        self.assertEqual(metrics['reads']['queued'], 0)
+        self.assertEqual(metrics['writes']['requests'], 0)
+
+    def test_retry_after(self):
+        limiter = get_limiter(self.subscription_id, max_concurrency=4)
+        client = self.create_client()
+        self.responses = [(429, {'Retry-After': '0.2'})]
+        start = time.time()
+        group = client.resource_groups.create_or_update('group', {'location': 'westus'})
+        self.assertEqual(group.name, 'group')
+        self.assertEqual(len(self.requests), 2)
+        self.assertGreaterEqual(self.requests[1][0] - start, 0.2)
+        self.assertTrue(self.responses_sent[0].raw.closed)
+        metrics = limiter.metrics()['writes']
+        self.assertEqual((metrics['requests'], metrics['throttled'], metrics['permitted']), (2, 1, 2))
+        self.assertEqual(limiter.metrics()['reads']['throttled'], 0)
+
+        # The permitted requests in flight grow back with the successes.
+        for _ in range(5):
+            client.resource_groups.create_or_update('group', {'location': 'westus'})
+        self.assertEqual(limiter.metrics()['writes']['permitted'], 4)
+
+    def test_retries_exhausted(self):
+        get_limiter(self.subscription_id, max_retries=1, default_retry_after=0)
+        client = self.create_client()
+        self.responses = [(429, {}), (429, {})]
+        with self.assertRaises(CloudError):
+            client.resource_groups.check_existence('group')
+        self.assertEqual(len(self.requests), 2)
+
+    def test_remaining_budget(self):
+        limiter = get_limiter(self.subscription_id, reserve_reads=100, window=5)
+        client = self.create_client()
+        self.responses = [(200, {'x-ms-ratelimit-remaining-subscription-reads': '50'})] * 3
+        for _ in range(3):
+            client.resource_groups.get('group')
+        metrics = limiter.metrics()['reads']
+        self.assertEqual((metrics['remaining'], metrics['permitted'], metrics['interval']), (50, 1, 0.1))
+        # Spread over the window once under the reserve.
+        self.assertGreaterEqual(self.requests[2][0] - self.requests[1][0], 0.1)
+        self.assertIsNone(limiter.metrics()['writes']['remaining'])
+
+    def test_deletes(self):
+        limiter = get_limiter(self.subscription_id)
+        client = self.create_client()
+        self.responses = [(200, {'x-ms-ratelimit-remaining-subscription-deletes': '14999'})]
+        service_client = client._client
+        service_client.send(service_client.delete(
+            '/subscriptions/{}/resourcegroups/group'.format(self.subscription_id)))
+        metrics = limiter.metrics()
+        self.assertEqual((metrics['deletes']['requests'], metrics['deletes']['remaining']), (1, 14999))
+        self.assertEqual(metrics['writes']['requests'], 0)
+
+    def test_limiter_parameters(self):
+        client = self.create_client(max_concurrency=1)
+        self.run_threads(lambda: client.resource_groups.get('group'), 4)
+        self.assertEqual(self.most_in_flight, 1)
+        self.assertEqual(get_limiter(self.subscription_id).metrics()['reads']['requests'], 4)
+
+    def test_conflicting_parameters(self):
+        get_limiter(self.subscription_id, max_concurrency=2)
+        self.assertIs(get_limiter(self.subscription_id, max_concurrency=2, window=3600),
+                      get_limiter(self.subscription_id))
+        with self.assertRaises(ValueError):
+            get_limiter(self.subscription_id, max_concurrency=4)
+        with self.assertRaises(ValueError):
+            self.create_client(max_concurrency=4)
+
+    def test_requests_outside_subscriptions(self):
+        client = self.create_client()
+        host = 'management{}.azure.com'.format(self.subscription_id)
+        client.config.base_url = 'https://' + host
+        # A tenant level request.
+        client._client.send(client._client.get('/providers'))
+        self.assertEqual(get_limiter(None, host=host).metrics()['reads']['requests'], 1)
+        self.assertEqual(get_limiter(None, host='other.' + host).metrics()['reads']['requests'], 0)
+
+
+#------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
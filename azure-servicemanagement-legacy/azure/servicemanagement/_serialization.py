@@ -15,7 +15,8 @@
 import json
 import sys
 from datetime import datetime
-from xml.dom import minidom
+from io import BytesIO
+from xml.dom import minidom, pulldom
 from ._common_models import (
     Feed,
     WindowsAzureData,
@@ -80,6 +81,51 @@ class _MinidomXmlToObject(object):
         return return_obj
 
 
+    @staticmethod
+    def iter_response(response, return_type):
+        '''
+        Parse the HTTPResponse's body incrementally and yield one object per
+        item of the list held by return_type. Each item's xml subtree is
+        released once it has been converted, so the full document is never
+        built in memory.
+        '''
+        list_member = _MinidomXmlToObject._get_list_member(return_type)
+        body = response.body
+        if not body:
+            return
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+
+        events = pulldom.parse(BytesIO(body))
+        depth = 0
+        for event, node in events:
+            if event == pulldom.START_ELEMENT:
+                depth += 1
+                if depth == 2 and node.localName == list_member.xml_element_name:
+                    events.expandNode(node)
+                    # text may arrive split across parser buffers
+                    node.normalize()
+                    depth -= 1
+                    local_obj = _MinidomXmlToObject._parse_response_body_from_xml_node(
+                        node, list_member.list_type)
+                    node.unlink()
+                    yield local_obj
+            elif event == pulldom.END_ELEMENT:
+                depth -= 1
+
+
+    @staticmethod
+    def _get_list_member(return_type):
+        '''
+        Returns the _list_of member of a list container type such as Disks.
+        '''
+        for value in vars(return_type()).values():
+            if isinstance(value, _list_of):
+                return value
+        raise TypeError(
+            '{0} does not contain a list of items'.format(return_type.__name__))
+
+
     @staticmethod
     def parse_service_resources_response(response, return_type):
         '''
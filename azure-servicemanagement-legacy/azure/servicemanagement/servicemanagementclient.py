@@ -369,6 +369,11 @@ class _ServiceManagementClient(object):
 
         return response
 
+    def _perform_get_iter(self, path, response_type, x_ms_version=None):
+        response = self.perform_get(path, x_ms_version)
+
+        return _MinidomXmlToObject.iter_response(response, response_type)
+
     def _perform_put(self, path, body, async=False, x_ms_version=None):
         response = self.perform_put(path, body, x_ms_version)
 
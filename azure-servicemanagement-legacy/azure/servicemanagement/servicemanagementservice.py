@@ -125,6 +125,15 @@ class ServiceManagementService(_ServiceManagementClient):
         return self._perform_get(self._get_storage_service_path(),
                                  StorageServices)
 
+    def iter_storage_accounts(self):
+        '''
+        Lists the storage accounts available under the current subscription,
+        returning an iterator which parses the response incrementally and
+        yields one StorageService at a time.
+        '''
+        return self._perform_get_iter(self._get_storage_service_path(),
+                                      StorageServices)
+
     def get_storage_account_properties(self, service_name):
         '''
         Returns system properties for the specified storage account.
@@ -2210,6 +2219,15 @@ class ServiceManagementService(_ServiceManagementClient):
         return self._perform_get(self._get_image_path(),
                                  Images)
 
+    def iter_os_images(self):
+        '''
+        Retrieves the OS images from the image repository, returning an
+        iterator which parses the response incrementally and yields one
+        OSImage at a time.
+        '''
+        return self._perform_get_iter(self._get_image_path(),
+                                      Images)
+
     def get_os_image(self, image_name):
         '''
         Retrieves an OS image from the image repository.
@@ -2537,6 +2555,14 @@ class ServiceManagementService(_ServiceManagementClient):
         return self._perform_get(self._get_disk_path(),
                                  Disks)
 
+    def iter_disks(self):
+        '''
+        Retrieves the disks in your image repository, returning an iterator
+        which parses the response incrementally and yields one Disk at a time.
+        '''
+        return self._perform_get_iter(self._get_disk_path(),
+                                      Disks)
+
     def get_disk(self, disk_name):
         '''
         Retrieves a disk from your image repository.
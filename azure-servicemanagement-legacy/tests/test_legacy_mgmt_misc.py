@@ -30,6 +30,7 @@ from azure.servicemanagement import (
     KeyPair,
     LinuxConfigurationSet,
     Listener,
+    OSImage,
     OSVirtualHardDisk,
     PublicKey,
     ResourceExtensionReference,
@@ -2167,6 +2168,27 @@ class LegacyMgmtMiscTest(LegacyMgmtTestCase):
         self.assertTrue(image_attributes['publisher_name'])
         self.assertTrue(image_attributes['small_icon_uri'])
 
+    @record
+    def test_iter_os_images_public(self):
+        # Arrange
+        expected = self.sms.list_os_images()
+
+        # Act
+        result = self.sms.iter_os_images()
+
+        # Assert
+        self.assertIsNotNone(result)
+        images = list(result)
+        self.assertEqual(len(images), len(expected))
+        for image, expected_image in zip(images, expected):
+            self.assertIsInstance(image, OSImage)
+            self.assertEqual(image.name, expected_image.name)
+            self.assertEqual(image.category, expected_image.category)
+            self.assertEqual(image.label, expected_image.label)
+            self.assertEqual(image.media_link, expected_image.media_link)
+            self.assertEqual(image.logical_size_in_gb,
+                             expected_image.logical_size_in_gb)
+
     @record
     def test_get_os_image(self):
         # Arrange
@@ -0,0 +1,62 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Microbenchmark for azure.batch SharedKeyAuth request signing.
+
+Signs a typical add-task-collection request repeatedly and reports the
+time per signature.
+
+    python benchmarks/batch_shared_key_auth.py [--number N] [--repeat R]
+"""
+import argparse
+import base64
+import timeit
+
+import requests
+
+from azure.batch.batch_auth import SharedKeyAuth
+
+
+ACCOUNT_NAME = 'benchmarkaccount'
+ACCOUNT_KEY = base64.b64encode(b'0123456789abcdef' * 4).decode('utf-8')
+REQUEST_URL = (
+    'https://benchmarkaccount.westus.batch.azure.com/jobs/job-1/addtaskcollection'
+    '?api-version=2017-05-01.5.0&timeout=30')
+
+
+def build_request():
+    request = requests.Request(
+        'POST',
+        REQUEST_URL,
+        headers={
+            'ocp-date': 'Mon, 15 May 2017 00:00:00 GMT',
+            'client-request-id': '7d2b0e4c-3f6c-4a9e-9d63-3b2fd0c5f8a1',
+            'return-client-request-id': 'false',
+            'Content-Type': 'application/json; odata=minimalmetadata; charset=utf-8'},
+        data='{"value": []}')
+    return request.prepare()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000,
+                        help='signatures per timing run')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of timing runs, the best is reported')
+    args = parser.parse_args()
+
+    auth = SharedKeyAuth('Authorization', ACCOUNT_NAME, ACCOUNT_KEY)
+    request = build_request()
+
+    best = min(timeit.repeat(lambda: auth(request), number=args.number, repeat=args.repeat))
+    per_call = best / args.number
+    print('SharedKeyAuth: {:.2f} us/request, {:,.0f} requests/s'.format(
+        per_call * 1e6, 1 / per_call))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Benchmark of the import time of every package in this repository.
+
+Each package is imported in a fresh interpreter. The first column is the
+time of the import statement alone; the second one adds the loading of
+every name in the `__all__` of the package, which is what code using the
+clients ends up paying. The import time of the shared dependencies
+(msrestazure and azure.common) is reported first for reference.
+
+Run it with every package of the repository on the path, for instance:
+
+    PYTHONPATH=$(ls -d azure*/ | tr '\\n' ':') python benchmarks/import_time.py [--repeat R]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMER = '''
+import time
+start = time.time()
+import {module}
+imported = time.time() - start
+for name in getattr({module}, '__all__', ()):
+    getattr({module}, name)
+print('{{}} {{}}'.format(imported, time.time() - start))
+'''
+
+
+def is_namespace(init_path):
+    with open(init_path, 'rb') as init:
+        content = init.read()
+    return b'declare_namespace' in content or b'extend_path' in content or \
+        not content.strip(b'\xef\xbb\xbf \r\n')
+
+
+def find_packages():
+    """Names of the top-level non namespace packages of each distribution."""
+    packages = []
+    for distribution in sorted(os.listdir(ROOT)):
+        folder = os.path.join(ROOT, distribution, 'azure')
+        if not distribution.startswith('azure-') or not os.path.isdir(folder):
+            continue
+        for current, folders, _ in os.walk(folder):
+            init_path = os.path.join(current, '__init__.py')
+            if current != folder and not os.path.isfile(init_path):
+                folders[:] = []
+                continue
+            if current == folder or is_namespace(init_path):
+                folders[:] = [name for name in sorted(folders) if name != 'tests']
+                continue
+            packages.append(os.path.relpath(current, os.path.join(ROOT, distribution))
+                            .replace(os.sep, '.'))
+            folders[:] = []
+    return sorted(set(packages))
+
+
+def measure(module, repeat):
+    runs = []
+    for _ in range(repeat):
+        with open(os.devnull, 'w') as devnull:
+            output = subprocess.check_output(
+                [sys.executable, '-c', TIMER.format(module=module)], stderr=devnull)
+        runs.append([float(value) for value in output.split()])
+    return [min(times) for times in zip(*runs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of imports of each package, the best is reported')
+    parser.add_argument('packages', nargs='*',
+                        help='packages to measure, all the packages by default')
+    args = parser.parse_args()
+
+    print('{:<40} {:>12} {:>14}'.format('package', 'import', 'with __all__'))
+    packages = args.packages or [name for name in find_packages() if name != 'azure.common']
+    for module in ['msrestazure', 'azure.common'] + packages:
+        try:
+            imported, loaded = measure(module, args.repeat)
+        except subprocess.CalledProcessError:
+            print('{:<40} {:>12}'.format(module, 'failed'))
+            continue
+        print('{:<40} {:>9.1f} ms {:>11.1f} ms'.format(module, imported * 1e3, loaded * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Benchmark of multi API management client construction and operation
+group access.
+
+For each multi API client, reports the time to construct a client, to
+access an operation group for the first time on a new client, and to access
+it again on the same client. The first construction of each API version,
+which imports its models, is done before timing.
+
+    python benchmarks/mgmt_client_construction.py [--number N] [--repeat R]
+"""
+import argparse
+import time
+
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.mgmt.compute import ComputeManagementClient
+from azure.mgmt.network import NetworkManagementClient
+from azure.mgmt.resource import ManagementLockClient, PolicyClient, ResourceManagementClient
+from azure.mgmt.storage import StorageManagementClient
+
+CREDENTIALS = BasicTokenAuthentication({'access_token': 'token'})
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+CLIENTS = [
+    (ComputeManagementClient, 'virtual_machines'),
+    (NetworkManagementClient, 'virtual_networks'),
+    (ResourceManagementClient, 'resource_groups'),
+    (PolicyClient, 'policy_assignments'),
+    (ManagementLockClient, 'management_locks'),
+    (StorageManagementClient, 'storage_accounts'),
+]
+
+
+def measure(client_class, group, number):
+    start = time.perf_counter()
+    clients = [client_class(CREDENTIALS, SUBSCRIPTION_ID) for _ in range(number)]
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for client in clients:
+        getattr(client, group)
+    first_access = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for client in clients:
+        getattr(client, group)
+    next_access = time.perf_counter() - start
+    return construct / number, first_access / number, next_access / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200,
+                        help='clients per timing run')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of timing runs, the best is reported')
+    args = parser.parse_args()
+
+    print('{:<26} {:>14} {:>14} {:>14}'.format(
+        'client', 'construct', 'first access', 'next access'))
+    for client_class, group in CLIENTS:
+        getattr(client_class(CREDENTIALS, SUBSCRIPTION_ID), group)
+        runs = [measure(client_class, group, args.number) for _ in range(args.repeat)]
+        construct, first_access, next_access = (min(times) for times in zip(*runs))
+        print('{:<26} {:>11.1f} us {:>11.2f} us {:>11.2f} us'.format(
+            client_class.__name__, construct * 1e6, first_access * 1e6, next_access * 1e6))
+
+
+if __name__ == '__main__':
+    main()
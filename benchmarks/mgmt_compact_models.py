@@ -0,0 +1,109 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Benchmark of the memory held by compact models against the generated ones.
+
+Serves the recorded response of ResourceManagementClient.providers.list,
+from azure-mgmt/tests/recordings, as `--copies` consecutive pages, lists
+it with and without use_compact_models, and reports the time and the
+memory held by the listed providers with their nested resource types.
+
+    python benchmarks/mgmt_compact_models.py [--copies N]
+"""
+import argparse
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+import requests
+import yaml
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.common.compact import use_compact_models
+from azure.mgmt.resource import ResourceManagementClient
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RECORDING = os.path.join(ROOT, 'azure-mgmt', 'tests', 'recordings',
+                         'test_mgmt_resource.test_providers.yaml')
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+PAGE_URL = 'https://management.azure.com/page/{}'
+
+
+def recorded_page():
+    with open(RECORDING) as recording:
+        interactions = yaml.safe_load(recording)['interactions']
+    for interaction in interactions:
+        request = interaction['request']
+        if request['method'] == 'GET' and request['uri'].split('?')[0].endswith('/providers'):
+            return json.loads(interaction['response']['body']['string'])
+    raise ValueError('No providers list in ' + RECORDING)
+
+
+def build_pages(copies):
+    page = recorded_page()
+    pages = []
+    for index in range(copies):
+        page['nextLink'] = PAGE_URL.format(index + 1) if index + 1 < copies else None
+        pages.append(json.dumps(page).encode('utf-8'))
+    return pages
+
+
+def build_client(pages, compact):
+    client = ResourceManagementClient(
+        BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID)
+
+    def send(request, headers=None, content=None, **config):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['content-type'] = 'application/json'
+        index = int(request.url.rsplit('/', 1)[1]) if request.url.startswith(PAGE_URL.format('')) else 0
+        response._content = pages[index]
+        return response
+    client._client.send = send
+    return use_compact_models(client) if compact else client
+
+
+def count_models(providers):
+    return sum(1 + len(provider.resource_types or ()) for provider in providers)
+
+
+def measure(client):
+    # Run once to compile the deserialization functions, then timed without
+    # tracing, then again to measure the memory held by the listed items.
+    list(client.providers.list())
+    gc.collect()
+    start = time.perf_counter()
+    providers = list(client.providers.list())
+    elapsed = time.perf_counter() - start
+    models = count_models(providers)
+    del providers
+    gc.collect()
+    tracemalloc.start()
+    providers = list(client.providers.list())
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(providers), models, elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--copies', type=int, default=50,
+                        help='number of pages, each a copy of the recorded response')
+    args = parser.parse_args()
+
+    pages = build_pages(args.copies)
+    for name, compact in [('generated models', False), ('compact models', True)]:
+        providers, models, elapsed, size = measure(build_client(pages, compact))
+        print('{:<18} {:>7,} providers, {:>8,} models in {:5.2f} s, {:7.1f} MiB, {:5.0f} B/model'.format(
+            name, providers, models, elapsed, size / 1024.0 / 1024.0, size / float(models)))
+
+
+if __name__ == '__main__':
+    main()
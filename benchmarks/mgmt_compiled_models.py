@@ -0,0 +1,126 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Benchmark of the compiled Serializer and Deserializer against msrest.
+
+Serves large list responses recorded in azure-mgmt/tests/recordings, each
+as `--copies` consecutive pages, and reports the items per second of the
+list operations deserializing them, and of serializing the listed models
+back as request bodies, with the default compiled implementation and with
+the msrest one:
+
+- ResourceManagementClient.providers.list,
+- NetworkManagementClient.network_security_groups.list_all,
+- ComputeManagementClient.virtual_machine_images.list_publishers.
+
+    python benchmarks/mgmt_compiled_models.py [--copies N] [--repeat R]
+"""
+import argparse
+import json
+import os
+import time
+
+import msrest
+import requests
+import yaml
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.mgmt.compute import ComputeManagementClient
+from azure.mgmt.network import NetworkManagementClient
+from azure.mgmt.resource import ResourceManagementClient
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RECORDINGS = os.path.join(ROOT, 'azure-mgmt', 'tests', 'recordings')
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+PAGE_URL = 'https://management.azure.com/page/{}'
+
+CASES = [
+    ('providers.list', 'test_mgmt_resource.test_providers', '/providers',
+     ResourceManagementClient, 'providers', lambda group: group.list(), 'Provider'),
+    ('network_security_groups.list_all', 'test_mgmt_network.test_network_security_groups',
+     '/Microsoft.Network/networkSecurityGroups',
+     NetworkManagementClient, 'network_security_groups', lambda group: group.list_all(),
+     'NetworkSecurityGroup'),
+    ('virtual_machine_images.list_publishers', 'test_mgmt_compute.test_vm_images', '/publishers',
+     ComputeManagementClient, 'virtual_machine_images', lambda group: group.list_publishers('westus'),
+     'VirtualMachineImageResource'),
+]
+
+
+def recorded_body(recording, path):
+    with open(os.path.join(RECORDINGS, recording + '.yaml')) as stream:
+        interactions = yaml.safe_load(stream)['interactions']
+    for interaction in interactions:
+        request = interaction['request']
+        if request['method'] == 'GET' and request['uri'].split('?')[0].endswith(path):
+            return json.loads(interaction['response']['body']['string'])
+    raise ValueError('No GET {} in {}'.format(path, recording))
+
+
+def build_pages(body, copies):
+    if isinstance(body, list):
+        return [json.dumps(body * copies).encode('utf-8')]
+    pages = []
+    for index in range(copies):
+        body['nextLink'] = PAGE_URL.format(index + 1) if index + 1 < copies else None
+        pages.append(json.dumps(body).encode('utf-8'))
+    return pages
+
+
+def build_group(client_class, group_name, pages, compiled):
+    client = client_class(BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID)
+
+    def send(request, headers=None, content=None, **config):
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response.headers['content-type'] = 'application/json; charset=utf-8'
+        index = int(request.url.rsplit('/', 1)[1]) if request.url.startswith(PAGE_URL.format('')) else 0
+        response._content = pages[index]
+        return response
+    client._client.send = send
+    group = getattr(client, group_name)
+    if not compiled:
+        # A plain dictionary: the Paged results use their own Deserializer.
+        dependencies = dict(group._deserialize.dependencies)
+        group._serialize = msrest.Serializer(dependencies)
+        group._deserialize = msrest.Deserializer(dependencies)
+    return group
+
+
+def best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--copies', type=int, default=20,
+                        help='number of copies of each recorded response')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of timing runs, the best is reported')
+    args = parser.parse_args()
+
+    for name, recording, path, client_class, group_name, operation, model in CASES:
+        pages = build_pages(recorded_body(recording, path), args.copies)
+        print(name)
+        for implementation, compiled in [('msrest', False), ('compiled', True)]:
+            group = build_group(client_class, group_name, pages, compiled)
+            items = list(operation(group))
+            deserialize = best(lambda: list(operation(group)), args.repeat)
+            serialize = best(lambda: [group._serialize.body(item, model, keep_readonly=True)
+                                      for item in items], args.repeat)
+            print('  {:<9} {:>7,} items, deserialize {:>9,.0f} items/s, serialize {:>9,.0f} items/s'.format(
+                implementation, len(items), len(items) / deserialize, len(items) / serialize))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Benchmark of list operations returning raw items against the models.
+
+Pages through synthetic network interfaces served from memory with
+NetworkInterfacesOperations.list_all, and reports the items per second of:
+
+- the Paged models,
+- the Paged models serialized back to dictionaries, as export jobs do,
+- the raw items (paging_raw_items=True),
+- the raw items written to NDJSON with write_ndjson.
+
+    python benchmarks/mgmt_paged_raw_items.py [--items N] [--repeat R]
+"""
+import argparse
+import json
+import os
+import time
+
+import requests
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.common.paging import write_ndjson
+from azure.mgmt.network import NetworkManagementClient
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+PAGE_URL = 'https://management.azure.com/page/{}'
+PAGE_SIZE = 1000
+
+
+def network_interface(index):
+    group_id = '/subscriptions/{}/resourceGroups/group-{}'.format(SUBSCRIPTION_ID, index % 50)
+    nic_id = '{}/providers/Microsoft.Network/networkInterfaces/nic-{}'.format(group_id, index)
+    return {
+        'id': nic_id,
+        'name': 'nic-{}'.format(index),
+        'type': 'Microsoft.Network/networkInterfaces',
+        'location': 'westus',
+        'tags': {'environment': 'production', 'owner': 'team-{}'.format(index % 7)},
+        'etag': 'W/"{:08x}-0000-0000-0000-000000000000"'.format(index),
+        'properties': {
+            'provisioningState': 'Succeeded',
+            'resourceGuid': '{:08x}-1111-2222-3333-444444444444'.format(index),
+            'macAddress': '00-0D-3A-{:02X}-{:02X}-{:02X}'.format(
+                index >> 16 & 255, index >> 8 & 255, index & 255),
+            'primary': True,
+            'enableAcceleratedNetworking': False,
+            'enableIPForwarding': False,
+            'dnsSettings': {'dnsServers': [], 'appliedDnsServers': [],
+                            'internalDomainNameSuffix': 'example.internal.cloudapp.net'},
+            'virtualMachine': {'id': '{}/providers/Microsoft.Compute/virtualMachines/vm-{}'.format(
+                group_id, index)},
+            'networkSecurityGroup': {'id': '{}/providers/Microsoft.Network/networkSecurityGroups/nsg'.format(
+                group_id)},
+            'ipConfigurations': [{
+                'id': '{}/ipConfigurations/ipconfig1'.format(nic_id),
+                'name': 'ipconfig1',
+                'etag': 'W/"{:08x}-0000-0000-0000-000000000000"'.format(index),
+                'properties': {
+                    'provisioningState': 'Succeeded',
+                    'privateIPAddress': '10.{}.{}.{}'.format(index >> 16 & 255, index >> 8 & 255, index & 255),
+                    'privateIPAllocationMethod': 'Dynamic',
+                    'privateIPAddressVersion': 'IPv4',
+                    'primary': True,
+                    'subnet': {'id': '{}/providers/Microsoft.Network/virtualNetworks/vnet/subnets/default'.format(
+                        group_id)},
+                    'publicIPAddress': {'id': '{}/providers/Microsoft.Network/publicIPAddresses/ip-{}'.format(
+                        group_id, index)},
+                },
+            }],
+        },
+    }
+
+
+def build_pages(count):
+    pages = []
+    for start in range(0, count, PAGE_SIZE):
+        page = {'value': [network_interface(index)
+                          for index in range(start, min(start + PAGE_SIZE, count))]}
+        if start + PAGE_SIZE < count:
+            page['nextLink'] = PAGE_URL.format(len(pages) + 1)
+        pages.append(json.dumps(page).encode('utf-8'))
+    return pages
+
+
+def build_client(pages):
+    client = NetworkManagementClient(
+        BasicTokenAuthentication({'access_token': 'token'}), SUBSCRIPTION_ID)
+
+    def send(request, headers=None, content=None, **config):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['content-type'] = 'application/json'
+        index = int(request.url.rsplit('/', 1)[1]) if request.url.startswith(PAGE_URL.format('')) else 0
+        response._content = pages[index]
+        return response
+    client._client.send = send
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=20000,
+                        help='number of network interfaces listed')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of timing runs, the best is reported')
+    args = parser.parse_args()
+
+    client = build_client(build_pages(args.items))
+    operations = client.network_interfaces
+    serialize = client._serialize.body
+
+    def ndjson():
+        with open(os.devnull, 'w') as output:
+            return write_ndjson(operations.list_all(paging_raw_items=True), output)
+
+    runs = [
+        ('Paged models', lambda: sum(1 for _ in operations.list_all())),
+        ('Paged models to dict', lambda: sum(
+            1 for item in operations.list_all() if serialize(item, 'NetworkInterface'))),
+        ('raw items', lambda: sum(1 for _ in operations.list_all(paging_raw_items=True))),
+        ('raw items to NDJSON', ndjson),
+    ]
+    for name, iterate in runs:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            count = iterate()
+            times.append(time.perf_counter() - start)
+        elapsed = min(times)
+        print('{:<22} {:>8,} items in {:6.2f} s, {:>10,.0f} items/s'.format(
+            name, count, elapsed, count / elapsed))
+
+
+if __name__ == '__main__':
+    main()
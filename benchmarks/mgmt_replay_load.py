@@ -0,0 +1,99 @@
+# coding: utf-8
+
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+"""Load test of the clients against the recorded cassettes, without Azure.
+
+Serves azure-mgmt/tests/recordings with testutils.replay_server and runs,
+with testutils.load_driver, scenarios of the compute, keyvault, storage and
+batch clients, with and without a shared connection pool, reporting the
+runs per second, latencies and connections opened:
+
+- compute: virtual_machine_images.list_publishers,
+- keyvault: vaults.list_by_resource_group, a list of two pages,
+- storage: storage_accounts.create, a long running operation,
+- batch: pool.get.
+
+    python benchmarks/mgmt_replay_load.py [--iterations N] [--concurrency C] [--latency S]
+"""
+import argparse
+import os
+import sys
+
+from msrest.authentication import BasicTokenAuthentication
+
+from azure.batch import BatchServiceClient
+from azure.common.connection_pool import ConnectionPool, use_connection_pool
+from azure.mgmt.compute import ComputeManagementClient
+from azure.mgmt.keyvault import KeyVaultManagementClient
+from azure.mgmt.storage import StorageManagementClient
+from azure.mgmt.storage.models import Kind, Sku, StorageAccountCreateParameters
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'azure-common'))
+
+from testutils.load_driver import run_load  # pylint: disable=wrong-import-position
+from testutils.replay_server import ReplayServer  # pylint: disable=wrong-import-position
+
+RECORDINGS = os.path.join(ROOT, 'azure-mgmt', 'tests', 'recordings')
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+KEYVAULT_GROUP = 'test_mgmt_keyvault_test_vaults_operations68b91138'
+STORAGE_GROUP = 'test_mgmt_storage_test_storage_accounts43b8102a'
+STORAGE_ACCOUNT = 'pyarmstorage43b8102a'
+
+
+def create_storage_account(client):
+    return client.storage_accounts.create(STORAGE_GROUP, STORAGE_ACCOUNT, StorageAccountCreateParameters(
+        sku=Sku('Standard_LRS'), kind=Kind.storage, location='westus')).result()
+
+
+SCENARIOS = [
+    ('compute list_publishers', 'test_mgmt_compute.test_vm_images', ComputeManagementClient,
+     lambda client: client.virtual_machine_images.list_publishers('westus')),
+    ('keyvault list_by_resource_group (paged)', 'test_mgmt_keyvault.test_vaults_operations',
+     KeyVaultManagementClient, lambda client: list(client.vaults.list_by_resource_group(KEYVAULT_GROUP))),
+    ('storage create (long running)', 'test_mgmt_storage.test_storage_accounts', StorageManagementClient,
+     create_storage_account),
+    ('batch pool.get', 'test_batch.test_batch_pools', BatchServiceClient,
+     lambda client: client.pool.get('python_test_pool_1')),
+]
+
+
+def build_client(client_class, base_url, pooled):
+    credentials = BasicTokenAuthentication({'access_token': 'token'})
+    if client_class is BatchServiceClient:
+        client = client_class(credentials, base_url=base_url)
+    else:
+        client = client_class(credentials, SUBSCRIPTION_ID, base_url=base_url)
+        client.config.long_running_operation_timeout = 0
+    if pooled:
+        use_connection_pool(client, ConnectionPool())
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=500, help='runs of each scenario')
+    parser.add_argument('--concurrency', type=int, default=8, help='threads running each scenario')
+    parser.add_argument('--latency', type=float, default=0, help='seconds waited by the server per response')
+    args = parser.parse_args()
+
+    for name, recording, client_class, scenario in SCENARIOS:
+        cassette = os.path.join(RECORDINGS, recording + '.yaml')
+        for pooled in (False, True):
+            with ReplayServer([cassette], latency=args.latency) as server:
+                client = build_client(client_class, server.base_url, pooled)
+                result = run_load(lambda: scenario(client), args.iterations, args.concurrency)
+                statistics = server.statistics()
+            result.report(name + (' (pooled)' if pooled else ''))
+            print('    {:>6} requests, {:>6} connections, {} unmatched'.format(
+                statistics['requests'], statistics['connections'], statistics['unmatched']))
+            if result.errors:
+                print('    first error: {!r}'.format(result.errors[0]))
+
+
+if __name__ == '__main__':
+    main()